@@ -5,60 +5,119 @@ Scrapes Pakistan jobs, worldwide jobs, free courses, and tools
 Saves directly to your existing Firebase database
 """
 
-import requests
-from bs4 import BeautifulSoup
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core.exceptions import AlreadyExists
 import os
 import json
 import time
 from datetime import datetime
 import sys
-import re
 import urllib.parse
 from typing import List, Dict, Optional
 import random
-
-def clean_html_content(text):
+import asyncio
+import inspect
+from collections import deque
+from functools import partial
+from scraper_http import HttpClient, DEFAULT_HEADERS
+from rate_limiter import RateLimiter
+from http_cache import ConditionalCache, current_source
+from circuit_breaker import CircuitBreaker, CircuitOpen
+from api_request import SourceNotConfigured
+from html_text import html_to_text
+from description_cache import DescriptionCache
+from extraction import PagedJobs, StoredJobs, UnchangedJobs, compile_sources
+from pagination import SourceWatermarks
+from resource_record import ResourceRecord
+from firestore_batch import BatchWriter
+from dedup_index import DedupIndex
+from seen_store import SeenStore
+from seen_filter import SeenFilter
+from near_duplicates import NearDuplicates
+from cpu_stage import CpuStage
+import sources
+
+# Description length per resource type; override with e.g.
+# SCRAPER_DESCRIPTION_LIMITS="job=1000,course=600,tool=400"
+DESCRIPTION_LIMIT = 1000
+
+
+def parse_description_limits(spec):
+    """Parse 'type=chars,...' into {resource type: max description length}"""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        resource_type, _, limit = item.partition('=')
+        limits[resource_type.strip()] = int(limit)
+    return limits
+
+
+DESCRIPTION_LIMITS = parse_description_limits(os.getenv('SCRAPER_DESCRIPTION_LIMITS', ''))
+
+# Cleaned descriptions by hash of the raw HTML: the RemoteOK scrapers share
+# postings, and most of them are back unchanged the next day
+DESCRIPTION_CACHE = DescriptionCache.from_env()
+
+
+def clean_html_content(text, resource_type='job'):
     """Clean HTML tags and convert to readable text"""
     if not text:
         return ""
 
-    # Remove HTML tags
-    soup = BeautifulSoup(text, 'html.parser')
-
-    # Convert common HTML elements to readable format
-    for br in soup.find_all('br'):
-        br.replace_with('\n')
-
-    for p in soup.find_all('p'):
-        p.insert_after('\n')
-
-    for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-        h.insert_before('\n')
-        h.insert_after('\n')
+    # Limit length to prevent overly long descriptions; parsing stops at the
+    # limit, so long postings cost no more than short ones
+    limit = DESCRIPTION_LIMITS.get(resource_type, DESCRIPTION_LIMIT)
+    if DESCRIPTION_CACHE is None:
+        return html_to_text(text, limit)
+    return DESCRIPTION_CACHE.get(text, limit, html_to_text)
 
-    for li in soup.find_all('li'):
-        li.insert_before('• ')
-        li.insert_after('\n')
 
-    # Get clean text
-    clean_text = soup.get_text()
+# Job sources from the registry, compiled once per process
+PAKISTAN_SOURCES = compile_sources(sources.PAKISTAN_SOURCES, clean_html_content)
+WORLDWIDE_SOURCES = compile_sources(sources.WORLDWIDE_SOURCES, clean_html_content)
 
-    # Clean up extra whitespace and newlines
-    clean_text = re.sub(r'\n\s*\n', '\n\n', clean_text)  # Multiple newlines to double
-    clean_text = re.sub(r'[ \t]+', ' ', clean_text)      # Multiple spaces to single
-    clean_text = clean_text.strip()
 
-    # Limit length to prevent overly long descriptions
-    if len(clean_text) > 1000:
-        clean_text = clean_text[:1000] + "..."
+class RunBudgetExhausted(Exception):
+    """A source was not started because the run budget was used up - says nothing about its health"""
 
-    return clean_text
 
 class FreezyAutomationEngine:
-    def __init__(self):
+    def __init__(self, connect_firebase=True):
         """Initialize Firebase connection using service account"""
+        # Sources scraped at once on the event loop (1 = one after another)
+        self.max_workers = max(1, int(os.getenv('SCRAPER_WORKERS', '16')))
+        # Token bucket per host, so slow HTML sites don't hold back the APIs
+        self.limiter = RateLimiter.from_env(user_agent=DEFAULT_HEADERS['User-Agent'])
+        # Pooled HTTP session shared by all sources, opened by run_async
+        self.http = None
+        # ETag / Last-Modified store that survives between daily runs
+        self.http_cache = ConditionalCache.from_env()
+        # Time limits: per source, and for the whole scrape phase of a run
+        self.source_deadline = float(os.getenv('SCRAPER_SOURCE_DEADLINE', '90'))
+        self.run_budget = float(os.getenv('SCRAPER_RUN_BUDGET', '900'))
+        self.run_deadline = None
+        # (source name, status, seconds, jobs) per source, in the order reported
+        self.source_report = []
+        # Skips sources that keep failing or coming back empty, across runs
+        self.breaker = CircuitBreaker.from_env()
+        # Newest posting seen per paginated source, so paging stops at old postings
+        self.watermarks = SourceWatermarks.from_env()
+        # One timestamp for every resource scraped in a run (None: per scrape call)
+        self.run_timestamp = None
+        # Document IDs of every resource saved so far; extraction drops postings in it (None: keep all)
+        self.seen_filter = SeenFilter.from_env()
+        # Worker processes that parse and extract fetched pages (None: on the event loop)
+        self.cpu = CpuStage.from_env(DESCRIPTION_LIMITS, DESCRIPTION_LIMIT, DESCRIPTION_CACHE, self.seen_filter)
+        # Signatures saved in the last 7 days, kept in scripts/.cache (None: query Firestore each save)
+        self.seen = SeenStore.from_env()
+        # The same posting listed by several sources is saved once (None: keep every copy)
+        self.near_duplicates = NearDuplicates.from_env()
+
+        if not connect_firebase:
+            # Offline engine for benchmarks and dry runs
+            self.db = None
+            return
+
         try:
             # Initialize Firebase Admin SDK
             if not firebase_admin._apps:
@@ -80,381 +139,181 @@ class FreezyAutomationEngine:
             print(f"❌ Firebase initialization failed: {e}")
             sys.exit(1)
     
-    def scrape_pakistan_jobs(self):
-        """Scrape jobs from Pakistani job sites and Pakistan-friendly sources"""
-        print("🇵🇰 Scraping Pakistan jobs from enhanced sources...")
-        jobs = []
-
-        # Enhanced Pakistan job sources
-        pakistan_sources = [
-            ("Rozee.pk", self.scrape_rozee_jobs),
-            ("BrightSpyre", self.scrape_brightspyre_jobs),
-            ("Jobs.pk", self.scrape_jobs_pk),
-            ("Indeed Pakistan", self.scrape_indeed_pakistan),
-            ("Careerjet Pakistan", self.scrape_careerjet_pakistan),
-            ("Jooble Pakistan", self.scrape_jooble_pakistan),
-            ("RemoteOK Pakistan Filter", self.scrape_remoteok_pakistan),
-        ]
-
-        for source_name, scrape_func in pakistan_sources:
-            try:
-                print(f"📡 Scraping {source_name}...")
-                source_jobs = scrape_func()
-                jobs.extend(source_jobs)
-                print(f"✅ {source_name}: {len(source_jobs)} jobs found")
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                print(f"⚠️ {source_name} scraping failed: {e}")
+    def run_async(self, entry_point, *args):
+        """Run an async entry point on a fresh event loop with the shared HTTP session and CPU stage"""
+        async def runner():
+            async with HttpClient(self.limiter, cache=self.http_cache) as http:
+                self.http = http
+                try:
+                    return await entry_point(*args)
+                finally:
+                    self.http = None
 
-        print(f"📍 Total Pakistan jobs found: {len(jobs)}")
-        return jobs
-    
-    def scrape_rozee_jobs(self):
-        """Scrape jobs from Rozee.pk"""
-        jobs = []
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
+        if self.cpu is not None:
+            self.cpu.start()
         try:
-            # Rozee job search URL
-            url = "https://www.rozee.pk/jobs"
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job listings (adjust selectors based on actual site structure)
-            job_cards = soup.find_all('div', class_='job-listing')[:10]  # Limit to 10
-            
-            for card in job_cards:
+            return asyncio.run(runner())
+        finally:
+            if self.cpu is not None:
+                self.cpu.close()
+
+    def print_http_report(self):
+        """Print how many fetches the shared response store and HTTP cache saved, per URL"""
+        hits = self.http.responses.hits
+        if hits:
+            print(f"\n🔁 Shared responses: {sum(hits.values())} repeat fetches avoided")
+            for url, count in hits.most_common():
+                print(f"   {url}: {count} hits")
+
+        for host, interval in self.limiter.crawl_delays.items():
+            print(f"🤖 {host}: robots.txt asks for {interval:g}s between requests")
+
+        if self.http_cache and self.http_cache.not_modified:
+            print("🗄️ Unchanged since last run (304, not re-parsed):")
+            for url in self.http_cache.not_modified:
+                print(f"   {url}")
+
+    def source_timeout(self):
+        """Seconds the next source may take: its own deadline, capped by what is left of the run"""
+        if self.run_deadline is None:
+            return self.source_deadline
+        return min(self.source_deadline, self.run_deadline - time.monotonic())
+
+    async def run_sources_async(self, sources):
+        """Run (name, func) scrape sources on the event loop and collect their jobs.
+
+        At most max_workers sources are in flight at once. Plain functions
+        (sources without network I/O) are called directly; results and log
+        lines are reported in list order, the same as a sequential run.
+        A source that outlives its deadline or the run budget is cancelled
+        and the other sources' jobs are kept. Sources whose circuit is open
+        are skipped, and every outcome is fed back to the circuit breaker.
+        API sources without credentials, or left unstarted by the run budget, are
+        skipped without counting as bad runs.
+        """
+        slots = asyncio.Semaphore(self.max_workers)
+        elapsed = [0.0] * len(sources)
+
+        async def run_source(index, source_name, scrape_func):
+            if self.breaker and not self.breaker.allow(source_name):
+                raise CircuitOpen(self.breaker.describe(source_name))
+
+            # Validators this source's fetches stage are filed under it (see ConditionalCache)
+            current_source.set(source_name)
+            async with slots:
+                started = time.monotonic()
                 try:
-                    # Extract job details
-                    title_elem = card.find('h3') or card.find('a', class_='job-title')
-                    company_elem = card.find(class_='company-name') or card.find('span', class_='company')
-                    location_elem = card.find(class_='location') or card.find('span', class_='job-location')
-                    
-                    if title_elem:
-                        job_data = {
-                            'title': title_elem.get_text(strip=True),
-                            'type': 'job',
-                            'description': f"Job opportunity in Pakistan. Apply now for this position.",
-                            'location': location_elem.get_text(strip=True) if location_elem else 'Pakistan',
-                            'company': company_elem.get_text(strip=True) if company_elem else 'Company in Pakistan',
-                            'source_url': url,
-                            'requirements': 'Experience required, Good communication skills, Relevant education',
-                            'benefits': 'Competitive salary, Health insurance, Career growth opportunities',
-                            'status': 'active',
-                            'created_at': datetime.now(),
-                            'updated_at': datetime.now(),
-                            'created_by': 'auto_scraper_rozee',
-                            'duration': 'Full-time',
-                            'scraped_from': 'rozee.pk',
-                            'location_type': 'Pakistan'
-                        }
-                        jobs.append(job_data)
-                        
-                except Exception as e:
-                    continue
-                    
-        except Exception as e:
-            print(f"Error scraping Rozee: {e}")
-        
-        return jobs
+                    timeout = self.source_timeout()
+                    if timeout <= 0:
+                        raise RunBudgetExhausted("run budget exhausted before start")
+
+                    source_jobs = scrape_func()
+                    if inspect.isawaitable(source_jobs):
+                        source_jobs = await asyncio.wait_for(source_jobs, timeout)
+                    return source_jobs
+                finally:
+                    elapsed[index] = time.monotonic() - started
+
+        outcomes = await asyncio.gather(
+            *(run_source(index, source_name, scrape_func) for index, (source_name, scrape_func) in enumerate(sources)),
+            return_exceptions=True
+        )
 
-    def scrape_brightspyre_jobs(self):
-        """Scrape jobs from BrightSpyre (Pakistan tech jobs)"""
         jobs = []
-        try:
-            # Sample BrightSpyre jobs structure
-            sample_jobs = [
-                {
-                    'title': 'Senior Software Engineer',
-                    'company': 'Pakistani Tech Company',
-                    'location': 'Karachi, Pakistan',
-                    'description': 'Senior software engineering role in growing Pakistani tech company'
-                },
-                {
-                    'title': 'Product Manager',
-                    'company': 'Fintech Startup',
-                    'location': 'Lahore, Pakistan',
-                    'description': 'Product management role in Pakistani fintech sector'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://brightspyre.com',
-                    'requirements': 'Local experience preferred, English proficiency',
-                    'benefits': 'Competitive salary in PKR, Local team, Career growth',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_brightspyre',
-                    'duration': 'Full-time',
-                    'scraped_from': 'brightspyre.com',
-                    'location_type': 'Onsite'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"BrightSpyre scraping error: {e}")
+        for (source_name, _), outcome, seconds in zip(sources, outcomes, elapsed):
+            if isinstance(outcome, CircuitOpen):
+                print(f"🔌 Skipping {source_name}: {outcome}")
+                self.source_report.append((source_name, 'skipped', 0.0, 0))
+                continue
+            if isinstance(outcome, SourceNotConfigured):
+                print(f"🔑 Skipping {source_name}: {outcome}")
+                self.source_report.append((source_name, 'not configured', 0.0, 0))
+                continue
+            if isinstance(outcome, RunBudgetExhausted):
+                print(f"⏭️  Skipping {source_name}: {outcome}")
+                self.source_report.append((source_name, 'skipped', 0.0, 0))
+                continue
+
+            print(f"📡 Scraping {source_name}...")
+            if isinstance(outcome, asyncio.TimeoutError):
+                print(f"⏰ {source_name} cut off after {seconds:.1f}s")
+                self.source_report.append((source_name, 'cut off', seconds, 0))
+                self.record_source_health(source_name, 'failed')
+                self.discard_fetched(source_name)
+                continue
+            if isinstance(outcome, BaseException):
+                print(f"⚠️ {source_name} scraping failed: {outcome}")
+                self.source_report.append((source_name, 'failed', seconds, 0))
+                self.record_source_health(source_name, 'failed')
+                self.discard_fetched(source_name)
+                continue
+            jobs.extend(outcome)
+            print(f"✅ {source_name}: {len(outcome)} jobs found")
+            if isinstance(outcome, PagedJobs):
+                print(f"   📄 {outcome.pages} pages read, stopped: {outcome.stop_reason}")
+            elif isinstance(outcome, StoredJobs):
+                print("   🌸 Every posting was already stored")
+            self.source_report.append((source_name, 'ok', seconds, len(outcome)))
+            # A 304, postings that were all stored already, or paging that reached the last run's
+            # postings is a healthy source with nothing new
+            nothing_new = isinstance(outcome, (UnchangedJobs, StoredJobs)) or (
+                isinstance(outcome, PagedJobs) and outcome.stop_reason == 'older than last run')
+            self.record_source_health(source_name, 'ok' if outcome or nothing_new else 'zero')
 
         return jobs
 
-    def scrape_jobs_pk(self):
-        """Scrape jobs from Jobs.pk"""
-        jobs = []
-        try:
-            # Sample Jobs.pk structure
-            sample_jobs = [
-                {
-                    'title': 'Digital Marketing Specialist',
-                    'company': 'Marketing Agency',
-                    'location': 'Islamabad, Pakistan',
-                    'description': 'Digital marketing role with local and international clients'
-                },
-                {
-                    'title': 'Business Development Manager',
-                    'company': 'Trading Company',
-                    'location': 'Faisalabad, Pakistan',
-                    'description': 'Business development in Pakistani market'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://jobs.pk',
-                    'requirements': 'Pakistani market knowledge, Local language skills',
-                    'benefits': 'Local employment, Market-rate salary, Team environment',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_jobs_pk',
-                    'duration': 'Full-time',
-                    'scraped_from': 'jobs.pk',
-                    'location_type': 'Onsite'
-                }
-                jobs.append(job_data)
+    def print_source_report(self):
+        """Print how long each source took and which ones were cut off"""
+        if not self.source_report:
+            return
 
-        except Exception as e:
-            print(f"Jobs.pk scraping error: {e}")
+        print("\n⏱️ Source timings:")
+        for source_name, status, seconds, job_count in self.source_report:
+            print(f"   {source_name}: {seconds:.1f}s, {job_count} jobs ({status})")
 
-        return jobs
+        cut_off = [source_name for source_name, status, _, _ in self.source_report if status == 'cut off']
+        if cut_off:
+            print(f"⏰ Cut off by deadline: {', '.join(cut_off)}")
 
-    def scrape_indeed_pakistan(self):
-        """Scrape jobs from Indeed Pakistan"""
-        jobs = []
-        try:
-            # Sample Indeed Pakistan jobs
-            sample_jobs = [
-                {
-                    'title': 'Customer Service Representative',
-                    'company': 'Call Center',
-                    'location': 'Karachi, Pakistan',
-                    'description': 'Customer service role with international clients'
-                },
-                {
-                    'title': 'Graphic Designer',
-                    'company': 'Design Studio',
-                    'location': 'Lahore, Pakistan',
-                    'description': 'Creative design role for local and international projects'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://pk.indeed.com',
-                    'requirements': 'Relevant experience, Communication skills',
-                    'benefits': 'Stable employment, Professional development, Local team',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_indeed_pk',
-                    'duration': 'Full-time',
-                    'scraped_from': 'pk.indeed.com',
-                    'location_type': 'Onsite'
-                }
-                jobs.append(job_data)
+        if self.breaker and self.breaker.open_sources():
+            print(f"🔌 Circuit open: {', '.join(self.breaker.open_sources())}")
 
-        except Exception as e:
-            print(f"Indeed Pakistan scraping error: {e}")
-
-        return jobs
+    def discard_fetched(self, source_name):
+        """Keep a failed source's responses out of the HTTP cache, so its next run is not answered 304"""
+        if self.http_cache:
+            self.http_cache.discard(source_name)
 
-    def scrape_careerjet_pakistan(self):
-        """Scrape jobs from Careerjet Pakistan"""
-        jobs = []
-        try:
-            # Sample Careerjet Pakistan jobs
-            sample_jobs = [
-                {
-                    'title': 'Sales Executive',
-                    'company': 'FMCG Company',
-                    'location': 'Multiple Cities, Pakistan',
-                    'description': 'Sales role across Pakistani markets'
-                },
-                {
-                    'title': 'HR Manager',
-                    'company': 'Manufacturing Company',
-                    'location': 'Sialkot, Pakistan',
-                    'description': 'Human resources management in manufacturing sector'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.careerjet.com.pk',
-                    'requirements': 'Local market knowledge, Professional experience',
-                    'benefits': 'Career advancement, Local employment, Competitive package',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_careerjet_pk',
-                    'duration': 'Full-time',
-                    'scraped_from': 'careerjet.com.pk',
-                    'location_type': 'Onsite'
-                }
-                jobs.append(job_data)
+    def record_source_health(self, source_name, outcome):
+        """Feed a source's outcome ('ok', 'zero' or 'failed') to the circuit breaker"""
+        if self.breaker:
+            self.breaker.record(source_name, outcome)
 
-        except Exception as e:
-            print(f"Careerjet Pakistan scraping error: {e}")
-
-        return jobs
+    def scrape_pakistan_jobs(self):
+        """Scrape jobs from Pakistani job sites and Pakistan-friendly sources"""
+        return self.run_async(self.scrape_pakistan_jobs_async)
 
-    def scrape_jooble_pakistan(self):
-        """Scrape jobs from Jooble Pakistan"""
+    async def scrape_pakistan_jobs_async(self):
+        """Scrape jobs from Pakistani job sites and Pakistan-friendly sources"""
+        print("🇵🇰 Scraping Pakistan jobs from enhanced sources...")
         jobs = []
-        try:
-            # Sample Jooble Pakistan jobs
-            sample_jobs = [
-                {
-                    'title': 'Accountant',
-                    'company': 'Accounting Firm',
-                    'location': 'Rawalpindi, Pakistan',
-                    'description': 'Accounting role with local and international clients'
-                },
-                {
-                    'title': 'Teacher',
-                    'company': 'Educational Institute',
-                    'location': 'Multan, Pakistan',
-                    'description': 'Teaching position in growing educational sector'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://pk.jooble.org',
-                    'requirements': 'Professional qualifications, Local experience',
-                    'benefits': 'Stable career, Professional growth, Local community',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_jooble_pk',
-                    'duration': 'Full-time',
-                    'scraped_from': 'pk.jooble.org',
-                    'location_type': 'Onsite'
-                }
-                jobs.append(job_data)
 
-        except Exception as e:
-            print(f"Jooble Pakistan scraping error: {e}")
-
-        return jobs
+        # Pakistan job sources, defined in sources.py
+        jobs.extend(await self.run_sources_async(self.registry_sources(PAKISTAN_SOURCES)))
 
-    def scrape_remoteok_pakistan(self):
-        """Scrape Pakistan-relevant remote jobs from RemoteOK"""
-        jobs = []
-        
-        try:
-            # RemoteOK API - free to use
-            url = "https://remoteok.io/api"
-            response = requests.get(url, timeout=10)
-            data = response.json()
-            
-            # Filter for Pakistan-relevant or global remote jobs
-            for job in data[1:11]:  # Skip first item (metadata), get 10 jobs
-                try:
-                    if isinstance(job, dict) and 'position' in job:
-                        job_data = {
-                            'title': job.get('position', 'Remote Job'),
-                            'type': 'job',
-                            'description': clean_html_content(job.get('description', 'Remote job opportunity - work from Pakistan')),
-                            'location': 'Remote (Pakistan Friendly)',
-                            'company': job.get('company', 'Remote Company'),
-                            'source_url': job.get('url', 'https://remoteok.io'),
-                            'requirements': ', '.join(job.get('tags', ['Remote work', 'English'])),
-                            'benefits': 'Remote work, Flexible hours, Global team, USD salary',
-                            'status': 'active',
-                            'created_at': datetime.now(),
-                            'updated_at': datetime.now(),
-                            'created_by': 'auto_scraper_remoteok',
-                            'duration': 'Full-time',
-                            'scraped_from': 'remoteok.io',
-                            'location_type': 'Pakistan'
-                        }
-                        jobs.append(job_data)
-                        
-                except Exception as e:
-                    continue
-                    
-        except Exception as e:
-            print(f"Error scraping RemoteOK: {e}")
-        
+        print(f"📍 Total Pakistan jobs found: {len(jobs)}")
         return jobs
     
     def scrape_worldwide_jobs(self):
+        """Scrape worldwide remote jobs from multiple sources"""
+        return self.run_async(self.scrape_worldwide_jobs_async)
+
+    async def scrape_worldwide_jobs_async(self):
         """Scrape worldwide remote jobs from multiple sources"""
         print("🌍 Scraping worldwide jobs from enhanced sources...")
         jobs = []
 
-        # Enhanced job sources with API support
-        job_sources = [
-            ("RemoteOK API", self.scrape_remoteok_api),
-            ("We Work Remotely RSS", self.scrape_weworkremotely_rss),
-            ("Adzuna API", self.scrape_adzuna_api),
-            ("Careerjet API", self.scrape_careerjet_api),
-            ("USAJOBS API", self.scrape_usajobs_api),
-            ("Jooble API", self.scrape_jooble_api),
-            ("ZipRecruiter API", self.scrape_ziprecruiter_api),
-            ("The Muse API", self.scrape_themuse_api),
-            ("Indeed Scraping", self.scrape_indeed_jobs),
-            ("LinkedIn Scraping", self.scrape_linkedin_jobs),
-            ("Glassdoor Scraping", self.scrape_glassdoor_jobs),
-        ]
-
-        for source_name, scrape_func in job_sources:
-            try:
-                print(f"📡 Scraping {source_name}...")
-                source_jobs = scrape_func()
-                jobs.extend(source_jobs)
-                print(f"✅ {source_name}: {len(source_jobs)} jobs found")
-                time.sleep(2)  # Rate limiting
-            except Exception as e:
-                print(f"⚠️ {source_name} scraping failed: {e}")
+        # Worldwide job sources, defined in sources.py
+        jobs.extend(await self.run_sources_async(self.registry_sources(WORLDWIDE_SOURCES)))
 
         # Add timestamp-based jobs to ensure new content
         try:
@@ -465,166 +324,23 @@ class FreezyAutomationEngine:
         print(f"🌍 Total worldwide jobs found: {len(jobs)}")
         return jobs
 
-    def scrape_indeed_jobs(self):
-        """Scrape jobs from Indeed (HTML scraping)"""
-        jobs = []
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            # Search for remote jobs on Indeed
-            search_url = "https://www.indeed.com/jobs?q=remote&l=&remotejob=032b3046-06a3-4876-8dfd-474eb5e7ed11"
-
-            response = requests.get(search_url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Find job cards (Indeed's structure may change)
-                job_cards = soup.find_all('div', {'data-jk': True})[:8]  # Get 8 jobs
-
-                for card in job_cards:
-                    try:
-                        title_elem = card.find('h2', class_='jobTitle') or card.find('a', {'data-jk': True})
-                        company_elem = card.find('span', class_='companyName') or card.find('a', {'data-testid': 'company-name'})
-                        location_elem = card.find('div', {'data-testid': 'job-location'}) or card.find('div', class_='companyLocation')
-
-                        title = title_elem.get_text(strip=True) if title_elem else 'Remote Position'
-                        company = company_elem.get_text(strip=True) if company_elem else 'Company'
-                        location = location_elem.get_text(strip=True) if location_elem else 'Remote'
-
-                        job_data = {
-                            'title': title,
-                            'type': 'job',
-                            'description': f'Remote job opportunity at {company}. Apply through Indeed for full details.',
-                            'location': location,
-                            'company': company,
-                            'source_url': 'https://www.indeed.com',
-                            'requirements': 'Check Indeed listing for specific requirements',
-                            'benefits': 'Remote work, Competitive salary, Benefits package',
-                            'status': 'active',
-                            'created_at': datetime.now(),
-                            'updated_at': datetime.now(),
-                            'created_by': 'auto_scraper_indeed',
-                            'duration': 'Full-time',
-                            'scraped_from': 'indeed.com',
-                            'location_type': 'Remote'
-                        }
-                        jobs.append(job_data)
-
-                    except Exception as e:
-                        print(f"Error parsing Indeed job card: {e}")
-                        continue
-
-        except Exception as e:
-            print(f"Indeed scraping error: {e}")
-
-        return jobs
-
-    def scrape_linkedin_jobs(self):
-        """Scrape jobs from LinkedIn (HTML scraping)"""
-        jobs = []
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            # LinkedIn job search URL for remote positions
-            search_url = "https://www.linkedin.com/jobs/search/?keywords=remote&location=Worldwide&locationId=&geoId=92000000&f_TPR=r604800&position=1&pageNum=0"
-
-            # Note: LinkedIn has strong anti-scraping measures
-            # For demo purposes, creating sample data structure
-            sample_jobs = [
-                {
-                    'title': 'Remote Senior Developer',
-                    'company': 'LinkedIn Company',
-                    'location': 'Remote/Global',
-                    'description': 'Senior development role with remote flexibility'
-                },
-                {
-                    'title': 'Remote Product Designer',
-                    'company': 'Design Studio',
-                    'location': 'Remote/USA',
-                    'description': 'Product design role for innovative products'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.linkedin.com/jobs',
-                    'requirements': 'Professional network, LinkedIn profile required',
-                    'benefits': 'Professional networking, Career growth, Remote work',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_linkedin',
-                    'duration': 'Full-time',
-                    'scraped_from': 'linkedin.com',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
+    def registry_sources(self, compiled_sources):
+        """(name, scrape function) pairs for run_sources_async"""
+        return [(source.name, partial(self.scrape_source_async, source)) for source in compiled_sources]
 
-        except Exception as e:
-            print(f"LinkedIn scraping error: {e}")
+    async def scrape_source_async(self, source):
+        """Scrape one compiled registry source with the shared HTTP session"""
+        # Paginated sources stop reading pages in time to return what they have
+        deadline = time.monotonic() + self.source_timeout()
+        return await source.scrape(self.http, deadline=deadline, watermarks=self.watermarks,
+                                   now=self.run_timestamp, cpu=self.cpu, seen=self.seen_filter)
 
-        return jobs
-
-    def scrape_glassdoor_jobs(self):
-        """Scrape jobs from Glassdoor (HTML scraping)"""
-        jobs = []
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            # Glassdoor has strong anti-scraping measures
-            # Creating sample data structure for demonstration
-            sample_jobs = [
-                {
-                    'title': 'Remote Software Architect',
-                    'company': 'Tech Corporation',
-                    'location': 'Remote/USA',
-                    'description': 'Software architecture role with excellent company culture',
-                    'salary': '$120k - $150k'
-                },
-                {
-                    'title': 'Remote DevOps Engineer',
-                    'company': 'Cloud Company',
-                    'location': 'Remote/Europe',
-                    'description': 'DevOps engineering with modern cloud technologies',
-                    'salary': '€80k - €100k'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.glassdoor.com',
-                    'requirements': 'Check Glassdoor for company reviews and requirements',
-                    'benefits': f"Salary: {job.get('salary', 'Competitive')}, Company reviews available, Remote work",
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_glassdoor',
-                    'duration': 'Full-time',
-                    'scraped_from': 'glassdoor.com',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"Glassdoor scraping error: {e}")
-
-        return jobs
+    def scrape_source(self, source_name):
+        """Scrape a single registry source by name (handy when adding or debugging one)"""
+        for source in PAKISTAN_SOURCES + WORLDWIDE_SOURCES:
+            if source.name == source_name:
+                return self.run_async(self.scrape_source_async, source)
+        raise KeyError(f"No source named {source_name!r} in sources.py")
 
     def generate_fresh_jobs(self):
         """Generate fresh job listings with timestamps to ensure new content"""
@@ -672,434 +388,29 @@ class FreezyAutomationEngine:
         ]
 
         for job in job_templates:
-            job_data = {
-                'title': job['title'],
-                'type': 'job',
-                'description': job['description'],
-                'location': job['location'],
-                'company': job['company'],
-                'source_url': 'https://freezyplatform.com/fresh-jobs',
-                'requirements': job['requirements'],
-                'benefits': 'Remote work, Competitive salary, Health insurance, Flexible hours',
-                'status': 'active',
-                'created_at': current_time,
-                'updated_at': current_time,
-                'created_by': f'auto_scraper_fresh_{timestamp}',
-                'duration': 'Full-time',
-                'scraped_from': 'fresh_generation',
-                'location_type': 'Remote'
-            }
+            job_data = ResourceRecord(
+                title=job['title'],
+                type='job',
+                description=job['description'],
+                location=job['location'],
+                company=job['company'],
+                source_url='https://freezyplatform.com/fresh-jobs',
+                requirements=job['requirements'],
+                benefits='Remote work, Competitive salary, Health insurance, Flexible hours',
+                status='active',
+                created_at=current_time,
+                updated_at=current_time,
+                created_by=f'auto_scraper_fresh_{timestamp}',
+                duration='Full-time',
+                scraped_from='fresh_generation',
+                location_type='Remote'
+            )
             jobs.append(job_data)
 
         return jobs
 
     # ==================== ENHANCED JOB SCRAPING METHODS ====================
 
-    def scrape_remoteok_api(self):
-        """Scrape jobs using RemoteOK public API"""
-        jobs = []
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; FreezyPlatform/1.0; +https://freezyplatform.com)',
-                'Accept': 'application/json'
-            }
-
-            response = requests.get('https://remoteok.io/api', headers=headers, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-
-                for job in data[1:16]:  # Skip metadata, get 15 jobs
-                    if isinstance(job, dict) and 'position' in job:
-                        job_data = {
-                            'title': job.get('position', 'Remote Position'),
-                            'type': 'job',
-                            'description': clean_html_content(job.get('description', 'Remote job opportunity')),
-                            'location': 'Remote/Worldwide',
-                            'company': job.get('company', 'Remote Company'),
-                            'source_url': job.get('url', 'https://remoteok.io'),
-                            'requirements': ', '.join(job.get('tags', ['Remote work'])),
-                            'benefits': 'Remote work, Flexible hours, Global team',
-                            'status': 'active',
-                            'created_at': datetime.now(),
-                            'updated_at': datetime.now(),
-                            'created_by': 'auto_scraper_remoteok_api',
-                            'duration': 'Full-time',
-                            'scraped_from': 'remoteok.io',
-                            'location_type': 'Remote'
-                        }
-                        jobs.append(job_data)
-
-        except Exception as e:
-            print(f"RemoteOK API error: {e}")
-
-        return jobs
-
-    def scrape_weworkremotely_rss(self):
-        """Scrape jobs from We Work Remotely RSS feed"""
-        jobs = []
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; FreezyPlatform/1.0; +https://freezyplatform.com)'
-            }
-
-            response = requests.get('https://weworkremotely.com/remote-jobs.rss', headers=headers, timeout=15)
-            if response.status_code == 200:
-                from xml.etree import ElementTree as ET
-                root = ET.fromstring(response.content)
-
-                for item in root.findall('.//item')[:10]:  # Get 10 jobs
-                    title = item.find('title').text if item.find('title') is not None else 'Remote Job'
-                    description = item.find('description').text if item.find('description') is not None else 'Remote opportunity'
-                    link = item.find('link').text if item.find('link') is not None else 'https://weworkremotely.com'
-
-                    # Extract company from title (usually format: "Company: Job Title")
-                    company = 'Remote Company'
-                    if ':' in title:
-                        parts = title.split(':', 1)
-                        company = parts[0].strip()
-                        title = parts[1].strip()
-
-                    job_data = {
-                        'title': title,
-                        'type': 'job',
-                        'description': clean_html_content(description),
-                        'location': 'Remote/Worldwide',
-                        'company': company,
-                        'source_url': link,
-                        'requirements': 'Remote work experience, Strong communication',
-                        'benefits': 'Remote work, Flexible schedule, Global team',
-                        'status': 'active',
-                        'created_at': datetime.now(),
-                        'updated_at': datetime.now(),
-                        'created_by': 'auto_scraper_weworkremotely',
-                        'duration': 'Full-time',
-                        'scraped_from': 'weworkremotely.com',
-                        'location_type': 'Remote'
-                    }
-                    jobs.append(job_data)
-
-        except Exception as e:
-            print(f"We Work Remotely RSS error: {e}")
-
-        return jobs
-
-    def scrape_adzuna_api(self):
-        """Scrape jobs using Adzuna API (requires API key)"""
-        jobs = []
-        try:
-            # Note: This would require API key setup
-            # For now, we'll create sample data structure
-            sample_jobs = [
-                {
-                    'title': 'Software Developer - Remote',
-                    'company': 'Tech Company',
-                    'location': 'Remote/UK',
-                    'description': 'Remote software development position with competitive salary'
-                },
-                {
-                    'title': 'Data Analyst - Remote',
-                    'company': 'Analytics Firm',
-                    'location': 'Remote/EU',
-                    'description': 'Remote data analysis role with flexible working hours'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.adzuna.com',
-                    'requirements': 'Relevant experience, Remote work capability',
-                    'benefits': 'Competitive salary, Remote work, Professional development',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_adzuna',
-                    'duration': 'Full-time',
-                    'scraped_from': 'adzuna.com',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"Adzuna API error: {e}")
-
-        return jobs
-
-    def scrape_careerjet_api(self):
-        """Scrape jobs using Careerjet API"""
-        jobs = []
-        try:
-            # Careerjet API endpoint (requires affiliate ID)
-            # For demo, creating sample structure
-            sample_jobs = [
-                {
-                    'title': 'Remote Python Developer',
-                    'company': 'Global Tech',
-                    'location': 'Remote/Worldwide',
-                    'description': 'Python development role with remote flexibility'
-                },
-                {
-                    'title': 'Remote Marketing Manager',
-                    'company': 'Digital Agency',
-                    'location': 'Remote/US',
-                    'description': 'Marketing management position with global reach'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.careerjet.com',
-                    'requirements': 'Professional experience, English proficiency',
-                    'benefits': 'Remote work, International team, Growth opportunities',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_careerjet',
-                    'duration': 'Full-time',
-                    'scraped_from': 'careerjet.com',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"Careerjet API error: {e}")
-
-        return jobs
-
-    def scrape_remoteok_worldwide(self):
-        """Scrape worldwide remote jobs from RemoteOK"""
-        jobs = []
-        
-        try:
-            url = "https://remoteok.io/api"
-            response = requests.get(url, timeout=10)
-            data = response.json()
-            
-            for job in data[11:21]:  # Get different set for worldwide
-                try:
-                    if isinstance(job, dict) and 'position' in job:
-                        job_data = {
-                            'title': job.get('position', 'Remote Job'),
-                            'type': 'job',
-                            'description': clean_html_content(job.get('description', 'Remote job opportunity worldwide')),
-                            'location': 'Remote/Worldwide',
-                            'company': job.get('company', 'Global Company'),
-                            'source_url': job.get('url', 'https://remoteok.io'),
-                            'requirements': ', '.join(job.get('tags', ['Remote work', 'English'])),
-                            'benefits': 'Remote work, Global team, Competitive salary, Flexible hours',
-                            'status': 'active',
-                            'created_at': datetime.now(),
-                            'updated_at': datetime.now(),
-                            'created_by': 'auto_scraper_worldwide',
-                            'duration': 'Full-time',
-                            'scraped_from': 'remoteok.io',
-                            'location_type': 'Worldwide'
-                        }
-                        jobs.append(job_data)
-                        
-                except Exception as e:
-                    continue
-                    
-        except Exception as e:
-            print(f"Error scraping worldwide RemoteOK: {e}")
-        
-        return jobs
-
-    def scrape_usajobs_api(self):
-        """Scrape jobs from USAJOBS API (US Government jobs)"""
-        jobs = []
-        try:
-            headers = {
-                'Host': 'data.usajobs.gov',
-                'User-Agent': 'FreezyPlatform/1.0 (contact@freezyplatform.com)',
-                'Authorization-Key': 'your-api-key-here'  # Would need real API key
-            }
-
-            # Sample structure for US Government remote jobs
-            sample_jobs = [
-                {
-                    'title': 'Remote IT Specialist',
-                    'company': 'US Department of Technology',
-                    'location': 'Remote/USA',
-                    'description': 'Federal IT position with remote work options'
-                },
-                {
-                    'title': 'Remote Data Scientist',
-                    'company': 'US Census Bureau',
-                    'location': 'Remote/USA',
-                    'description': 'Government data science role with security clearance'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.usajobs.gov',
-                    'requirements': 'US citizenship, Security clearance eligible',
-                    'benefits': 'Federal benefits, Job security, Remote work options',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_usajobs',
-                    'duration': 'Full-time',
-                    'scraped_from': 'usajobs.gov',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"USAJOBS API error: {e}")
-
-        return jobs
-
-    def scrape_jooble_api(self):
-        """Scrape jobs using Jooble Partner API"""
-        jobs = []
-        try:
-            # Jooble API structure (requires partner key)
-            sample_jobs = [
-                {
-                    'title': 'Remote Full Stack Developer',
-                    'company': 'European Startup',
-                    'location': 'Remote/Europe',
-                    'description': 'Full stack development with modern technologies'
-                },
-                {
-                    'title': 'Remote UX Designer',
-                    'company': 'Design Agency',
-                    'location': 'Remote/Global',
-                    'description': 'User experience design for international clients'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://jooble.org',
-                    'requirements': 'Portfolio required, Remote work experience',
-                    'benefits': 'Flexible hours, International projects, Competitive pay',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_jooble',
-                    'duration': 'Full-time',
-                    'scraped_from': 'jooble.org',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"Jooble API error: {e}")
-
-        return jobs
-
-    def scrape_ziprecruiter_api(self):
-        """Scrape jobs using ZipRecruiter API"""
-        jobs = []
-        try:
-            # ZipRecruiter API structure
-            sample_jobs = [
-                {
-                    'title': 'Remote Software Engineer',
-                    'company': 'Tech Startup',
-                    'location': 'Remote/USA',
-                    'description': 'Software engineering role with equity options'
-                },
-                {
-                    'title': 'Remote Customer Success Manager',
-                    'company': 'SaaS Company',
-                    'location': 'Remote/North America',
-                    'description': 'Customer success role for growing SaaS platform'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.ziprecruiter.com',
-                    'requirements': 'Relevant experience, Strong communication skills',
-                    'benefits': 'Competitive salary, Equity options, Remote work',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_ziprecruiter',
-                    'duration': 'Full-time',
-                    'scraped_from': 'ziprecruiter.com',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"ZipRecruiter API error: {e}")
-
-        return jobs
-
-    def scrape_themuse_api(self):
-        """Scrape jobs using The Muse API"""
-        jobs = []
-        try:
-            # The Muse API structure
-            sample_jobs = [
-                {
-                    'title': 'Remote Content Marketing Manager',
-                    'company': 'Media Company',
-                    'location': 'Remote/USA',
-                    'description': 'Content marketing role with creative freedom'
-                },
-                {
-                    'title': 'Remote Product Manager',
-                    'company': 'Product Company',
-                    'location': 'Remote/Global',
-                    'description': 'Product management for innovative solutions'
-                }
-            ]
-
-            for job in sample_jobs:
-                job_data = {
-                    'title': job['title'],
-                    'type': 'job',
-                    'description': clean_html_content(job['description']),
-                    'location': job['location'],
-                    'company': job['company'],
-                    'source_url': 'https://www.themuse.com',
-                    'requirements': 'Strategic thinking, Leadership experience',
-                    'benefits': 'Great company culture, Professional development, Remote flexibility',
-                    'status': 'active',
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'created_by': 'auto_scraper_themuse',
-                    'duration': 'Full-time',
-                    'scraped_from': 'themuse.com',
-                    'location_type': 'Remote'
-                }
-                jobs.append(job_data)
-
-        except Exception as e:
-            print(f"The Muse API error: {e}")
-
-        return jobs
-
     def scrape_angel_jobs(self):
         """Scrape startup jobs from AngelList/Wellfound"""
         jobs = []
@@ -1437,123 +748,108 @@ class FreezyAutomationEngine:
 
         print(f"💾 Saving {len(resources)} resources to Firebase...")
 
+        # One timestamp for the whole save, shared by every document
+        now = datetime.now()
+
+        # (title, type) of everything created in the last 7 days: from the local seen-items
+        # store, or read once for the whole save
+        if self.seen is not None:
+            recent = self.seen.open(self.db, now)
+            print(f"🔎 {len(recent)} recent resources in the seen-items store for duplicate checks")
+        else:
+            recent = DedupIndex.load(self.db, now)
+            print(f"🔎 Loaded {len(recent)} recent resources for duplicate checks")
+        # New documents are committed in batches (SCRAPER_FIRESTORE_BATCH per commit), each
+        # created under its content-hash ID so saving the same resource twice is a no-op
+        writer = BatchWriter.from_env(self.db, 'resources')
+        queued_ids = set()
+        # One log line per resource, printed in order; a saved one's line is known once its batch is committed
+        log = deque()
+
+        def written(line, title, access_level, signature, doc_id, error):
+            nonlocal saved_count, duplicate_count, error_count
+            if error is None:
+                saved_count += 1
+                line[0] = f"✅ Saved ({access_level}): {title}"
+            elif isinstance(error, AlreadyExists):
+                # Same source, URL and title as a resource saved before (or by an interrupted run)
+                duplicate_count += 1
+                line[0] = f"⏭️  Skipped duplicate: {title}"
+            else:
+                error_count += 1
+                line[0] = f"❌ Error saving {title}: {error}"
+                # Not stored, so a later copy in this run may still be saved
+                recent.discard(signature)
+                queued_ids.discard(doc_id)
+                return
+            # Stored now, so the next run's extraction can drop it
+            if self.seen_filter is not None:
+                self.seen_filter.add(doc_id)
+
+        def print_log():
+            while log and log[0][0] is not None:
+                print(log.popleft()[0])
+
         for index, resource in enumerate(resources):
+            line = [None]
+            log.append(line)
             try:
-                # Check if resource already exists (avoid duplicates)
-                # More specific duplicate check: title + type + source
-                resource_signature = f"{resource['title']}_{resource['type']}_{resource.get('created_by', 'auto_scraper')}"
-
-                # Check both old and new structure with more specific criteria
-                existing_query_old = self.db.collection('resources').where(
-                    'title', '==', resource['title']
-                ).where(
-                    'type', '==', resource['type']
-                ).limit(1)
-
-                existing_query_new = self.db.collection('resources').where(
-                    'metadata.title', '==', resource['title']
-                ).where(
-                    'metadata.type', '==', resource['type']
-                ).limit(1)
-
-                existing_docs_old = existing_query_old.get()
-                existing_docs_new = existing_query_new.get()
-
-                # Only skip if exact match found in last 7 days
-                is_duplicate = False
-                for doc in existing_docs_old:
-                    doc_data = doc.data()
-                    if doc_data.get('created_at'):
-                        # Check if created in last 7 days
-                        created_date = doc_data['created_at']
-                        if hasattr(created_date, 'timestamp'):
-                            days_old = (datetime.now().timestamp() - created_date.timestamp()) / (24 * 3600)
-                            if days_old < 7:
-                                is_duplicate = True
-                                break
-
-                for doc in existing_docs_new:
-                    doc_data = doc.data()
-                    if doc_data.get('metadata', {}).get('created_at'):
-                        created_date = doc_data['metadata']['created_at']
-                        if hasattr(created_date, 'timestamp'):
-                            days_old = (datetime.now().timestamp() - created_date.timestamp()) / (24 * 3600)
-                            if days_old < 7:
-                                is_duplicate = True
-                                break
+                if not isinstance(resource, ResourceRecord):
+                    resource = ResourceRecord.from_dict(resource)
+
+                # Skip it if a resource with the same title and type was created in the last 7 days,
+                # or its ID is stored already (so it does not make its batch fail on create())
+                signature = (resource['title'], resource['type'])
+                doc_id = resource.document_id()
+                is_duplicate = signature in recent or doc_id in queued_ids or (
+                    self.seen_filter is not None and doc_id in self.seen_filter)
 
                 if not is_duplicate:
                     # Assign access level based on quality and distribution
                     access_level = self.assign_access_level(resource, index, len(resources))
 
                     # Create properly structured resource document
-                    resource_doc = {
-                        'metadata': {
-                            'title': resource['title'],
-                            'description': resource['description'],
-                            'type': resource['type'],
-                            'category': resource.get('category', 'General'),
-                            'tags': resource.get('tags', []),
-                            'source_url': resource.get('source_url', ''),
-                            'created_at': resource.get('created_at', datetime.now()),
-                            'updated_at': datetime.now()
-                        },
-                        'content': {
-                            'company': resource.get('company', ''),
-                            'location': resource.get('location', ''),
-                            'duration': resource.get('duration', ''),
-                            'requirements': resource.get('requirements', ''),
-                            'benefits': resource.get('benefits', ''),
-                            'salary_range': resource.get('salary_range', ''),
-                            'application_deadline': resource.get('application_deadline', ''),
-                            'contact_info': resource.get('contact_info', {})
-                        },
-                        'visibility': {
-                            'status': 'active',
-                            'access_level': access_level,
-                            'is_featured': access_level == 'enterprise',  # Enterprise resources are featured
-                            'priority_score': 100 if access_level == 'enterprise' else (80 if access_level == 'pro' else 60)
-                        },
-                        # Also add flat status for backward compatibility
-                        'status': 'active',
-                        'analytics': {
-                            'view_count': 0,
-                            'save_count': 0,
-                            'application_count': 0,
-                            'last_updated': datetime.now()
-                        },
-                        'admin': {
-                            'created_by': resource.get('created_by', 'auto_scraper'),
-                            'approved_by': 'auto_scraper',
-                            'approval_date': datetime.now(),
-                            'scraped_from': resource.get('scraped_from', 'automated'),
-                            'location_type': resource.get('location_type', 'General')
-                        }
-                    }
+                    resource_doc = resource.to_document(access_level, now)
 
                     # Resource doesn't exist, add it
-                    doc_ref = self.db.collection('resources').add(resource_doc)
-                    saved_count += 1
-                    print(f"✅ Saved ({access_level}): {resource['title']}")
+                    recent.add(signature)
+                    queued_ids.add(doc_id)
+                    done = partial(written, line, resource['title'], access_level, signature, doc_id)
+                    writer.add(resource_doc, done, doc_id=doc_id)
                 else:
                     duplicate_count += 1
-                    print(f"⏭️  Skipped duplicate: {resource['title']}")
-
-                # Small delay to avoid overwhelming Firebase
-                time.sleep(0.1)
+                    line[0] = f"⏭️  Skipped duplicate: {resource['title']}"
 
             except Exception as e:
                 error_count += 1
-                print(f"❌ Error saving {resource['title']}: {e}")
+                line[0] = f"❌ Error saving {resource.get('title')}: {e}"
+
+            print_log()
+
+        writer.flush()
+        print_log()
+        if self.seen is not None:
+            self.seen.save()
+        if self.seen_filter is not None:
+            self.seen_filter.save()
 
         print(f"\n📊 Save Summary:")
         print(f"✅ Saved: {saved_count}")
         print(f"⏭️  Duplicates: {duplicate_count}")
         print(f"❌ Errors: {error_count}")
+        if self.seen is not None:
+            print(f"🔎 Duplicate checks: {self.seen.report()}")
+        else:
+            print(f"🔎 Duplicate checks: {recent.reads} Firestore reads in 1 query "
+                  f"(two queries per resource would take at least {2 * len(resources)} reads)")
 
         return saved_count
 
     def send_notification(self, stats):
+        """Send notification about scraping results"""
+        return self.run_async(self.send_notification_async, stats)
+
+    async def send_notification_async(self, stats):
         """Send notification about scraping results"""
         try:
             # Discord webhook notification (free)
@@ -1580,7 +876,7 @@ class FreezyAutomationEngine:
                     'avatar_url': 'https://cdn-icons-png.flaticon.com/512/2942/2942813.png'
                 }
 
-                response = requests.post(webhook_url, json=payload, timeout=10)
+                response = await self.http.post(webhook_url, json=payload, timeout=10)
                 if response.status_code == 204:
                     print("✅ Discord notification sent!")
                 else:
@@ -1591,8 +887,15 @@ class FreezyAutomationEngine:
 
     def run_daily_scraping(self):
         """Main function to run daily scraping"""
+        return self.run_async(self.run_daily_scraping_async)
+
+    async def run_daily_scraping_async(self):
+        """Run the whole daily scrape on one event loop"""
         print("🚀 Starting Freezy Platform Daily Scraping...")
-        print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self.run_timestamp = datetime.now()
+        print(f"⏰ Time: {self.run_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        self.run_deadline = time.monotonic() + self.run_budget
+        self.source_report = []
 
         all_resources = []
         stats = {
@@ -1605,12 +908,12 @@ class FreezyAutomationEngine:
 
         try:
             # Scrape Pakistan jobs
-            pakistan_jobs = self.scrape_pakistan_jobs()
+            pakistan_jobs = await self.scrape_pakistan_jobs_async()
             all_resources.extend(pakistan_jobs)
             stats['pakistan_jobs'] = len(pakistan_jobs)
 
             # Scrape worldwide jobs
-            worldwide_jobs = self.scrape_worldwide_jobs()
+            worldwide_jobs = await self.scrape_worldwide_jobs_async()
             all_resources.extend(worldwide_jobs)
             stats['worldwide_jobs'] = len(worldwide_jobs)
 
@@ -1624,17 +927,51 @@ class FreezyAutomationEngine:
             all_resources.extend(tools)
             stats['tools'] = len(tools)
 
+            # The budget covers scraping only; whatever was collected is saved
+            self.run_deadline = None
+            if self.breaker:
+                self.breaker.save()
+            if DESCRIPTION_CACHE:
+                DESCRIPTION_CACHE.save()
+
+            # One copy of each posting that several sources list
+            if self.near_duplicates is not None:
+                all_resources = self.near_duplicates.dedupe(all_resources)
+
             # Save to Firebase
             saved_count = self.save_to_firebase(all_resources)
             stats['total'] = saved_count
 
+            # The copies dropped above are seen too, once the copy that was kept is stored
+            if self.near_duplicates is not None and (self.seen_filter is not None or self.seen is not None):
+                self.near_duplicates.record_copies(self.seen_filter, self.seen)
+                if self.seen_filter is not None:
+                    self.seen_filter.save()
+                if self.seen is not None:
+                    self.seen.save()
+
+            # Only once the jobs are stored may the next run skip postings this old
+            if self.watermarks:
+                self.watermarks.save()
+            # Likewise a 304 next run skips what this run fetched
+            if self.http_cache:
+                self.http_cache.commit()
+
             # Send notification
             if saved_count > 0:
-                self.send_notification(stats)
+                await self.send_notification_async(stats)
 
             print(f"\n🎉 Daily scraping completed successfully!")
             print(f"📈 Total resources processed: {len(all_resources)}")
             print(f"💾 New resources saved: {saved_count}")
+            self.print_source_report()
+            self.print_http_report()
+            if DESCRIPTION_CACHE and DESCRIPTION_CACHE.report():
+                print(f"🧠 Description cache: {DESCRIPTION_CACHE.report()}")
+            if self.seen_filter is not None:
+                print(f"🌸 Seen filter: {self.seen_filter.report()}")
+            if self.near_duplicates is not None:
+                print(f"🧬 Near-duplicates: {self.near_duplicates.report()}")
 
             return True
 
@@ -1642,6 +979,10 @@ class FreezyAutomationEngine:
             print(f"💥 Fatal error during scraping: {e}")
             return False
 
+        finally:
+            self.run_deadline = None
+            self.run_timestamp = None
+
 def main():
     """Main entry point"""
     print("=" * 60)
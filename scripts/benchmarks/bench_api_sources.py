@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON API sources against local stub APIs
+Serves Adzuna-, Careerjet-, USAJOBS-, Jooble-, ZipRecruiter- and The
+Muse-shaped APIs from a stub server, runs each registry source against
+its stub and checks that the credentials, page number and page size
+reach the API where it expects them, that every posting is mapped onto
+the resource fields, and that paging stops at the last page. Then
+compares the requests and time the largest page size takes with 10
+postings per page, and checks cursor paging and the skip when
+credentials are missing.
+
+Usage: python benchmarks/bench_api_sources.py [--jobs 247] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'
+
+import sources
+from api_request import SourceNotConfigured
+from auto_scraper import clean_html_content
+from extraction import CompiledSource
+from rate_limiter import RateLimiter
+from scraper_http import HttpClient
+from stub_server import StubServer
+
+CREDENTIALS = {
+    'ADZUNA_APP_ID': 'adzuna-id', 'ADZUNA_API_KEY': 'adzuna-key', 'CAREERJET_AFFILIATE_ID': 'careerjet-affid',
+    'USAJOBS_API_KEY': 'usajobs-key', 'USAJOBS_EMAIL': 'jobs@freezy.example', 'JOOBLE_API_KEY': 'jooble-key',
+    'ZIPRECRUITER_API_KEY': 'zip-key', 'THEMUSE_API_KEY': 'muse-key',
+}
+
+
+def posting(index):
+    return {'title': f'Remote Engineer {index}', 'company': f'Company {index % 37}', 'location': f'City {index % 11}',
+            'url': f'https://jobs.example/{index}', 'description': f'<p>Build <b>things</b> #{index}</p>',
+            'posted': f'2024-06-{1 + index % 28:02d}T09:00:00Z'}
+
+
+def query(handler):
+    return {key: values[0] for key, values in parse_qs(urlsplit(handler.path).query).items()}
+
+
+# Per API: how a request carries (page, page size, credentials), and the response shape
+def adzuna_request(handler):
+    params = query(handler)
+    auth = (params.get('app_id'), params.get('app_key')) == ('adzuna-id', 'adzuna-key')
+    return int(handler.path.split('?')[0].rsplit('/', 1)[1]), int(params['results_per_page']), auth
+
+
+def adzuna_response(jobs, page):
+    return {'count': 10000, 'results': [
+        {'title': job['title'], 'description': job['description'], 'redirect_url': job['url'], 'created': job['posted'],
+         'company': {'display_name': job['company']}, 'location': {'display_name': job['location']}}
+        for job in jobs]}
+
+
+def careerjet_request(handler):
+    params = query(handler)
+    return int(params['page']), int(params['pagesize']), params.get('affid') == 'careerjet-affid'
+
+
+def careerjet_response(jobs, page):
+    return {'type': 'JOBS', 'pages': 99, 'jobs': [
+        {'title': job['title'], 'company': job['company'], 'locations': job['location'], 'url': job['url'],
+         'description': job['description'], 'date': job['posted']} for job in jobs]}
+
+
+def usajobs_request(handler):
+    params = query(handler)
+    auth = (handler.headers.get('Authorization-Key'), handler.headers.get('User-Agent')) == ('usajobs-key', 'jobs@freezy.example')
+    return int(params['Page']), int(params['ResultsPerPage']), auth
+
+
+def usajobs_response(jobs, page):
+    return {'SearchResult': {'SearchResultCount': len(jobs), 'SearchResultItems': [
+        {'MatchedObjectId': job['url'], 'MatchedObjectDescriptor': {
+            'PositionTitle': job['title'], 'OrganizationName': job['company'], 'PositionURI': job['url'],
+            'PositionLocationDisplay': job['location'], 'PublicationStartDate': job['posted'],
+            'UserArea': {'Details': {'JobSummary': job['description']}}}} for job in jobs]}}
+
+
+def jooble_request(handler):
+    body = json.loads(handler.body)
+    return int(body['page']), int(body['ResultOnPage']), handler.path.endswith('/jooble-key')
+
+
+def jooble_response(jobs, page):
+    return {'totalCount': 10000, 'jobs': [
+        {'title': job['title'], 'company': job['company'], 'location': job['location'], 'link': job['url'],
+         'snippet': job['description'], 'updated': job['posted']} for job in jobs]}
+
+
+def ziprecruiter_request(handler):
+    params = query(handler)
+    return int(params['page']), int(params['jobs_per_page']), params.get('api_key') == 'zip-key'
+
+
+def ziprecruiter_response(jobs, page):
+    return {'total_jobs': 10000, 'jobs': [
+        {'name': job['title'], 'hiring_company': {'name': job['company']}, 'location': job['location'],
+         'url': job['url'], 'snippet': job['description'], 'posted_time': job['posted']} for job in jobs]}
+
+
+def themuse_request(handler):
+    params = query(handler)
+    return int(params['page']) + 1, 20, params.get('api_key') == 'muse-key'
+
+
+def themuse_response(jobs, page):
+    return {'page': page - 1, 'page_count': 500, 'results': [
+        {'name': job['title'], 'contents': job['description'], 'company': {'name': job['company']},
+         'locations': [{'name': job['location']}], 'refs': {'landing_page': job['url']},
+         'publication_date': job['posted']} for job in jobs]}
+
+
+APIS = {
+    'Adzuna API': (adzuna_request, adzuna_response),
+    'Careerjet API': (careerjet_request, careerjet_response),
+    'USAJOBS API': (usajobs_request, usajobs_response),
+    'Jooble API': (jooble_request, jooble_response),
+    'ZipRecruiter API': (ziprecruiter_request, ziprecruiter_response),
+    'The Muse API': (themuse_request, themuse_response),
+}
+
+
+def api_route(total, read_request, response):
+    """Route handler: a 1-based page of `total` postings, 401 without the credentials"""
+    def route(handler):
+        page, page_size, authorized = read_request(handler)
+        if not authorized:
+            return 401, {}, b'{"error": "unauthorized"}'
+        first = (page - 1) * page_size
+        jobs = [posting(index) for index in range(first, min(first + page_size, total))]
+        return 200, {}, json.dumps(response(jobs, page)).encode()
+    return route
+
+
+def cursor_route(total, page_size):
+    """Route handler: an API that pages with an opaque 'next' cursor"""
+    def route(handler):
+        offset = int(query(handler).get('after', '0'), 16)
+        jobs = [posting(index) for index in range(offset, min(offset + page_size, total))]
+        following = offset + page_size
+        return 200, {}, json.dumps({'data': jobs, 'next': f'{following:x}' if following < total else None}).encode()
+    return route
+
+
+def registry_spec(name):
+    return next(spec for spec in sources.WORLDWIDE_SOURCES if spec['name'] == name)
+
+
+def stub_spec(name, stub):
+    """The registry source pointed at the stub, paging until the API runs out"""
+    spec = registry_spec(name)
+    pages = {**spec['pages'], 'max_pages': 1000, 'max_items': None}
+    return {**spec, 'url': stub.url(urlsplit(spec['url']).path), 'pages': pages}
+
+
+async def scrape(source):
+    async with HttpClient(RateLimiter(rate=0), pool_per_host=0) as http:
+        return await source.scrape(http)
+
+
+def run(spec):
+    started = time.perf_counter()
+    jobs = asyncio.run(scrape(CompiledSource(spec, clean_html_content)))
+    return jobs, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=247, help='postings each stub API holds (not a multiple of a page size)')
+    parser.add_argument('--latency', type=float, default=0.05, help='stub server delay per request (seconds)')
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"🔌 API SOURCES BENCHMARK: {args.jobs} postings per API, {args.latency * 1000:.0f} ms per request")
+    print("=" * 64)
+    os.environ.update(CREDENTIALS)
+
+    for name, (read_request, response) in APIS.items():
+        # Adzuna has the page and Jooble the key in the path
+        path = urlsplit(registry_spec(name)['url']).path.format(page='{page}', JOOBLE_API_KEY='jooble-key')
+        routes = {path.format(page=page): api_route(args.jobs, read_request, response) for page in range(1, 100)}
+        with StubServer(routes, latency=args.latency) as stub:
+            spec = stub_spec(name, stub)
+
+            jobs, seconds = run(spec)
+            titles = [job['title'] for job in jobs]
+            assert titles == [posting(index)['title'] for index in range(args.jobs)], f"{name}: wrong postings"
+            first, expected = jobs[0], posting(0)
+            assert (first['company'], first['location'], first['source_url']) == \
+                (expected['company'], expected['location'], expected['url']), (name, first)
+            assert first['description'] == clean_html_content(expected['description'])
+            assert jobs.stop_reason == 'last page', (name, jobs.stop_reason)
+            assert jobs.pages == math.ceil(args.jobs / spec['page_size']), (name, jobs.pages)
+            requests = sum(stub.hits.values())
+
+            line = f"   ✅ {name:17} {len(jobs):4} jobs, {requests:2} requests of {spec['page_size']:3} in {seconds:5.2f}s"
+            if name != 'The Muse API':  # Fixed at 20 per page, nothing to compare with
+                stub.hits.clear()
+                small_jobs, small_seconds = run(dict(spec, page_size=10))
+                assert [job['title'] for job in small_jobs] == titles
+                line += f"  (10 per page: {sum(stub.hits.values()):2} requests in {small_seconds:5.2f}s)"
+        print(line)
+    print("✅ Credentials, page and page size reach every API; all postings mapped; paging stops at the last page")
+
+    cursor_spec = {
+        'name': 'Cursor API', 'format': 'api', 'params': {'after': '{cursor}', 'limit': '{page_size}'},
+        'page_size': 25, 'results': 'data', 'pages': {'cursor': 'next', 'max_pages': 100},
+        'fields': {'title': {'path': 'title', 'required': True}, 'company': {'path': 'company'}},
+    }
+    with StubServer({'/feed': cursor_route(args.jobs, 25)}, latency=args.latency) as stub:
+        jobs, seconds = run(dict(cursor_spec, url=stub.url('/feed')))
+        assert [job['title'] for job in jobs] == [posting(index)['title'] for index in range(args.jobs)]
+        assert jobs.stop_reason == 'last page' and jobs.pages == math.ceil(args.jobs / 25), (jobs.pages, jobs.stop_reason)
+    print(f"✅ Cursor paging: {len(jobs)} jobs from {jobs.pages} pages in {seconds:.2f}s, stopped at the last cursor")
+
+    del os.environ['ADZUNA_API_KEY']
+    try:
+        run(registry_spec('Adzuna API'))
+    except SourceNotConfigured as e:
+        print(f"✅ Missing credentials skip the source before any request: {e}")
+    else:
+        raise AssertionError("Adzuna ran without ADZUNA_API_KEY")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: wall-clock time of the asyncio scraping engine
+Runs N JSON sources against a local stub server and compares the old
+one-request-at-a-time loop with the event loop at a few concurrency limits
+
+Usage: python benchmarks/bench_async_engine.py [--sources 200] [--latency 0.1]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_scraper import FreezyAutomationEngine
+from rate_limiter import RateLimiter
+from stub_server import StubServer
+
+
+def build_payload(source_index):
+    """Small RemoteOK-style payload: metadata row followed by postings"""
+    jobs = [{'legal': 'metadata'}]
+    for job_index in range(10):
+        jobs.append({
+            'position': f'Engineer {source_index}-{job_index}',
+            'company': f'Company {source_index}',
+            'description': '<p>Remote role</p>',
+            'tags': ['python', 'remote'],
+        })
+    return json.dumps(jobs).encode()
+
+
+def bench_sequential(urls):
+    """Baseline: blocking requests.get per source, one after another"""
+    started = time.perf_counter()
+    for url in urls:
+        requests.get(url, timeout=30).json()
+    return time.perf_counter() - started
+
+
+def bench_engine(urls, workers):
+    """All sources on one event loop, at most `workers` in flight"""
+    # Every stub source shares 127.0.0.1, so per-host limits are lifted here
+    os.environ['SCRAPER_POOL_PER_HOST'] = '0'
+    engine = FreezyAutomationEngine(connect_firebase=False)
+    engine.max_workers = workers
+    engine.limiter = RateLimiter(rate=0)
+
+    def make_source(url):
+        async def scrape():
+            response = await engine.http.get(url, timeout=30)
+            return response.json()[1:]
+        return scrape
+
+    sources = [(f"Stub {index}", make_source(url)) for index, url in enumerate(urls)]
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        jobs = engine.run_async(engine.run_sources_async, sources)
+    elapsed = time.perf_counter() - started
+
+    assert len(jobs) == 10 * len(urls), f"expected {10 * len(urls)} jobs, got {len(jobs)}"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.1, help='stub server delay per request (seconds)')
+    parser.add_argument('--skip-sequential', action='store_true')
+    args = parser.parse_args()
+
+    routes = {f'/source/{index}.json': build_payload(index) for index in range(args.sources)}
+
+    print("=" * 60)
+    print(f"⏱️  ASYNC ENGINE BENCHMARK: {args.sources} sources, {args.latency * 1000:.0f} ms latency")
+    print("=" * 60)
+
+    with StubServer(routes, latency=args.latency) as server:
+        urls = [server.url(path) for path in routes]
+
+        if not args.skip_sequential:
+            elapsed = bench_sequential(urls)
+            print(f"🐢 Sequential requests.get:      {elapsed:7.2f} s")
+
+        for workers in (1, 16, 64, 200):
+            elapsed = bench_engine(urls, workers)
+            print(f"⚡ Event loop, {workers:>3} in flight:  {elapsed:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark: clean_html_content, BeautifulSoup tree walk vs single-pass extractor
+Checks that html_text gives byte-identical output to the previous
+BeautifulSoup implementation on a golden corpus (hand-picked edge cases,
+RemoteOK-style HTML descriptions, plain sample descriptions and seeded
+random tag soup), also when cut short at small limits and chunk sizes,
+then reports descriptions per second for each and the CPU time saved by
+stopping at the length limit on long descriptions.
+
+Usage: python benchmarks/bench_clean_html.py [--fuzz 3000] [--seconds 2] [--long-kb 40]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import warnings
+
+from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'  # Time the cleaning, not the memo cache
+
+from auto_scraper import clean_html_content
+from html_text import html_to_text
+
+warnings.filterwarnings('ignore', category=MarkupResemblesLocatorWarning)
+
+
+def legacy_clean_html_content(text, limit=1000):
+    """clean_html_content as it was before html_text (the golden reference)"""
+    if not text:
+        return ""
+
+    soup = BeautifulSoup(text, 'html.parser')
+
+    for br in soup.find_all('br'):
+        br.replace_with('\n')
+
+    for p in soup.find_all('p'):
+        p.insert_after('\n')
+
+    for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+        h.insert_before('\n')
+        h.insert_after('\n')
+
+    for li in soup.find_all('li'):
+        li.insert_before('• ')
+        li.insert_after('\n')
+
+    clean_text = soup.get_text()
+
+    clean_text = re.sub(r'\n\s*\n', '\n\n', clean_text)
+    clean_text = re.sub(r'[ \t]+', ' ', clean_text)
+    clean_text = clean_text.strip()
+
+    if len(clean_text) > limit:
+        clean_text = clean_text[:limit] + "..."
+
+    return clean_text
+
+
+EDGE_CASES = [
+    '', '   ', '\n\n\t', 'plain text', 'Tom & Jerry', 'a < b > c', '5 &lt; 6', '&nbsp;padded&nbsp;',
+    'a<br>b', 'a<br/>b', 'a<br />b', 'a<br>b<br/>c</p>d', 'x<p>a</br>b</p>y', '<br></br>after',
+    '<p>one</p><p>two</p>', '<p>unclosed<p>nested', '<p/>self-closed', '</p>stray end',
+    '<ul><li>a<li>b</ul>z', '<ol><li><p>para in item</p></li></ol>', '<li/>', '<h1>T</h1>body<h2>S</h2>',
+    '<h3><li>item in heading</h3>', '<li><h4>heading in item</h4></li>',
+    '<template><p>t</p></template>q', '<script>var x = "<p>";</script>k', '<style>p {}</style>s',
+    '<ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby>', '<!-- comment -->text<!-- -->',
+    '<!DOCTYPE html><p>doc</p>', '<?php echo 1; ?>pi', '<![CDATA[cd]]>', '<script><![CDATA[x]]></script>',
+    'a &foo; &amp &#150; &#x41; &#X42; &#0; &#129; &#1114112;', '&copy;&trade;&hellip;&rsquo;',
+    '<pre>  keep   spaces  </pre>|<b> </b>|', '<textarea>\n\n</textarea>t', '<b>bold</b> <i>it</i>',
+    '<div>\n  <p>indented</p>\n\n\n  <p>blocks</p>\n</div>', 'tab\t\tand  spaces', '<p>a</p>\r\n\r\n<p>b</p>',
+    '<img src=x>alt<input><hr>rule', '<a href="/x">link</a> text', '<table><tr><td>1<td>2</table>',
+    '<div><span>deep<div>er</span>mix</div>', '<BR>UPPER<P>CASE</P>', '<p class="x" id=y data-z>attrs</p>',
+    'unterminated <b', '<p>trailing &', '<', '>', '<>', '</>', '<!->', '<p>' * 50 + 'deep',
+    'x' * 1200, '<p>' + 'y' * 1200 + '</p>', '<li>' + 'word ' * 300 + '</li>',
+]
+
+SAMPLE_DESCRIPTIONS = [
+    'Senior software engineering role in growing Pakistani tech company',
+    'Product management role in Pakistani fintech sector',
+    'Digital marketing role with local and international clients',
+    'Remote job opportunity - work from Pakistan',
+    'Remote job opportunity',
+]
+
+FUZZ_TOKENS = [
+    '<p>', '</p>', '<br>', '<br/>', '</br>', '<li>', '</li>', '<ul>', '</ul>', '<h2>', '</h2>', '<h5>',
+    '<div>', '</div>', '<b>', '</b>', '<span class="c">', '</span>', '<pre>', '</pre>', '<script>',
+    '</script>', '<template>', '</template>', '<rt>', '</rt>', '<!-- c -->', '<![CDATA[cd]]>', '<img>',
+    '<p/>', '<li/>', '<h1>', '</h1>', '<textarea>', '</textarea>', '<style>', '</style>', '<?pi?>', '<!DOCTYPE x>',
+    '&amp;', '&nbsp;', '&bogus;', '&#8226;', '&#x41;', '&', ' ', '  ', '\n', '\n\n', '\t', '\r\n', 'word',
+    'Engineer', '•', '<', '>',
+]
+
+
+def remoteok_description(index):
+    return (
+        f'<p><strong>Company {index}</strong> is hiring a <em>Senior Engineer</em>.</p>'
+        '<h2>What you will do</h2><ul>'
+        + ''.join(f'<li>Build &amp; ship feature {n} with the team</li>' for n in range(8))
+        + '</ul><h2>Requirements</h2><p>5+ years of Python<br>Experience with&nbsp;AWS<br/>Remote-friendly</p>'
+        '<p>Benefits include health, equity &amp; a learning budget.</p>'
+    ) * (1 + index % 4)
+
+
+def golden_corpus(fuzz_count):
+    rng = random.Random(20240101)
+    fuzz = [''.join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 40))) for _ in range(fuzz_count)]
+    return EDGE_CASES + SAMPLE_DESCRIPTIONS + [remoteok_description(i) for i in range(40)] + fuzz
+
+
+def throughput(func, corpus, seconds):
+    done = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for text in corpus:
+            func(text)
+        done += len(corpus)
+    return done / (time.perf_counter() - started)
+
+
+def cpu_per_call(func, texts, seconds):
+    calls = 0
+    started = time.process_time()
+    while time.process_time() - started < seconds:
+        for text in texts:
+            func(text)
+        calls += len(texts)
+    return (time.process_time() - started) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fuzz', type=int, default=3000)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    parser.add_argument('--long-kb', type=int, default=40)
+    args = parser.parse_args()
+
+    corpus = golden_corpus(args.fuzz)
+    print("=" * 64)
+    print(f"🧹 CLEAN HTML BENCHMARK: golden corpus of {len(corpus)} descriptions")
+    print("=" * 64)
+
+    mismatches = [text for text in corpus if clean_html_content(text) != legacy_clean_html_content(text)]
+    for text in mismatches[:5]:
+        print(f"❌ {text[:60]!r}\n   old {legacy_clean_html_content(text)[:60]!r}\n   new {clean_html_content(text)[:60]!r}")
+    assert not mismatches, f"{len(mismatches)} descriptions differ from the BeautifulSoup output"
+    print(f"✅ Output identical to the BeautifulSoup implementation on all {len(corpus)}")
+
+    for limit in (5, 40, 300):
+        for chunk_size in (7, 64):
+            for text in corpus:
+                expected = legacy_clean_html_content(text, limit)
+                assert html_to_text(text, limit, chunk_size) == expected, (text, limit, chunk_size)
+    print("✅ Bounded cleaning (limits 5/40/300, chunks of 7/64) matches clean-then-truncate")
+
+    workloads = [
+        ("plain sample descriptions", SAMPLE_DESCRIPTIONS),
+        ("RemoteOK-style HTML", [remoteok_description(i) for i in range(40)]),
+        ("golden corpus (mixed)", corpus),
+    ]
+    for title, texts in workloads:
+        old = throughput(legacy_clean_html_content, texts, args.seconds)
+        new = throughput(clean_html_content, texts, args.seconds)
+        print(f"\n{title}:")
+        print(f"   🐢 BeautifulSoup tree walk: {old:12,.0f} descriptions/s")
+        print(f"   ⚡ html_text single pass:   {new:12,.0f} descriptions/s  ({new / old:.1f}x)")
+
+    repeat = max(1, args.long_kb * 1000 // len(remoteok_description(0)))
+    long_texts = [remoteok_description(4 * i) * repeat for i in range(8)]
+    size_kb = sum(map(len, long_texts)) / len(long_texts) / 1000
+    print(f"\nlong descriptions ({size_kb:.0f} KB of HTML each, limit 1000 characters):")
+    legacy = cpu_per_call(legacy_clean_html_content, long_texts, args.seconds)
+    full = cpu_per_call(lambda text: html_to_text(html_to_text(text), 1000), long_texts, args.seconds)
+    bounded = cpu_per_call(clean_html_content, long_texts, args.seconds)
+    print(f"   🐢 BeautifulSoup, then truncate:    {legacy * 1000:8.2f} ms CPU per description")
+    print(f"   📄 html_text whole, then truncate:  {full * 1000:8.2f} ms CPU per description")
+    print(f"   ✂️ html_text stopping at the limit: {bounded * 1000:8.2f} ms CPU per description  ({full / bounded:.0f}x less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CPU stage in worker processes vs on the event loop
+Builds fixture payloads the I/O stage would hand over - Rozee.pk- and
+Indeed-style listing pages and RemoteOK-style API items with long HTML
+descriptions - and runs CompiledSource.process_async() on all of them at
+once, inline and with a CpuStage of 1, 2 and 4 workers. Checks every
+worker count returns the same records in the same order, and reports
+pages per second and the speed-up over inline.
+
+Scaling is bounded by the cores the machine has (os.cpu_count()).
+
+Usage: python benchmarks/bench_cpu_stage.py [--pages 24] [--cards 50] [--workers 1,2,4]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'
+
+import sources
+from auto_scraper import DESCRIPTION_LIMIT, DESCRIPTION_LIMITS, clean_html_content
+from bench_html_parse import build_indeed, build_rozee
+from cpu_stage import CpuStage
+from extraction import CompiledSource
+
+
+def registry_spec(name, **overrides):
+    spec = next(spec for spec in sources.PAKISTAN_SOURCES + sources.WORLDWIDE_SOURCES if spec['name'] == name)
+    return {**spec, **overrides}
+
+
+def remoteok_items(page, count):
+    paragraph = '<p>We are hiring a <strong>senior engineer</strong> to build <a href="#">distributed systems</a>.</p>'
+    return [{'position': f'Engineer {page}-{index}', 'company': f'Company {index}', 'url': f'https://remoteok.io/{page}/{index}',
+             'tags': ['python', 'remote'], 'description': f'<div><h2>Role {page}-{index}</h2>{paragraph * 40}<ul>'
+             + ''.join(f'<li>Perk {perk}</li>' for perk in range(20)) + '</ul></div>'}
+            for index in range(count)]
+
+
+def fixtures(pages, cards):
+    """(source, payload) pairs, as CompiledSource.payload() returns them"""
+    rozee = CompiledSource(registry_spec('Rozee.pk', limit=None), clean_html_content)
+    indeed = CompiledSource(registry_spec('Indeed Scraping'), clean_html_content)
+    remoteok = CompiledSource(registry_spec('RemoteOK API', window=(0, None)), clean_html_content)
+    work = []
+    for page in range(pages):
+        source = (rozee, indeed, remoteok)[page % 3]
+        if source is rozee:
+            work.append((source, build_rozee(cards)))
+        elif source is indeed:
+            work.append((source, build_indeed(cards)))
+        else:
+            work.append((source, remoteok_items(page, cards)))
+    return work
+
+
+async def process_all(work, now, cpu):
+    return await asyncio.gather(*(source.process_async(payload, now, cpu) for source, payload in work))
+
+
+def run(work, now, cpu=None):
+    started = time.perf_counter()
+    results = asyncio.run(process_all(work, now, cpu))
+    return results, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=24)
+    parser.add_argument('--cards', type=int, default=50, help='jobs per page')
+    parser.add_argument('--workers', default='1,2,4', help='comma-separated worker counts')
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"🧮 CPU STAGE BENCHMARK: {args.pages} pages of {args.cards} jobs, {os.cpu_count()} CPU(s)")
+    print("=" * 64)
+
+    work = fixtures(args.pages, args.cards)
+    now = datetime.now()
+
+    expected, inline_seconds = run(work, now)
+    print(f"   🐢 inline (event loop): {inline_seconds:6.2f}s  ({args.pages / inline_seconds:6.1f} pages/s)")
+
+    for workers in [int(count) for count in args.workers.split(',')]:
+        with CpuStage(workers, DESCRIPTION_LIMITS, DESCRIPTION_LIMIT) as cpu:
+            run(work[:workers], now, cpu)  # Start the workers and compile the sources before timing
+            results, seconds = run(work, now, cpu)
+        assert results == expected, f"{workers} workers changed the records or their order"
+        print(f"   ⚡ {workers} worker(s):          {seconds:6.2f}s  ({args.pages / seconds:6.1f} pages/s, "
+              f"{inline_seconds / seconds:.2f}x inline)")
+
+    print(f"✅ Same {sum(map(len, expected)):,} records in the same order at every worker count")
+
+
+if __name__ == "__main__":
+    main()
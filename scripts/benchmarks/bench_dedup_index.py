@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: preloaded dedup index vs two Firestore queries per resource
+Against the Firestore emulator from firebase.json, seeds the resources
+collection with documents created in the last 7 days and older ones,
+then decides for N scraped resources whether each is a duplicate: the
+old way (a title + type query on the old and on the new document layout
+per resource, filtered to the last 7 days in Python) and with
+dedup_index.DedupIndex (one projected range query on
+metadata.created_at). Checks both agree and reports document reads,
+queries and time.
+
+Start the emulator first (firebase emulators:start --only firestore),
+then:
+
+Usage: FIRESTORE_EMULATOR_HOST=localhost:8080 python benchmarks/bench_dedup_index.py [--resources 1000] [--recent 2000] [--old 5000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import urllib.request
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from google.cloud import firestore
+
+from dedup_index import DedupIndex
+from firestore_batch import BatchWriter
+from resource_record import ResourceRecord
+
+PROJECT = 'demo-freezy'
+
+
+def clear_emulator():
+    url = (f"http://{os.environ['FIRESTORE_EMULATOR_HOST']}/emulator/v1/projects/{PROJECT}"
+           f"/databases/(default)/documents")
+    urllib.request.urlopen(urllib.request.Request(url, method='DELETE')).read()
+
+
+def seed(db, recent, old, now):
+    """recent documents from the last 7 days (every other title a scraped one), old ones from a month ago"""
+    writer = BatchWriter(db, 'resources')
+    for index in range(recent + old):
+        created_at = now - (timedelta(hours=index % 150) if index < recent else timedelta(days=30))
+        record = ResourceRecord(title=f'Remote Engineer {index * 2}', type='job', description='Seeded',
+                                created_at=created_at)
+        writer.add(record.to_document('free', now))
+    writer.flush()
+
+
+def legacy_is_duplicate(db, resource, now):
+    """The duplicate check save_to_firebase used to run; returns (is duplicate, document reads)"""
+    existing_docs_old = db.collection('resources').where('title', '==', resource['title']).where(
+        'type', '==', resource['type']).limit(1).get()
+    existing_docs_new = db.collection('resources').where('metadata.title', '==', resource['title']).where(
+        'metadata.type', '==', resource['type']).limit(1).get()
+    reads = max(1, len(existing_docs_old)) + max(1, len(existing_docs_new))
+
+    for doc in existing_docs_old:
+        created_date = doc.to_dict().get('created_at')
+        if hasattr(created_date, 'timestamp') and (now.timestamp() - created_date.timestamp()) / (24 * 3600) < 7:
+            return True, reads
+    for doc in existing_docs_new:
+        created_date = doc.to_dict().get('metadata', {}).get('created_at')
+        if hasattr(created_date, 'timestamp') and (now.timestamp() - created_date.timestamp()) / (24 * 3600) < 7:
+            return True, reads
+    return False, reads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resources', type=int, default=1000, help='scraped resources to check')
+    parser.add_argument('--recent', type=int, default=2000, help='documents created in the last 7 days')
+    parser.add_argument('--old', type=int, default=5000, help='documents created a month ago')
+    args = parser.parse_args()
+
+    if not os.getenv('FIRESTORE_EMULATOR_HOST'):
+        sys.exit("Set FIRESTORE_EMULATOR_HOST (e.g. localhost:8080) and start the emulator: "
+                 "firebase emulators:start --only firestore")
+
+    print("=" * 64)
+    print(f"🔎 DEDUP INDEX BENCHMARK: {args.resources} resources vs {args.recent} recent + {args.old} old documents")
+    print("=" * 64)
+
+    db = firestore.Client(project=PROJECT)
+    now = datetime.now()
+    clear_emulator()
+    seed(db, args.recent, args.old, now)
+    resources = [ResourceRecord(title=f'Remote Engineer {index}', type='job') for index in range(args.resources)]
+
+    started = time.perf_counter()
+    legacy, legacy_reads = [], 0
+    for resource in resources:
+        is_duplicate, reads = legacy_is_duplicate(db, resource, now)
+        legacy.append(is_duplicate)
+        legacy_reads += reads
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = DedupIndex.load(db, now)
+    indexed = [(resource['title'], resource['type']) in index for resource in resources]
+    index_seconds = time.perf_counter() - started
+
+    assert indexed == legacy, "the index and the per-resource queries disagree"
+    print(f"✅ Same decision for all {args.resources} resources ({sum(indexed)} duplicates)")
+    print(f"   🐢 two queries per resource: {legacy_reads:7,} reads, {2 * args.resources:6,} queries, {legacy_seconds:6.2f}s")
+    print(f"   ⚡ preloaded index:           {index.reads:7,} reads, {1:6,} query,   {index_seconds:6.2f}s "
+          f"({len(index)} signatures in memory)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: description memo cache over consecutive daily runs
+Simulates the three RemoteOK scrapers cleaning overlapping windows of the
+same feed on each of several days, with a share of new postings every
+day, and compares cleaning time with and without DescriptionCache (fresh
+memory each day, SQLite file kept between days).
+
+Usage: python benchmarks/bench_description_cache.py [--postings 200] [--days 3] [--new 0.2]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from description_cache import DescriptionCache
+from html_text import html_to_text
+
+
+def posting(index):
+    return (
+        f'<p><strong>Company {index}</strong> is hiring a remote engineer.</p><h2>Responsibilities</h2><ul>'
+        + ''.join(f'<li>Own service {index}-{n} end to end &amp; keep it fast</li>' for n in range(30))
+        + '</ul><p>Benefits: equity, health &amp; a home-office budget.</p>'
+    )
+
+
+def day_windows(first_id, postings):
+    """Descriptions each RemoteOK scraper cleans on a day whose feed starts at first_id"""
+    feed = [posting(index) for index in range(first_id, first_id + postings)]
+    half, three_quarters = postings // 2, postings * 3 // 4
+    return feed[:half] + feed[:three_quarters] + feed[half:]  # Pakistan filter, API, worldwide
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--postings', type=int, default=200)
+    parser.add_argument('--days', type=int, default=3)
+    parser.add_argument('--new', type=float, default=0.2, help="share of postings that are new each day")
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"🧠 DESCRIPTION CACHE BENCHMARK: {args.postings} postings/day, {args.days} days, {args.new:.0%} new daily")
+    print("=" * 64)
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'descriptions.sqlite3')
+        total_plain = total_cached = 0.0
+
+        for day in range(args.days):
+            texts = day_windows(int(day * args.postings * args.new), args.postings)
+
+            started = time.perf_counter()
+            expected = [html_to_text(text, 1000) for text in texts]
+            plain = time.perf_counter() - started
+
+            cache = DescriptionCache(db_path=db_path)
+            started = time.perf_counter()
+            cleaned = [cache.get(text, 1000, html_to_text) for text in texts]
+            cache.save()
+            cached = time.perf_counter() - started
+            cache.close()
+
+            assert cleaned == expected, "cached descriptions differ from freshly cleaned ones"
+            total_plain += plain
+            total_cached += cached
+            print(f"📅 Day {day + 1}: {len(texts)} cleanings  {plain * 1000:7.1f} ms uncached  "
+                  f"{cached * 1000:7.1f} ms cached  | {cache.report()}")
+
+    print(f"\n⏱️ Total: {total_plain * 1000:.1f} ms uncached vs {total_cached * 1000:.1f} ms cached "
+          f"({total_plain / total_cached:.1f}x)")
+    print("✅ Cached descriptions identical to freshly cleaned ones")
+
+
+if __name__ == "__main__":
+    main()
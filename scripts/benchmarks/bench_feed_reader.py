@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming feed reader vs building the whole RSS tree
+Compares ET.fromstring + findall('.//item')[:N] (the old We Work Remotely
+path) with feed_reader.parse_feed(limit=N) on a large generated feed, and
+checks both return the same items. Also parses an Atom feed end to end.
+
+Usage: python benchmarks/bench_feed_reader.py [--items 5000] [--limit 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feed_reader import parse_feed
+
+
+def build_rss(count):
+    body = escape('<p>Remote role with a <strong>distributed</strong> team.</p>' * 40)
+    items = ''.join(
+        f"<item><title>Company {index}: Engineer {index}</title>"
+        f"<link>https://weworkremotely.com/jobs/{index}</link>"
+        f"<guid>job-{index}</guid><pubDate>Mon, 01 Jan 2024 00:00:00 +0000</pubDate>"
+        f"<description>{body}</description></item>"
+        for index in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Jobs</title>{items}</channel></rss>'.encode()
+
+
+def build_atom(count):
+    entries = ''.join(
+        f'<entry><title>Engineer {index}</title><id>urn:job:{index}</id>'
+        f'<link rel="self" href="https://example.com/api/{index}"/>'
+        f'<link rel="alternate" href="https://example.com/jobs/{index}"/>'
+        f'<author><name>Company {index}</name></author>'
+        f'<updated>2024-01-01T00:00:00Z</updated><summary>Role {index}</summary></entry>'
+        for index in range(count)
+    )
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Jobs</title>{entries}</feed>'.encode()
+
+
+def tree_items(data, limit):
+    """The pre-streaming We Work Remotely parse"""
+    root = ET.fromstring(data)
+    items = []
+    for item in root.findall('.//item')[:limit]:
+        items.append({
+            'title': item.find('title').text if item.find('title') is not None else 'Remote Job',
+            'description': item.find('description').text if item.find('description') is not None else 'Remote opportunity',
+            'link': item.find('link').text if item.find('link') is not None else 'https://weworkremotely.com',
+        })
+    return items
+
+
+def stream_items(data, limit):
+    return [
+        {'title': item.get('title', 'Remote Job'),
+         'description': item.get('description', 'Remote opportunity'),
+         'link': item.get('link', 'https://weworkremotely.com')}
+        for item in parse_feed(data, limit)
+    ]
+
+
+def measure(label, func, data, limit):
+    started = time.perf_counter()
+    result = func(data, limit)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    func(data, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label} {elapsed * 1000:8.1f} ms  {peak / 1e6:8.2f} MB peak")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    rss = build_rss(args.items)
+
+    print("=" * 64)
+    print(f"📰 FEED READER BENCHMARK: {args.items} items, {len(rss) / 1e6:.1f} MB, first {args.limit}")
+    print("=" * 64)
+
+    old = measure("🌳 fromstring + findall:      ", tree_items, rss, args.limit)
+    new = measure("🌊 parse_feed(limit):         ", stream_items, rss, args.limit)
+    assert old == new, "streamed items differ from the tree parse"
+    measure("🌊 parse_feed (all items):    ", lambda data, _: parse_feed(data), rss, None)
+    print("✅ Streamed RSS items identical to the tree parse")
+
+    atom = parse_feed(build_atom(3))
+    assert atom[1]['link'] == 'https://example.com/jobs/1' and atom[1]['author'] == 'Company 1'
+    assert atom[1]['description'] == 'Role 1' and atom[1]['guid'] == 'urn:job:1'
+    print("✅ Atom entries parsed")
+
+
+if __name__ == "__main__":
+    main()
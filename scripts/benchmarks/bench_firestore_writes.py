@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batched Firestore writes vs one add() per document
+Against the Firestore emulator from firebase.json, creates N resource
+documents the old way (collection.add() per document, then a 0.1 s
+sleep) and with firestore_batch.BatchWriter at several batch sizes, and
+checks every document arrived. Then runs save_to_firebase() twice on
+the same resources: the first save writes them all, the second skips
+them all as duplicates.
+
+Start the emulator first (firebase emulators:start --only firestore),
+then:
+
+Usage: FIRESTORE_EMULATOR_HOST=localhost:8080 python benchmarks/bench_firestore_writes.py [--docs 1000] [--batch-sizes 1,50,500]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import urllib.request
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'
+# Every run starts from an empty emulator, so nothing from earlier runs may count as stored
+os.environ['SCRAPER_SEEN_STORE'] = ''
+os.environ['SCRAPER_SEEN_FILTER'] = ''
+
+from google.cloud import firestore
+
+from auto_scraper import FreezyAutomationEngine
+from firestore_batch import BatchWriter
+from resource_record import ResourceRecord
+
+PROJECT = 'demo-freezy'
+LEGACY_SLEEP = 0.1
+
+
+def clear_emulator():
+    """Delete every document in the emulator's database"""
+    url = (f"http://{os.environ['FIRESTORE_EMULATOR_HOST']}/emulator/v1/projects/{PROJECT}"
+           f"/databases/(default)/documents")
+    urllib.request.urlopen(urllib.request.Request(url, method='DELETE')).read()
+
+
+def resources(count):
+    now = datetime.now()
+    return [ResourceRecord(title=f'Remote Engineer {index}', type='job', description=f'Role number {index}',
+                           location='Remote', company=f'Company {index % 50}', source_url=f'https://jobs.example/{index}',
+                           status='active', created_at=now, updated_at=now, created_by='bench', duration='Full-time')
+            for index in range(count)]
+
+
+def documents(count):
+    now = datetime.now()
+    return [record.to_document(('free', 'pro', 'enterprise')[index % 3], now) for index, record in enumerate(resources(count))]
+
+
+def count_documents(db):
+    return db.collection('resources').count().get()[0][0].value
+
+
+def legacy_writes(db, docs):
+    """One add() per document, as save_to_firebase used to (without its sleeps)"""
+    started = time.perf_counter()
+    for document in docs:
+        db.collection('resources').add(document)
+    return time.perf_counter() - started, len(docs)
+
+
+def batched_writes(db, docs, batch_size):
+    writer = BatchWriter(db, 'resources', batch_size)
+    started = time.perf_counter()
+    for document in docs:
+        writer.add(document)
+    writer.flush()
+    assert writer.failed == 0
+    return time.perf_counter() - started, writer.commits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=1000)
+    parser.add_argument('--batch-sizes', default='1,50,500', help='comma-separated documents per commit')
+    args = parser.parse_args()
+
+    if not os.getenv('FIRESTORE_EMULATOR_HOST'):
+        sys.exit("Set FIRESTORE_EMULATOR_HOST (e.g. localhost:8080) and start the emulator: "
+                 "firebase emulators:start --only firestore")
+
+    print("=" * 64)
+    print(f"🔥 FIRESTORE WRITES BENCHMARK: {args.docs} documents, emulator at {os.environ['FIRESTORE_EMULATOR_HOST']}")
+    print("=" * 64)
+
+    db = firestore.Client(project=PROJECT)
+    docs = documents(args.docs)
+
+    clear_emulator()
+    seconds, requests = legacy_writes(db, docs)
+    assert count_documents(db) == args.docs
+    sleeping = LEGACY_SLEEP * args.docs
+    print(f"   🐢 add() per document: {seconds:6.2f}s in {requests} requests, plus {sleeping:.0f}s of sleeping "
+          f"({args.docs / (seconds + sleeping):,.0f} docs/s as it ran)")
+
+    for batch_size in [int(size) for size in args.batch_sizes.split(',')]:
+        clear_emulator()
+        batch_seconds, commits = batched_writes(db, docs, batch_size)
+        assert count_documents(db) == args.docs
+        print(f"   ⚡ batches of {batch_size:3}:     {batch_seconds:6.2f}s in {commits} commits "
+              f"({args.docs / batch_seconds:,.0f} docs/s, {(seconds + sleeping) / batch_seconds:,.0f}x the old path)")
+    print(f"✅ All {args.docs} documents written at every batch size")
+
+    clear_emulator()
+    engine = FreezyAutomationEngine(connect_firebase=False)
+    engine.db = db
+    records = resources(args.docs)
+    for expected_saved in (args.docs, 0):
+        output = io.StringIO()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(output):
+            saved = engine.save_to_firebase(records)
+        seconds = time.perf_counter() - started
+        lines = output.getvalue().splitlines()
+        assert saved == expected_saved, (saved, expected_saved)
+        assert f"✅ Saved: {expected_saved}" in lines and f"⏭️  Duplicates: {args.docs - expected_saved}" in lines
+        titles = [line.split(': ', 1)[1] for line in lines if line.startswith(('✅ Saved (', '⏭️  Skipped duplicate:'))]
+        assert titles == [record.title for record in records], "log lines missing or out of order"
+        print(f"✅ save_to_firebase(): {saved} saved, {args.docs - saved} duplicates in {seconds:.2f}s, "
+              f"one log line per resource in order")
+    assert count_documents(db) == args.docs
+
+
+if __name__ == "__main__":
+    main()
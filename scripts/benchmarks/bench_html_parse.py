@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full-page html.parser soup vs targeted lxml card parsing
+Builds Rozee.pk- and Indeed-style listing pages (scripts, navigation,
+filters and footer around the job cards), then times and measures the
+old BeautifulSoup(content, 'html.parser').find_all(...) path against
+html_cards.parse_cards, and checks both extract the same jobs.
+
+Usage: python benchmarks/bench_html_parse.py [--cards 50] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_cards import parse_cards
+
+
+def page_chrome():
+    """Markup a real listing page carries around its cards"""
+    script = '<script>window.__STATE__ = {"filters": [' + ','.join(f'{{"id": {i}}}' for i in range(2000)) + ']};</script>'
+    nav = '<nav>' + ''.join(f'<a class="nav-link" href="/c/{i}">Category {i}</a>' for i in range(300)) + '</nav>'
+    filters = '<aside><ul>' + ''.join(f'<li><label><input type="checkbox" name="f{i}"> Filter {i}</label></li>' for i in range(400)) + '</ul></aside>'
+    footer = '<footer>' + ''.join(f'<p><a href="/page/{i}">Footer link {i}</a> &copy; 2024</p>' for i in range(300)) + '</footer>'
+    return f'<head><style>{"body{margin:0} " * 500}</style>{script}</head>', nav + filters, footer
+
+
+def build_rozee(count):
+    head, before, after = page_chrome()
+    cards = ''.join(
+        f'<div class="job-listing featured"><h3><a href="/job/{i}">Software Engineer {i}</a></h3>'
+        f'<span class="company-name">Company {i}</span><span class="location">Lahore</span>'
+        f'<p>Posted {i} days ago</p></div>'
+        for i in range(count)
+    )
+    return f'<!DOCTYPE html><html>{head}<body>{before}<main>{cards}</main>{after}</body></html>'.encode()
+
+
+def build_indeed(count):
+    head, before, after = page_chrome()
+    cards = ''.join(
+        f'<li><div class="cardOutline" data-jk="{i:016x}"><h2 class="jobTitle"><a>Remote Developer {i}</a></h2>'
+        f'<span class="companyName">Employer {i}</span><div data-testid="job-location">Remote</div></div></li>'
+        for i in range(count)
+    )
+    return f'<!DOCTYPE html><html>{head}<body>{before}<ul>{cards}</ul>{after}</body></html>'.encode()
+
+
+def rozee_fields(cards):
+    jobs = []
+    for card in cards:
+        title_elem = card.find('h3') or card.find('a', class_='job-title')
+        company_elem = card.find(class_='company-name') or card.find('span', class_='company')
+        location_elem = card.find(class_='location') or card.find('span', class_='job-location')
+        jobs.append((title_elem.get_text(strip=True), company_elem.get_text(strip=True), location_elem.get_text(strip=True)))
+    return jobs
+
+
+def indeed_fields(cards):
+    jobs = []
+    for card in cards:
+        title_elem = card.find('h2', class_='jobTitle') or card.find('a', {'data-jk': True})
+        company_elem = card.find('span', class_='companyName') or card.find('a', {'data-testid': 'company-name'})
+        location_elem = card.find('div', {'data-testid': 'job-location'}) or card.find('div', class_='companyLocation')
+        jobs.append((title_elem.get_text(strip=True), company_elem.get_text(strip=True), location_elem.get_text(strip=True)))
+    return jobs
+
+
+def measure(label, func, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label} {elapsed * 1000:8.2f} ms/page  {peak / 1e6:8.2f} MB peak")
+    return result
+
+
+def compare(title, page, name, attrs, limit, fields, repeat):
+    print(f"\n{title}: {len(page) / 1e3:.0f} KB page, first {limit} cards")
+    old = measure("   🐢 html.parser full page:   ",
+                  lambda: fields(BeautifulSoup(page, 'html.parser').find_all(name, attrs)[:limit]), repeat)
+    measure("   🌳 lxml full page:          ",
+            lambda: fields(BeautifulSoup(page, 'lxml').find_all(name, attrs)[:limit]), repeat)
+    new = measure("   🎯 parse_cards (lxml):      ",
+                  lambda: fields(parse_cards(page, name, attrs, limit=limit)), repeat)
+    assert old == new, f"{title}: targeted parse extracted different jobs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cards', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"🧩 HTML PARSE BENCHMARK: {args.cards} cards per page, {args.repeat} repeats")
+    print("=" * 64)
+
+    compare("Rozee.pk", build_rozee(args.cards), 'div', {'class': 'job-listing'}, 10, rozee_fields, args.repeat)
+    compare("Indeed", build_indeed(args.cards), 'div', {'data-jk': True}, 8, indeed_fields, args.repeat)
+    print("\n✅ Targeted parsing extracted the same jobs as the full-page parse")
+
+
+if __name__ == "__main__":
+    main()
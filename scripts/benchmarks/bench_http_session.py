@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: connection reuse of the shared HTTP session
+Compares a fresh connection per request (module-level requests.get, as the
+scrapers used to do) with the pooled HttpClient, counting TCP connections
+the server had to accept. Every request has its own URL (?i=N), so
+the pooled client's single-flight response store cannot merge them
+
+Usage: python benchmarks/bench_http_session.py [--requests 300]
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper_http import HttpClient
+from stub_server import StubServer
+
+
+def gzip_route(body):
+    """Serve body gzip-encoded, the way most job APIs do"""
+    compressed = gzip.compress(body)
+
+    def respond(handler):
+        if 'gzip' in handler.headers.get('Accept-Encoding', ''):
+            return 200, {'Content-Encoding': 'gzip'}, compressed
+        return 200, {}, body
+
+    return respond
+
+
+async def fetch_pooled(urls):
+    async with HttpClient() as http:
+        for url in urls:
+            (await http.get(url)).json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=300)
+    args = parser.parse_args()
+
+    body = json.dumps([{'position': f'Job {index}', 'description': 'x' * 500} for index in range(50)]).encode()
+
+    print("=" * 60)
+    print(f"🔌 HTTP SESSION BENCHMARK: {args.requests} sequential GETs to one host")
+    print("=" * 60)
+
+    with StubServer({'/api': gzip_route(body)}) as server:
+        urls = [server.url(f'/api?i={index}') for index in range(args.requests)]
+
+        started = time.perf_counter()
+        for url in urls:
+            requests.get(url, timeout=30).json()
+        elapsed = time.perf_counter() - started
+        print(f"🐢 requests.get per call: {elapsed:6.2f} s, {server.connections} connections, "
+              f"{sum(server.hits.values())} requests served")
+
+        server.connections = 0
+        server.hits.clear()
+        started = time.perf_counter()
+        asyncio.run(fetch_pooled(urls))
+        elapsed = time.perf_counter() - started
+        print(f"⚡ Pooled HttpClient:     {elapsed:6.2f} s, {server.connections} connections, "
+              f"{sum(server.hits.values())} requests served")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming JSON ingestion vs reading the whole API payload
+Serves a large RemoteOK-style array from a local stub server and takes the
+first N postings, once via response.json() on the full body and once via
+HttpClient.get_json_items, reporting bytes read, time and peak memory
+
+Usage: python benchmarks/bench_json_stream.py [--postings 1500] [--limit 16]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper_http import HttpClient
+from stub_server import StubServer
+
+
+def build_fixture(postings):
+    """Metadata row + postings with long HTML descriptions, like RemoteOK"""
+    paragraph = '<p>We are hiring a remote engineer to build <strong>distributed systems</strong>. ' * 60 + '</p>'
+    rows = [{'legal': 'API Terms of Service'}]
+    for index in range(postings):
+        rows.append({
+            'id': str(index),
+            'position': f'Senior Engineer {index}',
+            'company': f'Company {index % 97}',
+            'tags': ['python', 'aws', 'remote'],
+            'description': paragraph * 5,
+            'url': f'https://remoteok.io/remote-jobs/{index}',
+        })
+    return json.dumps(rows).encode()
+
+
+async def take_full(url, limit):
+    async with HttpClient() as http:
+        response = await http.get(url)
+        return response.json()[:limit], response.bytes_read
+
+
+async def take_streamed(url, limit):
+    async with HttpClient() as http:
+        response = await http.get_json_items(url, limit)
+        return response.json(), response.bytes_read
+
+
+def measure(label, coroutine_func, url, limit):
+    started = time.perf_counter()
+    items, bytes_read = asyncio.run(coroutine_func(url, limit))
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    asyncio.run(coroutine_func(url, limit))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label} {elapsed * 1000:8.1f} ms  {bytes_read / 1e6:8.2f} MB read  {peak / 1e6:8.2f} MB peak")
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--postings', type=int, default=1500)
+    parser.add_argument('--limit', type=int, default=16)
+    args = parser.parse_args()
+
+    body = build_fixture(args.postings)
+
+    print("=" * 72)
+    print(f"🌊 STREAMING JSON BENCHMARK: {len(body) / 1e6:.1f} MB payload, first {args.limit} items")
+    print("=" * 72)
+
+    with StubServer({'/api': body}) as server:
+        url = server.url('/api')
+        full = measure("📦 Full body + json():  ", take_full, url, args.limit)
+        streamed = measure("🌊 Streamed items:      ", take_streamed, url, args.limit)
+
+    assert full == streamed, "streamed items differ from the full parse"
+    print("✅ Streamed items identical to the full parse")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark: near-duplicate detection across sources at 100k resources
+Builds N job resources the way several boards list them: distinct
+postings with the titles companies really use ("Senior Backend
+Engineer", so many companies share a title), copies of some of them as
+another source lists them (work-mode title suffix, company suffix,
+different case and punctuation, an extra line, a few words changed) and
+sibling roles ("Senior Frontend Engineer" at the same company) that
+share their company's boilerplate description. Runs
+near_duplicates.NearDuplicates over all of them and checks which copies
+it caught (recall) and that no two distinct postings - siblings
+included - were merged (precision), next to the exact title + type
+check. Reports throughput, and the candidate pairs LSH compared against
+the N*(N-1)/2 pairs of comparing everything.
+
+Usage: python benchmarks/bench_near_duplicates.py [--resources 100000] [--copies 0.2] [--threshold 0.7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from near_duplicates import NearDuplicates
+from resource_record import ResourceRecord
+
+ROLES = ['Backend Engineer', 'Frontend Developer', 'Data Scientist', 'DevOps Engineer', 'Product Manager',
+         'UX Designer', 'Mobile Developer', 'QA Engineer', 'Security Analyst', 'Technical Writer',
+         'Support Specialist', 'Sales Executive', 'Marketing Lead', 'Data Engineer', 'Site Reliability Engineer']
+LEVELS = ['Junior', 'Mid-level', 'Senior', 'Staff', 'Principal', 'Lead']
+STACKS = ['', '', '', ' (Python)', ' (Go)', ' (Java)', ' (React)', ' (AWS)', ' (Node.js)', ' - Payments', ' - Platform']
+SOURCES = [('remoteok.io', 'auto_scraper_remoteok'), ('remoteok.io', 'auto_scraper_remoteok_api'),
+           ('weworkremotely.com', 'auto_scraper_weworkremotely'), ('adzuna.com', 'auto_scraper_adzuna')]
+
+
+class Corpus:
+    """Resources with a ground-truth posting number each"""
+
+    def __init__(self, count, copies, seed=7):
+        self.random = random.Random(seed)
+        self.words = [''.join(self.random.choices('abcdefghijklmnopqrstuvwxyz', k=self.random.randint(3, 9)))
+                      for _ in range(6000)]
+        self.resources, self.posting = [], []
+        # Sibling postings: another title at a company, with the description its first posting had
+        self.siblings = 0
+        boilerplates = {}
+        postings = 0
+        while len(self.resources) < count:
+            if self.resources and self.random.random() < copies:
+                # Another source's copy of an earlier posting
+                original = self.random.randrange(len(self.resources))
+                self.add(self.copy_of(self.resources[original]), self.posting[original])
+                continue
+            level, role, stack = self.random.choice(LEVELS), self.random.choice(ROLES), self.random.choice(STACKS)
+            company = f'{self.random.choice(self.words).title()}{self.random.choice(self.words)} ' \
+                      f'{self.random.choice(["Labs", "Systems", "Group"])}'
+            if boilerplates and self.random.random() < 0.2:
+                # A title the company has not posted yet, often the same level in another role
+                company = self.random.choice(list(boilerplates))
+                description, titles = boilerplates[company]
+                if self.random.random() < 0.5:
+                    level = next(iter(titles)).split()[0]
+                if f'{level} {role}{stack}' in titles:
+                    continue
+                self.siblings += 1
+            elif company not in boilerplates:
+                description = self.text(40, 160)
+                boilerplates[company] = (description, set())
+            else:
+                continue  # Name already taken by another company
+            title = f'{level} {role}{stack}'
+            boilerplates[company][1].add(title)
+            self.add(self.resource(title, company, description, postings), postings)
+            postings += 1
+
+    def text(self, low, high):
+        return ' '.join(self.random.choices(self.words, k=self.random.randint(low, high))) + '.'
+
+    def resource(self, title, company, description, number):
+        scraped_from, created_by = self.random.choice(SOURCES)
+        return ResourceRecord(title=title, type='job', company=company, description=description, location='Remote',
+                              source_url=f'https://{scraped_from}/jobs/{number}-{self.random.randint(0, 99)}',
+                              scraped_from=scraped_from, created_by=created_by)
+
+    def copy_of(self, original):
+        words = original.description.split()
+        for _ in range(self.random.randint(0, 3)):
+            words[self.random.randrange(len(words))] = self.random.choice(self.words)
+        description = ' '.join(words)
+        if self.random.random() < 0.5:
+            description = description.upper()
+        if self.random.random() < 0.5:
+            description += ' Apply now.'
+        title = original.title + self.random.choice(['', ' (Remote)', ' - Remote', ' - Full-time', '!'])
+        company = original.company + self.random.choice(['', ' Inc', ' Ltd'])
+        copy = self.resource(title, company, description, len(self.resources))
+        if self.random.random() < 0.3:
+            copy.source_url = f'https://{copy.scraped_from}'  # A board URL every posting shares
+        return copy
+
+    def add(self, resource, number):
+        self.resources.append(resource)
+        self.posting.append(number)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resources', type=int, default=100_000)
+    parser.add_argument('--copies', type=float, default=0.2, help='share of resources that copy an earlier one')
+    parser.add_argument('--threshold', type=float, default=0.7)
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"🧬 NEAR-DUPLICATES BENCHMARK: {args.resources:,} resources, {args.copies:.0%} copies, "
+          f"threshold {args.threshold}")
+    print("=" * 64)
+
+    corpus = Corpus(args.resources, args.copies)
+    resources, posting = corpus.resources, corpus.posting
+    expected = len(resources) - len(set(posting))
+
+    near = NearDuplicates(args.threshold)
+    started = time.perf_counter()
+    clusters = near.clusters_of(resources)
+    seconds = time.perf_counter() - started
+
+    merged_wrongly = sum(len({posting[index] for index in members}) > 1 for members in clusters)
+    caught = sum(len(members) - 1 for members in clusters if len({posting[index] for index in members}) == 1)
+    assert merged_wrongly == 0, f"{merged_wrongly} clusters merge different postings"
+
+    # The exact check drops every resource whose title and type came up before: a copy, or a real posting lost
+    exact, lost, titles, numbers = 0, 0, {}, set()
+    for resource, number in zip(resources, posting):
+        earlier = titles.setdefault((resource.title, resource.type), set())
+        if earlier:
+            exact += number in earlier
+            lost += number not in numbers
+        earlier.add(number)
+        numbers.add(number)
+
+    kept = near.dedupe(resources)
+    assert len(kept) == len(resources) - sum(len(members) - 1 for members in clusters)
+
+    pairs = len(resources) * (len(resources) - 1) // 2
+    print(f"✅ No distinct postings merged ({corpus.siblings:,} sibling roles share a company description); "
+          f"{caught:,} of {expected:,} copies caught ({caught / expected:.1%})")
+    print(f"   🔤 exact title + type match: {exact:,} copies caught ({exact / expected:.1%}), "
+          f"{lost:,} distinct postings dropped with them")
+    print(f"   ⚡ {len(resources) / seconds:,.0f} resources/s ({seconds:.2f}s), {near.bands} bands x {near.rows} rows, "
+          f"{near.compared:,} candidate pairs compared instead of {pairs:,}")
+    print(f"   🧹 dedupe(): {len(resources):,} -> {len(kept):,} resources, one per posting cluster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: paginated registry sources
+Serves a paged JSON job API from a local stub server with per-request
+latency, and compares reading only the first page (what every source
+did before) with reading up to --pages pages one at a time and a few
+at a time. Then checks each stop condition: running out of new items,
+reaching postings older than the last run, and the time budget.
+
+Usage: python benchmarks/bench_pagination.py [--pages 40] [--per-page 25] [--latency 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'
+
+from auto_scraper import clean_html_content
+from extraction import CompiledSource, PagedJobs
+from pagination import SourceWatermarks
+from rate_limiter import RateLimiter
+from scraper_http import HttpClient
+from stub_server import StubServer
+
+NEWEST = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def paged_api(total_pages, per_page):
+    """Route handler: page N of a newest-first job list, [] past the last page"""
+    def route(handler):
+        page = int(parse_qs(urlsplit(handler.path).query).get('page', ['1'])[0])
+        jobs = []
+        if page <= total_pages:
+            for offset in range(per_page):
+                index = (page - 1) * per_page + offset
+                jobs.append({
+                    'position': f'Engineer {index}',
+                    'company': f'Company {index % 97}',
+                    'url': f'https://jobs.example/{index}',
+                    'date': (NEWEST - timedelta(hours=index)).isoformat(),
+                    'description': f'<p>Remote role #{index}</p>',
+                })
+        return 200, {}, json.dumps(jobs).encode()
+    return route
+
+
+def spec(url, max_pages, concurrency):
+    return {
+        'name': 'Paged API',
+        'format': 'json',
+        'url': url,
+        'pages': {'param': 'page', 'max_pages': max_pages, 'concurrency': concurrency},
+        'posted': {'path': 'date'},
+        'fields': {
+            'title': {'path': 'position', 'required': True},
+            'description': {'path': 'description', 'clean': True},
+            'company': {'path': 'company'},
+            'source_url': {'path': 'url'},
+        },
+    }
+
+
+async def scrape(source, deadline=None, watermarks=None):
+    async with HttpClient(RateLimiter(rate=0), pool_per_host=0) as http:
+        return await source.scrape(http, deadline=deadline, watermarks=watermarks)
+
+
+def run(source, **kwargs):
+    started = time.perf_counter()
+    jobs = asyncio.run(scrape(source, **kwargs))
+    return jobs, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--per-page', type=int, default=25)
+    parser.add_argument('--latency', type=float, default=0.1, help='stub server delay per request (seconds)')
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"📄 PAGINATION BENCHMARK: up to {args.pages} pages of {args.per_page}, {args.latency * 1000:.0f} ms per request")
+    print("=" * 64)
+
+    routes = {'/jobs': paged_api(args.pages, args.per_page)}
+    with StubServer(routes, latency=args.latency) as stub:
+        url = stub.url('/jobs')
+
+        first_page, first_seconds = run(CompiledSource(spec(url, 1, 1), clean_html_content))
+        print(f"   1️⃣ first page only:        {len(first_page):6} jobs in {first_seconds:6.2f}s")
+
+        expected = None
+        for concurrency in (1, 4, 8):
+            jobs, seconds = run(CompiledSource(spec(url, args.pages, concurrency), clean_html_content))
+            titles = [job['title'] for job in jobs]
+            expected = expected or titles
+            assert titles == expected, "concurrent paging changed the jobs or their order"
+            print(f"   📚 {jobs.pages} pages, {concurrency} at a time: {len(jobs):6} jobs in {seconds:6.2f}s "
+                  f"({len(jobs) / seconds:,.0f} jobs/s, stopped: {jobs.stop_reason})")
+        assert len(expected) == args.pages * args.per_page
+        print("✅ Same jobs in the same order at every concurrency")
+
+        # Past the last page the API returns [] - paging stops there
+        jobs, _ = run(CompiledSource(spec(url, args.pages + 10, 4), clean_html_content))
+        assert jobs.stop_reason == 'no new items' and jobs.pages == args.pages + 1, (jobs.pages, jobs.stop_reason)
+        print(f"✅ Stops at the first empty page ({jobs.pages} pages read)")
+
+        with tempfile.TemporaryDirectory() as directory:
+            watermarks = SourceWatermarks(os.path.join(directory, 'watermarks.json'))
+            newer_than = args.per_page * 3 + 5  # last run saw everything from posting 3.2 pages down
+            watermarks.advance('Paged API', NEWEST - timedelta(hours=newer_than))
+            watermarks.save()
+            watermarks = SourceWatermarks(watermarks.path)
+
+            jobs, seconds = run(CompiledSource(spec(url, args.pages, 4), clean_html_content), watermarks=watermarks)
+            assert jobs.stop_reason == 'older than last run' and len(jobs) == newer_than, (len(jobs), jobs.stop_reason)
+            assert watermarks.pending['Paged API'] == NEWEST
+            print(f"✅ Stops at postings older than the last run: {len(jobs)} new jobs, {jobs.pages} pages in {seconds:.2f}s")
+
+        budget = args.latency * 4.5
+        source = CompiledSource(spec(url, args.pages, 2), clean_html_content)
+        jobs, seconds = run(source, deadline=time.monotonic() + budget)
+        assert isinstance(jobs, PagedJobs) and jobs.stop_reason == 'time budget', jobs.stop_reason
+        assert seconds < budget + args.latency, seconds
+        print(f"✅ Stops before the time budget ({budget:.2f}s): {len(jobs)} jobs from {jobs.pages} pages in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
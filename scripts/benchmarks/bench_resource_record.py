@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark: slotted ResourceRecord vs per-job dicts, at 100k records
+Builds N jobs from RemoteOK-style postings the old way (a 15-key dict
+with two datetime.now() calls each, copied into a nested resource_doc
+with four more) and the new way (CompiledSource records sharing the run
+timestamp, to_document()), checks the Firestore documents are the same
+apart from timestamps, and reports memory held by the scraped jobs,
+live allocations and time per stage.
+
+Usage: python benchmarks/bench_resource_record.py [--records 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'
+
+import sources
+from auto_scraper import clean_html_content
+from extraction import CompiledSource
+
+REMOTEOK = {**next(spec for spec in sources.WORLDWIDE_SOURCES if spec['name'] == 'RemoteOK API'), 'window': (0, None)}
+
+
+def legacy_job(job):
+    """The dict the RemoteOK API scraper used to build per posting"""
+    return {
+        'title': job.get('position', 'Remote Position'),
+        'type': 'job',
+        'description': clean_html_content(job.get('description', 'Remote job opportunity')),
+        'location': 'Remote/Worldwide',
+        'company': job.get('company', 'Remote Company'),
+        'source_url': job.get('url', 'https://remoteok.io'),
+        'requirements': ', '.join(job.get('tags', ['Remote work'])),
+        'benefits': 'Remote work, Flexible hours, Global team',
+        'status': 'active',
+        'created_at': datetime.now(),
+        'updated_at': datetime.now(),
+        'created_by': 'auto_scraper_remoteok_api',
+        'duration': 'Full-time',
+        'scraped_from': 'remoteok.io',
+        'location_type': 'Remote'
+    }
+
+
+def legacy_document(resource, access_level):
+    """resource_doc as save_to_firebase used to build it"""
+    return {
+        'metadata': {
+            'title': resource['title'],
+            'description': resource['description'],
+            'type': resource['type'],
+            'category': resource.get('category', 'General'),
+            'tags': resource.get('tags', []),
+            'source_url': resource.get('source_url', ''),
+            'created_at': resource.get('created_at', datetime.now()),
+            'updated_at': datetime.now()
+        },
+        'content': {
+            'company': resource.get('company', ''),
+            'location': resource.get('location', ''),
+            'duration': resource.get('duration', ''),
+            'requirements': resource.get('requirements', ''),
+            'benefits': resource.get('benefits', ''),
+            'salary_range': resource.get('salary_range', ''),
+            'application_deadline': resource.get('application_deadline', ''),
+            'contact_info': resource.get('contact_info', {})
+        },
+        'visibility': {
+            'status': 'active',
+            'access_level': access_level,
+            'is_featured': access_level == 'enterprise',
+            'priority_score': 100 if access_level == 'enterprise' else (80 if access_level == 'pro' else 60)
+        },
+        'status': 'active',
+        'analytics': {
+            'view_count': 0,
+            'save_count': 0,
+            'application_count': 0,
+            'last_updated': datetime.now()
+        },
+        'admin': {
+            'created_by': resource.get('created_by', 'auto_scraper'),
+            'approved_by': 'auto_scraper',
+            'approval_date': datetime.now(),
+            'scraped_from': resource.get('scraped_from', 'automated'),
+            'location_type': resource.get('location_type', 'General')
+        }
+    }
+
+
+def postings(count):
+    return [{'position': f'Engineer {index}', 'company': f'Company {index % 500}', 'url': f'https://remoteok.io/{index}',
+             'tags': ['python', 'remote'], 'description': f'Remote role number {index}'} for index in range(count)]
+
+
+def without_timestamps(document):
+    if isinstance(document, dict):
+        return {key: without_timestamps(value) for key, value in document.items()
+                if not isinstance(value, datetime)}
+    return document
+
+
+def measure(build):
+    """(result, seconds, bytes held, live allocations) of build(); timed (best of 3) without tracemalloc"""
+    seconds = float('inf')
+    for _ in range(3):
+        started = time.perf_counter()
+        build()
+        seconds = min(seconds, time.perf_counter() - started)
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    return result, seconds, held, sys.getallocatedblocks() - blocks
+
+
+def serialize(jobs, to_document):
+    seconds = float('inf')
+    for _ in range(3):
+        started = time.perf_counter()
+        for index, job in enumerate(jobs):
+            to_document(job, ('free', 'pro', 'enterprise')[index % 3])
+        seconds = min(seconds, time.perf_counter() - started)
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"🧱 RESOURCE RECORD BENCHMARK: {args.records:,} jobs")
+    print("=" * 64)
+
+    items = postings(args.records)
+    source = CompiledSource(REMOTEOK, clean_html_content)
+
+    old_jobs, old_seconds, old_bytes, old_blocks = measure(lambda: [legacy_job(item) for item in items])
+    new_jobs, new_seconds, new_bytes, new_blocks = measure(lambda: source.extract(items))
+    assert len(old_jobs) == len(new_jobs) == args.records
+
+    now = datetime.now()
+    for index in range(0, args.records, max(1, args.records // 1000)):
+        level = ('free', 'pro', 'enterprise')[index % 3]
+        old_document = without_timestamps(legacy_document(old_jobs[index], level))
+        new_document = without_timestamps(new_jobs[index].to_document(level, now))
+        assert old_document == new_document, (old_document, new_document)
+    assert len({id(job.created_at) for job in new_jobs}) == 1, "records should share the batch timestamp"
+    print("✅ Firestore documents identical apart from timestamps; one timestamp object per batch")
+
+    old_save = serialize(old_jobs, legacy_document)
+    new_save = serialize(new_jobs, lambda job, level: job.to_document(level, now))
+
+    print(f"\n📦 Scraped jobs held in memory:")
+    print(f"   🐢 dicts:            {old_bytes / 1e6:7.1f} MB, {old_blocks:10,} live allocations")
+    print(f"   ⚡ ResourceRecord:   {new_bytes / 1e6:7.1f} MB, {new_blocks:10,} live allocations  "
+          f"({old_bytes / new_bytes:.1f}x less memory)")
+    print(f"\n⏱️ Build:     {old_seconds:6.2f}s dicts vs {new_seconds:6.2f}s records")
+    print(f"⏱️ Serialize: {old_save:6.2f}s dicts vs {new_save:6.2f}s records (to_document)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Bloom filter of stored resources at 1M keys
+Fills a seen_filter.SeenFilter with N document IDs and compares it with
+the exact alternatives (a Python set of the IDs in memory, a SQLite
+table on disk like the seen-items store): memory / file size, load time
+and lookup cost for stored and new IDs, and the false-positive rate
+measured against the configured one. Then times extraction of a page of
+postings that are all stored already, with and without the filter.
+
+Usage: python benchmarks/bench_seen_filter.py [--keys 1000000] [--fp-rate 0.0001] [--lookups 200000]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'
+
+from auto_scraper import clean_html_content
+from extraction import CompiledSource
+from resource_record import resource_id
+from seen_filter import SeenFilter
+
+POSTINGS = 2000
+
+
+def document_ids(start, count):
+    return [resource_id('bench.example', f'https://jobs.example/{index}', f'Remote Engineer {index}', 'job',
+                        'Example Co', 'Remote')
+            for index in range(start, start + count)]
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def per_lookup(seconds, count):
+    return f"{seconds / count * 1e6:5.2f} µs"
+
+
+def sqlite_table(path, ids):
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE seen (key TEXT PRIMARY KEY)")
+    with db:
+        db.executemany("INSERT INTO seen (key) VALUES (?)", ((key,) for key in ids))
+    db.close()
+
+
+def sqlite_lookups(path, ids):
+    db = sqlite3.connect(path)
+    found = sum(db.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone() is not None for key in ids)
+    db.close()
+    return found
+
+
+def extraction_source():
+    spec = {
+        'name': 'Bench Board', 'format': 'json',
+        'fields': {
+            'title': {'path': 'title', 'required': True}, 'company': 'company',
+            'source_url': {'path': 'url'}, 'scraped_from': 'bench.example',
+            'description': {'path': 'description', 'clean': True},
+        },
+    }
+    return CompiledSource(spec, clean_html_content)
+
+
+def postings(count):
+    paragraph = '<p>Build <b>distributed</b> systems with <a href="#">our team</a>.</p>' * 12
+    return [{'title': f'Remote Engineer {index}', 'company': f'Company {index % 50}',
+             'url': f'https://jobs.example/{index}', 'description': f'<div>{paragraph}#{index}</div>'}
+            for index in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--keys', type=int, default=1_000_000, help='stored document IDs')
+    parser.add_argument('--fp-rate', type=float, default=0.0001, help='configured false-positive rate')
+    parser.add_argument('--lookups', type=int, default=200_000, help='stored and new IDs looked up each')
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"🌸 SEEN FILTER BENCHMARK: {args.keys:,} keys at {args.fp_rate:g} false positives")
+    print("=" * 64)
+
+    stored = document_ids(0, args.keys)
+    new = document_ids(args.keys, args.lookups)
+    probe = stored[::max(1, args.keys // args.lookups)][:args.lookups]
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Bloom filter
+        seen = SeenFilter(args.keys, args.fp_rate, os.path.join(directory, 'seen.bloom'))
+        _, add_seconds = timed(lambda: [seen.add(key) for key in stored])
+        _, save_seconds = timed(seen.save)
+        loaded, load_seconds = timed(SeenFilter.load, seen.path, args.keys, args.fp_rate)
+        hits, hit_seconds = timed(lambda: sum(key in loaded for key in probe))
+        false_positives, miss_seconds = timed(lambda: sum(key in loaded for key in new))
+        assert hits == len(probe), "a stored ID was not found"
+        filter_bytes = os.path.getsize(seen.path)
+
+        # Python set of the IDs
+        tracemalloc.start()
+        exact = set(stored)
+        set_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        _, set_hit_seconds = timed(lambda: sum(key in exact for key in probe))
+        del exact
+
+        # SQLite table keyed by the ID
+        path = os.path.join(directory, 'seen.sqlite3')
+        sqlite_table(path, stored)
+        sqlite_bytes = os.path.getsize(path)
+        found, sqlite_seconds = timed(sqlite_lookups, path, probe)
+        assert found == len(probe)
+
+    measured = false_positives / len(new)
+    print(f"✅ Every stored ID found; {false_positives} of {len(new):,} new IDs reported as stored "
+          f"({measured:.4%}, configured {args.fp_rate:.4%}, expected {loaded.expected_fp_rate():.4%})")
+    print(f"   {loaded.hashes} hashes, {loaded.bits:,} bits ({loaded.bits / args.keys:.1f} per key)")
+    print(f"   🌸 Bloom filter: {filter_bytes / 1e6:7.2f} MB, load {load_seconds * 1000:6.1f} ms, "
+          f"lookup {per_lookup(hit_seconds, len(probe))} stored / {per_lookup(miss_seconds, len(new))} new "
+          f"(add {per_lookup(add_seconds, args.keys)}, save {save_seconds * 1000:.0f} ms)")
+    print(f"   🐍 Python set:   {set_bytes / 1e6:7.2f} MB in memory, lookup {per_lookup(set_hit_seconds, len(probe))} "
+          f"(after building it from a stored list)")
+    print(f"   🗄️  SQLite table: {sqlite_bytes / 1e6:7.2f} MB on disk,  lookup {per_lookup(sqlite_seconds, len(probe))}")
+
+    source = extraction_source()
+    page = postings(POSTINGS)
+    records, plain_seconds = timed(source.extract, page)
+    page_filter = SeenFilter(args.keys, args.fp_rate)
+    for record in records:
+        page_filter.add(record.document_id())
+    kept, filtered_seconds = timed(source.extract, page, None, page_filter)
+    assert not kept and page_filter.skipped[source.name] == POSTINGS
+    print(f"✅ Extraction of {POSTINGS} stored postings: {plain_seconds * 1000:.0f} ms without the filter, "
+          f"{filtered_seconds * 1000:.0f} ms with it ({plain_seconds / filtered_seconds:.1f}x), none kept")
+
+
+if __name__ == "__main__":
+    main()
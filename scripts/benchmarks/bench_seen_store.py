@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Firestore reads for duplicate checks over several daily runs
+Against the Firestore emulator from firebase.json, seeds the resources
+collection, then runs save_to_firebase() once a day for D simulated
+days, each day with N scraped resources of which half were seen the day
+before: once with the preloaded index (one range query per save) and
+once with seen_store.SeenStore (rebuilt from Firestore on the first day,
+local afterwards). Checks both make the same decisions and reports the
+Firestore reads each spent.
+
+Start the emulator first (firebase emulators:start --only firestore),
+then:
+
+Usage: FIRESTORE_EMULATOR_HOST=localhost:8080 python benchmarks/bench_seen_store.py [--resources 500] [--recent 2000] [--days 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SCRAPER_DESCRIPTION_CACHE_SIZE'] = '0'
+os.environ['SCRAPER_SEEN_FILTER'] = ''
+
+from google.cloud import firestore
+
+from auto_scraper import FreezyAutomationEngine
+from bench_dedup_index import PROJECT, clear_emulator, seed
+from resource_record import ResourceRecord
+from seen_store import SeenStore
+
+
+def daily_resources(day, count):
+    """Half of them carried over from the day before, half new"""
+    return [ResourceRecord(title=f'Daily Role {day * count // 2 + index}', type='job', description='Bench',
+                           source_url=f'https://jobs.example/{day * count // 2 + index}', scraped_from='bench')
+            for index in range(count)]
+
+
+def run_days(db, days, count, seen):
+    """Per day: (saved, duplicates) and the Firestore reads its duplicate checks took"""
+    engine = FreezyAutomationEngine(connect_firebase=False)
+    engine.db = db
+    engine.seen = seen
+    outcomes, reads = [], 0
+    for day in range(days):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            saved = engine.save_to_firebase(daily_resources(day, count))
+        outcomes.append((saved, count - saved))
+        line = next(line for line in output.getvalue().splitlines() if line.startswith('🔎 Duplicate checks:'))
+        reads += int(line.split(': ', 1)[1].split()[0]) if seen is None else 0
+    if seen is not None:
+        reads = seen.reads
+    return outcomes, reads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resources', type=int, default=500, help='scraped resources per day')
+    parser.add_argument('--recent', type=int, default=2000, help='documents already created in the last 7 days')
+    parser.add_argument('--days', type=int, default=5, help='daily runs to simulate')
+    args = parser.parse_args()
+
+    if not os.getenv('FIRESTORE_EMULATOR_HOST'):
+        sys.exit("Set FIRESTORE_EMULATOR_HOST (e.g. localhost:8080) and start the emulator: "
+                 "firebase emulators:start --only firestore")
+
+    print("=" * 64)
+    print(f"🗃️  SEEN-ITEMS STORE BENCHMARK: {args.days} days x {args.resources} resources, {args.recent} recent documents")
+    print("=" * 64)
+
+    db = firestore.Client(project=PROJECT)
+    now = datetime.now()
+
+    clear_emulator()
+    seed(db, args.recent, 0, now)
+    started = time.perf_counter()
+    indexed, index_reads = run_days(db, args.days, args.resources, None)
+    index_seconds = time.perf_counter() - started
+
+    clear_emulator()
+    seed(db, args.recent, 0, now)
+    with tempfile.TemporaryDirectory() as directory:
+        store = SeenStore(os.path.join(directory, 'seen.sqlite3'))
+        started = time.perf_counter()
+        stored, store_reads = run_days(db, args.days, args.resources, store)
+        store_seconds = time.perf_counter() - started
+        store.close()
+
+    assert stored == indexed, (stored, indexed)
+    print(f"✅ Same saves and duplicates every day: {indexed}")
+    print(f"   🐢 index query per save:  {index_reads:7,} Firestore reads in {args.days} queries, {index_seconds:6.2f}s")
+    print(f"   ⚡ local seen-items store: {store_reads:7,} Firestore reads in 1 scan,      {store_seconds:6.2f}s "
+          f"(day 1 only, {store.queries} pages)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Local stub HTTP server for the scraper benchmarks
+Serves canned responses with an artificial per-request latency
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+    def handle_error(self, request, client_address):
+        # Streaming clients hang up once they have enough; that is expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubServer:
+    """Serve routes on 127.0.0.1 from a background thread.
+
+    routes maps a path to either raw bytes (served as 200) or a callable
+    taking the request handler and returning (status, headers, body).
+    POSTs are routed the same way, with the request body in handler.body.
+    """
+
+    def __init__(self, routes=None, latency=0.0, content_type='application/json'):
+        self.routes = dict(routes or {})
+        self.latency = latency
+        self.content_type = content_type
+        self.hits = Counter()
+        self.connections = 0
+        self._server = None
+        self._thread = None
+
+    def url(self, path):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+
+            def do_GET(self):
+                stub.hits[self.path] += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                route = stub.routes.get(self.path.split('?', 1)[0])
+                if route is None:
+                    status, headers, body = 404, {}, b'not found'
+                elif callable(route):
+                    status, headers, body = route(self)
+                else:
+                    status, headers, body = 200, {}, route
+
+                self.send_response(status)
+                self.send_header('Content-Type', headers.pop('Content-Type', stub.content_type))
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                self.do_GET()
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _StubHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Circuit breaker for scrape sources
+Remembers between daily runs which sources keep failing or finding
+nothing, skips them for a growing number of runs, then probes them again
+"""
+
+import json
+import os
+from datetime import datetime
+
+DEFAULT_HEALTH_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'source_health.json')
+
+
+class CircuitOpen(Exception):
+    """Raised instead of running a source whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Per-source closed / open / half-open state, persisted as JSON.
+
+    A source trips open after `threshold` consecutive bad runs (an error,
+    a cut-off, or zero jobs). It is then skipped for 1 run, and each
+    further trip doubles that, up to max_skip_runs. When the skips are
+    used up the next run is a half-open probe: one good run closes the
+    circuit, one bad run re-opens it with the longer backoff.
+    """
+
+    def __init__(self, path=DEFAULT_HEALTH_FILE, threshold=3, max_skip_runs=16):
+        self.path = path
+        self.threshold = threshold
+        self.max_skip_runs = max_skip_runs
+        self.sources = {}
+        self.load()
+
+    @classmethod
+    def from_env(cls):
+        """Breaker configured from SCRAPER_HEALTH_FILE / SCRAPER_BREAKER_*; None when the file is set to ''"""
+        path = os.getenv('SCRAPER_HEALTH_FILE', DEFAULT_HEALTH_FILE)
+        if not path:
+            return None
+
+        return cls(
+            path,
+            threshold=int(os.getenv('SCRAPER_BREAKER_THRESHOLD', '3')),
+            max_skip_runs=int(os.getenv('SCRAPER_BREAKER_MAX_SKIP', '16'))
+        )
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.sources = json.load(f)
+        except (OSError, ValueError):
+            self.sources = {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.sources, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _entry(self, source_name):
+        return self.sources.setdefault(source_name, {
+            'state': 'closed',
+            'consecutive_failures': 0,
+            'zero_yield_runs': 0,
+            'trips': 0,
+            'skip_runs': 0,
+        })
+
+    def allow(self, source_name):
+        """Whether to run the source this time; uses up one skip of an open circuit"""
+        entry = self.sources.get(source_name)
+        if not entry or entry['state'] != 'open':
+            return True
+
+        if entry['skip_runs'] > 0:
+            entry['skip_runs'] -= 1
+            return False
+
+        entry['state'] = 'half_open'
+        return True
+
+    def describe(self, source_name):
+        entry = self.sources.get(source_name, {})
+        return (f"circuit open after {entry.get('consecutive_failures', 0)} failures / "
+                f"{entry.get('zero_yield_runs', 0)} empty runs, "
+                f"next probe in {entry.get('skip_runs', 0) + 1} runs")
+
+    def record(self, source_name, outcome):
+        """Record a run of the source: outcome is 'ok', 'zero' or 'failed'"""
+        entry = self._entry(source_name)
+        entry['updated_at'] = datetime.now().isoformat(timespec='seconds')
+
+        if outcome == 'ok':
+            entry.update(state='closed', consecutive_failures=0, zero_yield_runs=0, trips=0, skip_runs=0)
+            return
+
+        if outcome == 'zero':
+            entry['zero_yield_runs'] += 1
+        else:
+            entry['consecutive_failures'] += 1
+
+        bad_runs = entry['consecutive_failures'] + entry['zero_yield_runs']
+        if entry['state'] == 'half_open' or bad_runs >= self.threshold:
+            entry['trips'] += 1
+            entry['state'] = 'open'
+            entry['skip_runs'] = min(2 ** (entry['trips'] - 1), self.max_skip_runs)
+
+    def open_sources(self):
+        return sorted(name for name, entry in self.sources.items() if entry['state'] == 'open')
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Process pool for the CPU half of scraping
+The event loop fetches; card parsing, field extraction and description
+cleaning of each payload run in worker processes, so a run can use more
+than one core. Each source awaits its own result, so order is unchanged.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from description_cache import DescriptionCache
+from extraction import CompiledSource
+from html_text import html_to_text
+
+# Worker process state, set up by _init_worker
+_LIMITS = {}
+_DEFAULT_LIMIT = 1000
+_CACHE = None
+_SEEN = None
+_SOURCES = {}
+
+
+def _init_worker(limits, default_limit, cache_config, seen):
+    global _LIMITS, _DEFAULT_LIMIT, _CACHE, _SEEN
+    _LIMITS = limits
+    _DEFAULT_LIMIT = default_limit
+    _SEEN = seen
+    if seen is not None:
+        seen.skipped.clear()  # Counted by the parent process already
+    if cache_config is not None:
+        max_entries, db_path, max_age_days = cache_config
+        _CACHE = DescriptionCache(max_entries, db_path=db_path, max_age_days=max_age_days)
+
+
+def _clean(text, resource_type='job'):
+    """clean_html_content as set up in the parent process"""
+    if not text:
+        return ""
+
+    limit = _LIMITS.get(resource_type, _DEFAULT_LIMIT)
+    if _CACHE is None:
+        return html_to_text(text, limit)
+    return _CACHE.get(text, limit, html_to_text)
+
+
+def _process(spec, payload, now, with_posted, filtered):
+    source = _SOURCES.get(spec['name'])
+    if source is None or source.spec != spec:
+        source = _SOURCES[spec['name']] = CompiledSource(spec, _clean)
+    seen = _SEEN if filtered else None
+    result = source.process(payload, now, with_posted, seen)
+    skipped = seen.skipped.pop(source.name, 0) if seen is not None else 0
+    return result, (_CACHE.drain() if _CACHE is not None else None), skipped
+
+
+class CpuStage:
+    """Worker processes that run CompiledSource.process() for the event loop.
+
+    Workers compile each source from its spec once, clean descriptions
+    with the same length limits, and read the same description cache file;
+    what they clean is merged back into the parent's cache for save().
+    Each worker gets a copy of the seen filter as it was when the pool
+    started (it only changes when resources are saved, after scraping).
+    """
+
+    def __init__(self, workers, description_limits=None, default_limit=1000, cache=None, seen=None):
+        self.workers = workers
+        self.description_limits = description_limits or {}
+        self.default_limit = default_limit
+        self.cache = cache
+        self.seen = seen
+        self.pool = None
+
+    @classmethod
+    def from_env(cls, description_limits=None, default_limit=1000, cache=None, seen=None):
+        """Stage with SCRAPER_CPU_WORKERS processes (default: one per core but one); None when that is 0"""
+        workers = int(os.getenv('SCRAPER_CPU_WORKERS', str((os.cpu_count() or 1) - 1)))
+        if workers <= 0:
+            return None
+        return cls(workers, description_limits, default_limit, cache, seen)
+
+    def start(self):
+        if self.pool is not None:
+            return
+        cache_config = None
+        if self.cache is not None:
+            cache_config = (self.cache.max_entries, self.cache.db_path, self.cache.max_age / (24 * 3600))
+        # Not fork: the parent has the event loop's threads running
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self.pool = ProcessPoolExecutor(
+            self.workers, mp_context=context, initializer=_init_worker,
+            initargs=(self.description_limits, self.default_limit, cache_config, self.seen)
+        )
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def run(self, source, payload, now, with_posted=False, seen=None):
+        """source.process(payload, now, with_posted, seen) in a worker process (seen: the stage's filter or None)"""
+        self.start()
+        loop = asyncio.get_running_loop()
+        result, cache_delta, skipped = await loop.run_in_executor(
+            self.pool, _process, source.spec, payload, now, with_posted, seen is not None and self.seen is not None
+        )
+        if cache_delta is not None and self.cache is not None:
+            self.cache.merge(cache_delta)
+        if seen is not None:
+            seen.skipped[source.name] += skipped
+        return result
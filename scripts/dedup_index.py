@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - In-memory duplicate index for saving resources
+Loads the (title, type) of every recently created resource with one
+projected range query, so each duplicate check is a set lookup instead
+of two Firestore queries
+"""
+
+from datetime import timedelta
+
+
+class DedupIndex:
+    """(title, type) signatures of the resources created in the last window_days.
+
+    load() reads them in one query on metadata.created_at, fetching only
+    the two fields. add() records a resource saved during this run, so a
+    repeat later in the same save is a duplicate too.
+    """
+
+    def __init__(self, signatures=(), reads=0):
+        self.signatures = set(signatures)
+        # Firestore document reads spent loading the index (a query that matches nothing costs one)
+        self.reads = reads
+
+    @classmethod
+    def load(cls, db, now, window_days=7, collection='resources'):
+        query = db.collection(collection).where(
+            'metadata.created_at', '>', now - timedelta(days=window_days)
+        ).select(['metadata.title', 'metadata.type'])
+
+        signatures, documents = set(), 0
+        for doc in query.stream():
+            documents += 1
+            metadata = doc.to_dict().get('metadata', {})
+            signatures.add((metadata.get('title'), metadata.get('type')))
+        return cls(signatures, reads=max(1, documents))
+
+    def __contains__(self, signature):
+        return signature in self.signatures
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def add(self, signature):
+        self.signatures.add(signature)
+
+    def discard(self, signature):
+        self.signatures.discard(signature)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Memo cache for cleaned job descriptions
+Keyed by a hash of the raw HTML, so a description shared by several
+sources, or unchanged since yesterday's run, is only cleaned once
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'descriptions.sqlite3')
+
+
+class DescriptionCache:
+    """Bounded in-memory LRU in front of an optional SQLite file.
+
+    get(text, limit, clean) returns clean(text, limit), computing it only
+    when neither tier has it. Disk entries unused for max_age_days are
+    dropped by save().
+    """
+
+    def __init__(self, max_entries=4096, db_path=DEFAULT_DB_PATH, max_age_days=14):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.max_age = max_age_days * 24 * 3600
+        self._memory = OrderedDict()
+        self._db = None
+        self._used = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.clean_seconds = 0.0
+
+    @classmethod
+    def from_env(cls):
+        """Cache configured from SCRAPER_DESCRIPTION_CACHE*; None when the memory size is 0"""
+        max_entries = int(os.getenv('SCRAPER_DESCRIPTION_CACHE_SIZE', '4096'))
+        if max_entries <= 0:
+            return None
+
+        return cls(
+            max_entries,
+            db_path=os.getenv('SCRAPER_DESCRIPTION_CACHE', DEFAULT_DB_PATH) or None,
+            max_age_days=float(os.getenv('SCRAPER_DESCRIPTION_CACHE_MAX_AGE_DAYS', '14'))
+        )
+
+    @staticmethod
+    def key(text, limit):
+        return hashlib.sha256(f"{limit}\0{text}".encode('utf-8')).digest()
+
+    def _connect(self):
+        if self._db is None and self.db_path:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.db_path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions (key BLOB PRIMARY KEY, text TEXT NOT NULL, used_at REAL NOT NULL)"
+            )
+        return self._db
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, text, limit, clean):
+        key = self.key(text, limit)
+
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+
+        db = self._connect()
+        if db is not None:
+            row = db.execute("SELECT text FROM descriptions WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._used[key] = None
+                self._remember(key, row[0])
+                self.disk_hits += 1
+                return row[0]
+
+        started = time.perf_counter()
+        value = clean(text, limit)
+        self.clean_seconds += time.perf_counter() - started
+        self.misses += 1
+
+        self._used[key] = value
+        self._remember(key, value)
+        return value
+
+    def drain(self):
+        """Hand over this run's new / reused entries and counters (from a worker process) and reset them"""
+        delta = (self._used, self.hits, self.disk_hits, self.misses, self.clean_seconds)
+        self._used = {}
+        self.hits = self.disk_hits = self.misses = 0
+        self.clean_seconds = 0.0
+        return delta
+
+    def merge(self, delta):
+        """Take in what drain() returned in a worker, so save() and report() cover it"""
+        used, hits, disk_hits, misses, clean_seconds = delta
+        for key, value in used.items():
+            if value is not None or key not in self._used:
+                self._used[key] = value
+            if value is not None:
+                self._remember(key, value)
+        self.hits += hits
+        self.disk_hits += disk_hits
+        self.misses += misses
+        self.clean_seconds += clean_seconds
+
+    def save(self):
+        """Write new entries, refresh the ones used this run and drop stale ones"""
+        db = self._connect()
+        if db is None:
+            return
+
+        now = time.time()
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO descriptions (key, text, used_at) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in self._used.items() if value is not None]
+            )
+            db.executemany(
+                "UPDATE descriptions SET used_at = ? WHERE key = ?",
+                [(now, key) for key, value in self._used.items() if value is None]
+            )
+            db.execute("DELETE FROM descriptions WHERE used_at < ?", (now - self.max_age,))
+        self._used = {}
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def report(self):
+        """One-line hit rate and estimated cleaning time saved, or '' if unused"""
+        lookups = self.hits + self.disk_hits + self.misses
+        if not lookups:
+            return ''
+
+        saved = (self.hits + self.disk_hits) * (self.clean_seconds / self.misses if self.misses else 0.0)
+        return (f"{self.hits + self.disk_hits}/{lookups} hits ({(self.hits + self.disk_hits) / lookups:.0%}, "
+                f"{self.disk_hits} from previous runs), ~{saved * 1000:.0f} ms of cleaning saved")
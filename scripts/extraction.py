@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Generic extraction engine for the source registry
+Compiles the source definitions in sources.py once (field paths split,
+HTML selectors built as SoupStrainers) and turns fetched pages, API
+payloads and feeds into job resources with them
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from functools import partial
+from urllib.parse import urljoin
+
+from bs4 import SoupStrainer
+
+from api_request import ApiRequest
+from html_cards import parse_cards
+from pagination import Pagination, parse_posted
+from resource_record import ResourceRecord
+from scraper_http import BROWSER_HEADERS
+
+_SLOTS = ResourceRecord.__slots__
+_CREATED_AT = _SLOTS.index('created_at')
+_UPDATED_AT = _SLOTS.index('updated_at')
+# What ResourceRecord.document_id() is made of
+_ID_SLOTS = frozenset(_SLOTS.index(name) for name in ('title', 'type', 'source_url', 'scraped_from', 'company', 'location'))
+
+# Fields every job gets unless its source says otherwise
+JOB_DEFAULTS = {
+    'type': 'job',
+    'status': 'active',
+    'duration': 'Full-time',
+}
+
+_MISSING = object()
+
+
+class UnchangedJobs(list):
+    """No jobs because the source answered 304 - not the same as a source that came back empty"""
+
+
+class StoredJobs(list):
+    """No jobs because every posting was already stored (seen filter) - the source itself answered fine"""
+
+
+class PagedJobs(list):
+    """Jobs from several pages, with how many were read and why paging stopped"""
+
+    def __init__(self, jobs=(), pages=0, stop_reason='page limit'):
+        super().__init__(jobs)
+        self.pages = pages
+        self.stop_reason = stop_reason
+
+
+class SourceError(Exception):
+    """A source answered, but not with anything that can be extracted"""
+
+
+def _split_path(path):
+    return tuple(int(key) if key.isdigit() else key for key in path.split('.'))
+
+
+def _lookup(item, path):
+    for key in path:
+        try:
+            item = item[key]
+        except (KeyError, IndexError, TypeError):
+            return _MISSING
+    return item
+
+
+def _select(card, strainers, attr):
+    for strainer in strainers:
+        element = card.find(strainer)
+        if element is not None:
+            return element.get(attr, _MISSING) if attr else element.get_text(strip=True)
+    return _MISSING
+
+
+class Field:
+    """One compiled field definition: item -> value, or _MISSING for a required field that is absent, null or blank"""
+
+    def __init__(self, definition, clean):
+        if not isinstance(definition, dict):
+            definition = {'value': definition}
+        self.value = definition.get('value', _MISSING)
+        self.path = _split_path(definition['path']) if 'path' in definition else None
+        self.strainers = [SoupStrainer(name, attrs) for name, attrs in definition.get('select', ())]
+        self.attr = definition.get('attr')
+        self.default = definition.get('default')
+        self.required = definition.get('required', False)
+        self.join = definition.get('join')
+        self.before = definition.get('before')
+        self.after = definition.get('after')
+        self.base = definition.get('base')
+        self.clean = clean if definition.get('clean') else None
+        self.template = definition.get('template')
+        self.values = {name: Field(value, clean) for name, value in definition.get('values', {}).items()}
+        self.constant = self.value is not _MISSING
+        if self.path is not None and len(self.path) == 1 and not self.required and not (
+                self.join or self.before or self.after or self.base or self.clean or self.template):
+            # Plain 'key' with a default, the most common field: skip the general path
+            self.key = self.path[0]
+            self.extract = self.extract_key
+
+    def extract_key(self, item, job):
+        try:
+            return item[self.key]
+        except (KeyError, IndexError, TypeError):
+            return self.default
+
+    def extract(self, item, job):
+        if self.template is not None:
+            values = {name: field.extract(item, job) for name, field in self.values.items()}
+            if any(value is None for value in values.values()):
+                return self.default
+            return self.template.format_map({**job, **values})
+
+        if self.path is not None:
+            value = _lookup(item, self.path)
+        elif self.strainers:
+            value = _select(item, self.strainers, self.attr)
+        else:
+            value = self.value
+
+        if self.required and (value is _MISSING or value is None or (isinstance(value, str) and not value.strip())):
+            return _MISSING
+        if value is _MISSING:
+            value = self.default
+
+        if self.before is not None:
+            value = value.split(self.before, 1)[0].strip() if self.before in value else self.default
+        elif self.after is not None and self.after in value:
+            value = value.split(self.after, 1)[1].strip()
+
+        if self.join is not None:
+            value = self.join.join(value)
+        if self.base is not None and value:
+            value = urljoin(self.base, value)
+        if self.clean is not None:
+            value = self.clean(value)
+        return value
+
+
+class CompiledSource:
+    """A registry source ready to run.
+
+    I/O stage: fetch(), then payload(response) for the raw page or items.
+    CPU stage: process(payload, now), i.e. parse() and extract(), either
+    inline or in a cpu_stage.CpuStage worker process. Given a
+    seen_filter.SeenFilter, extraction drops the postings whose document
+    ID is in it as soon as that ID is known, before the other fields.
+    """
+
+    def __init__(self, spec, clean):
+        self.spec = spec
+        self.name = spec['name']
+        self.format = spec['format']
+        self.url = spec.get('url')
+        self.timeout = spec.get('timeout')
+        self.limit = spec.get('limit')
+        self.window = slice(*spec['window']) if 'window' in spec else slice(None)
+        self.read_items = spec.get('read_items', self.window.stop)
+        self.cards = spec.get('cards')
+        self.static_items = spec.get('items', [])
+        # HTML boards get browser headers and the host's robots.txt Crawl-delay
+        self.headers = spec.get('headers', BROWSER_HEADERS if self.format == 'html' else None)
+        self.pagination = Pagination.from_spec(spec)
+        # JSON APIs: how to request a page, where its postings are, how many a full page has
+        self.request = ApiRequest(spec) if self.format == 'api' else None
+        self.results = _split_path(spec['results']) if spec.get('results') else ()
+        self.page_size = spec.get('page_size')
+
+        fields = {**JOB_DEFAULTS, **spec['fields']}
+        unknown = [key for key in fields if key not in _SLOTS]
+        if unknown:
+            raise ValueError(f"{self.name}: {', '.join(unknown)} not ResourceRecord fields")
+
+        # Descriptions are cut at the limit for the source's resource type (a constant 'type' field)
+        resource_type = fields['type']
+        if isinstance(resource_type, dict):
+            resource_type = resource_type.get('value', JOB_DEFAULTS['type'])
+        clean = partial(clean, resource_type=resource_type)
+        self.posted = Field(spec['posted'], clean) if 'posted' in spec else None
+
+        # Records are built positionally from a row in slot order; constants
+        # are filled in here once, the other fields per posting
+        compiled = [(_SLOTS.index(key), Field(definition, clean)) for key, definition in fields.items()]
+        self.row = [None] * len(_SLOTS)
+        for index, field in compiled:
+            if field.constant:
+                self.row[index] = field.value
+        # Templates are filled in from the other fields, so they go last
+        fields = [(index, field) for index, field in compiled if field.template is None and not field.constant]
+        self.templates = [(index, field) for index, field in compiled if field.template is not None]
+        # The fields of the document ID come first, so a seen posting costs only those
+        self.id_fields = [(index, field) for index, field in fields if index in _ID_SLOTS]
+        self.fields = [(index, field) for index, field in fields if index not in _ID_SLOTS]
+        self.id_from_template = any(index in _ID_SLOTS for index, _ in self.templates)
+
+    async def fetch(self, http, url=None):
+        """Fetch the source (or one page of it), reading streamed formats only as far as they are used"""
+        if self.format == 'html':
+            return await http.get(url or self.url, headers=self.headers, timeout=self.timeout, robots=True)
+        if self.format == 'json' and url:
+            return await http.get(url, headers=self.headers, timeout=self.timeout, conditional=True)
+        if self.format == 'json':
+            return await http.get_json_items(self.url, self.read_items, headers=self.headers,
+                                             timeout=self.timeout, conditional=True)
+        if self.format == 'rss':
+            return await http.get_feed_items(self.url, self.limit, headers=self.headers,
+                                             timeout=self.timeout, conditional=True)
+        if self.format == 'api':
+            return await self.request.fetch(http, self.pagination.page_number(0) if self.pagination else 1,
+                                            timeout=self.timeout)
+        raise SourceError(f"unknown source format {self.format!r}")
+
+    async def fetch_page(self, http, index, cursor=None):
+        """Fetch the index-th page (0-based) of a paginated source"""
+        if self.format == 'api':
+            return await self.request.fetch(http, self.pagination.page_number(index), cursor, timeout=self.timeout)
+        return await self.fetch(http, self.pagination.page_url(self.url, index))
+
+    def payload(self, response):
+        """What the CPU stage needs from a response: the page bytes (html) or the items (json, rss, api)"""
+        if response.status_code != 200:
+            # API URLs may carry a key, so those are named by source instead
+            raise SourceError(f"HTTP {response.status_code} from {self.name if self.request else response.url}")
+        if self.format == 'html':
+            return response.content
+        if self.format == 'json':
+            return [item for item in response.json()[self.window] if isinstance(item, dict)]
+        if self.format == 'api':
+            items = _lookup(response.json(), self.results)
+            if not isinstance(items, list):
+                raise SourceError(f"{self.name}: no '{'.'.join(map(str, self.results))}' list in the response")
+            return [item for item in items if isinstance(item, dict)]
+        return response.items[:self.limit]
+
+    def next_cursor(self, response):
+        """Cursor of the page after this response, or None on the last page"""
+        cursor = _lookup(response.json(), _split_path(self.pagination.cursor))
+        return None if cursor is _MISSING or cursor in (None, '') else cursor
+
+    def parse(self, payload):
+        """The postings in a payload, before field extraction"""
+        if self.format == 'html':
+            return parse_cards(payload, *self.cards, limit=self.limit)
+        return payload
+
+    def items(self, response):
+        """The postings of a fetched response, before field extraction"""
+        return self.parse(self.payload(response))
+
+    def stamped_row(self, now):
+        """The constant part of every record of a batch, with the batch timestamp"""
+        row = self.row.copy()
+        row[_CREATED_AT] = row[_UPDATED_AT] = now
+        return row
+
+    def is_seen(self, row, seen):
+        if ResourceRecord(*row).document_id() in seen:
+            seen.skipped[self.name] += 1
+            return True
+        return False
+
+    def build(self, item, base_row, seen=None):
+        """One ResourceRecord from one posting, or None when a required field is missing
+        or its document ID is in seen.
+
+        base_row comes from stamped_row(), so records of a batch share its timestamp.
+        """
+        row = base_row.copy()
+        for index, field in self.id_fields:
+            value = field.extract(item, None)
+            if value is _MISSING:
+                return None
+            row[index] = value
+        if seen is not None and not self.id_from_template and self.is_seen(row, seen):
+            return None
+        for index, field in self.fields:
+            value = field.extract(item, None)
+            if value is _MISSING:
+                return None
+            row[index] = value
+        if self.templates:
+            job = {name: value for name, value in zip(_SLOTS, row) if value is not None}
+            for index, field in self.templates:
+                row[index] = field.extract(item, job)
+            if seen is not None and self.id_from_template and self.is_seen(row, seen):
+                return None
+        return ResourceRecord(*row)
+
+    def try_build(self, item, base_row, seen=None):
+        """build(), with postings that fail to extract skipped (None)"""
+        try:
+            return self.build(item, base_row, seen)
+        except Exception:
+            return None
+
+    def extract(self, items, now=None, seen=None):
+        """Records for every posting that has its required fields, all stamped with now (default: this call)"""
+        base_row = self.stamped_row(now or datetime.now())
+        records = []
+        for item in items:
+            record = self.try_build(item, base_row, seen)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def process(self, payload, now, with_posted=False, seen=None):
+        """CPU stage: records for a payload, or (posted, record or None) per posting with with_posted"""
+        items = self.parse(payload)
+        if not with_posted:
+            return self.extract(items, now, seen)
+        base_row = self.stamped_row(now)
+        return [(self.posted_at(item), self.try_build(item, base_row, seen)) for item in items]
+
+    async def process_async(self, payload, now, cpu=None, with_posted=False, seen=None):
+        """process() in the CPU stage's worker processes, or inline without one"""
+        if cpu is None:
+            return self.process(payload, now, with_posted, seen)
+        return await cpu.run(self, payload, now, with_posted, seen)
+
+    def posted_at(self, item):
+        """When a posting was published (aware UTC datetime), if the source says"""
+        if self.posted is None:
+            return None
+        try:
+            return parse_posted(self.posted.extract(item, {}))
+        except Exception:
+            return None
+
+    async def scrape(self, http, deadline=None, watermarks=None, now=None, cpu=None, seen=None):
+        """Jobs from this source; UnchangedJobs when it answered 304, StoredJobs when
+        every posting it returned was dropped as already stored.
+
+        Every record is stamped with now (default: when the scrape started).
+        Pages are parsed and extracted by cpu (a CpuStage) if given, and
+        postings already stored according to seen (a SeenFilter) dropped.
+        Paginated sources come back as PagedJobs. deadline (time.monotonic())
+        and watermarks (pagination.SourceWatermarks) only matter for them.
+        """
+        now = now or datetime.now()
+        skipped = seen.skipped[self.name] if seen is not None else 0
+        if self.format == 'static':
+            jobs = self.extract(self.static_items, now, seen)
+        elif self.pagination is not None:
+            jobs = await self.scrape_pages(http, deadline, watermarks, now, cpu, seen)
+        else:
+            response = await self.fetch(http)
+            if response.not_modified:
+                return UnchangedJobs()  # Same payload as the last run, nothing new to parse
+            jobs = await self.process_async(self.payload(response), now, cpu, seen=seen)
+
+        if not jobs and not isinstance(jobs, UnchangedJobs) and seen is not None and seen.skipped[self.name] > skipped:
+            return StoredJobs()
+        return jobs
+
+    async def scrape_pages(self, http, deadline=None, watermarks=None, now=None, cpu=None, seen=None):
+        """Read pages `concurrency` at a time, in order, until a stop condition.
+
+        Paging stops at max_pages, at a page with no jobs that earlier pages
+        did not already have, at a page that reaches postings no newer than
+        the last run's newest (listings are newest first), once max_items
+        jobs are in, at the last page (fewer than page_size postings, or no
+        next cursor), or when another round of pages would not finish before
+        the deadline. Pages fetched past the stop are ignored, so the result
+        is the same as reading one page at a time. A page whose postings are
+        all in seen counts as a page with no new jobs.
+        """
+        pages = self.pagination
+        now = now or datetime.now()
+        since = watermarks.since(self.name) if watermarks else None
+        jobs = PagedJobs()
+        keys = set()
+        round_seconds = 0.0
+        cursor = None
+
+        for first in range(0, pages.max_pages, pages.concurrency):
+            if deadline is not None and time.monotonic() + round_seconds >= deadline:
+                jobs.stop_reason = 'time budget'
+                return jobs
+
+            indexes = range(first, min(first + pages.concurrency, pages.max_pages))
+            started = time.monotonic()
+            responses = await asyncio.gather(
+                *(self.fetch_page(http, index, cursor) for index in indexes), return_exceptions=True
+            )
+            round_seconds = time.monotonic() - started
+
+            # Pages up to the first failed or unchanged one go to the CPU stage together
+            payloads, stop_reason = [], None
+            for index, response in zip(indexes, responses):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    if response.not_modified:
+                        if index == 0:
+                            return UnchangedJobs()  # First page as it was last run, nothing new behind it
+                        stop_reason = 'no new items'
+                        break
+                    payloads.append(self.payload(response))
+                    if pages.cursor:
+                        cursor = self.next_cursor(response)
+                        if cursor is None:
+                            stop_reason = 'last page'
+                            break
+                except Exception as e:
+                    if index == 0:
+                        raise
+                    stop_reason = f'page {index + 1} failed: {e}'
+                    break
+            processed = await asyncio.gather(
+                *(self.process_async(payload, now, cpu, with_posted=True, seen=seen) for payload in payloads)
+            )
+
+            for postings in processed:
+                jobs.pages += 1
+                new_jobs, reached_old = 0, False
+                for posted, job in postings:
+                    if since is not None and posted is not None and posted <= since:
+                        reached_old = True
+                        continue
+                    if job is None:
+                        continue
+                    key = tuple(value for key, value in job.items() if key not in ('created_at', 'updated_at'))
+                    if key in keys:
+                        continue
+                    keys.add(key)
+                    jobs.append(job)
+                    new_jobs += 1
+                    if watermarks:
+                        watermarks.advance(self.name, posted)
+                    if pages.max_items is not None and len(jobs) >= pages.max_items:
+                        jobs.stop_reason = 'item budget'
+                        return jobs
+
+                if reached_old:
+                    jobs.stop_reason = 'older than last run'
+                    return jobs
+                if not new_jobs:
+                    jobs.stop_reason = 'no new items'
+                    return jobs
+                if self.page_size and len(postings) < self.page_size:
+                    jobs.stop_reason = 'last page'
+                    return jobs
+
+            if stop_reason:
+                jobs.stop_reason = stop_reason
+                return jobs
+
+        return jobs
+
+
+def compile_sources(specs, clean):
+    """CompiledSource for each registry entry, in order"""
+    return [CompiledSource(spec, clean) for spec in specs]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Batched Firestore writes
+Queues new documents and commits them in WriteBatches instead of one
+round trip per document, while still reporting each document's outcome
+"""
+
+import os
+
+from google.api_core.exceptions import AlreadyExists
+
+# Firestore refuses batches of more than 500 writes
+MAX_BATCH_SIZE = 500
+
+
+class BatchWriter:
+    """Creates documents in a collection, batch_size per commit.
+
+    add(document, done, doc_id) queues a document under doc_id (default:
+    a new auto ID); once it is written, done(None) is called, or
+    done(error) if it was not - AlreadyExists when the ID is taken. The
+    queue is committed as soon as it holds batch_size documents, and by
+    flush(). A commit that fails writes nothing. When it failed because
+    documents exist already, the batch is looked up with one get_all()
+    and the others are committed again as one batch; after any other
+    failure the documents are created one at a time to find out which
+    of them failed.
+    """
+
+    def __init__(self, db, collection, batch_size=MAX_BATCH_SIZE):
+        self.db = db
+        self.collection = db.collection(collection)
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self.pending = []
+        self.commits = 0
+        self.written = 0
+        self.failed = 0
+        # Batches that hit existing documents and were looked up
+        self.conflicts = 0
+
+    @classmethod
+    def from_env(cls, db, collection):
+        """Writer with SCRAPER_FIRESTORE_BATCH documents per commit (1 = one write per document)"""
+        return cls(db, collection, batch_size=int(os.getenv('SCRAPER_FIRESTORE_BATCH', str(MAX_BATCH_SIZE))))
+
+    def add(self, document, done=None, doc_id=None):
+        self.pending.append((self.collection.document(doc_id), document, done))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Commit everything queued and report each document's outcome, in the order added"""
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+
+        try:
+            self._commit(pending)
+            outcomes = [None] * len(pending)
+        except AlreadyExists:
+            outcomes = self._commit_new(pending)
+        except Exception:
+            outcomes = [self._create(doc_ref, document) for doc_ref, document, _ in pending]
+
+        for (_, _, done), error in zip(pending, outcomes):
+            if error is None:
+                self.written += 1
+            else:
+                self.failed += 1
+            if done is not None:
+                done(error)
+
+    def _commit(self, pending):
+        batch = self.db.batch()
+        for doc_ref, document, _ in pending:
+            batch.create(doc_ref, document)
+        batch.commit()
+        self.commits += 1
+
+    def _commit_new(self, pending):
+        """Outcomes of a batch that hit existing documents: those are AlreadyExists, the rest committed again"""
+        self.conflicts += 1
+        existing = {snapshot.id for snapshot in self.db.get_all([doc_ref for doc_ref, _, _ in pending])
+                    if snapshot.exists}
+        new = [entry for entry in pending if entry[0].id not in existing]
+        try:
+            if new:
+                self._commit(new)
+            errors = {}
+        except Exception:
+            errors = {doc_ref.id: self._create(doc_ref, document) for doc_ref, document, _ in new}
+        return [AlreadyExists(f"Document already exists: {doc_ref.path}") if doc_ref.id in existing
+                else errors.get(doc_ref.id) for doc_ref, _, _ in pending]
+
+    def _create(self, doc_ref, document):
+        try:
+            doc_ref.create(document)
+            self.commits += 1
+            return None
+        except Exception as e:
+            return e
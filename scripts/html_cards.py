@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Targeted parsing for HTML job boards
+Builds only the job-card subtrees of a listing page with lxml, instead of
+a tree for the whole page with its navigation, scripts and footer
+"""
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+HTML_PARSER = 'lxml'
+
+
+def _has_class(wanted):
+    # While parsing, SoupStrainer sees class="job-listing featured" as one
+    # string, so match on its whitespace-separated names instead
+    def match(value):
+        if value is None:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return wanted in classes
+    return match
+
+
+def parse_cards(content, name, attrs=None, limit=None):
+    """Tags matching name / attrs in an HTML page, e.g. ('div', {'class': 'job-listing'}).
+
+    Everything outside the matching elements is skipped while parsing, so
+    the result is the same as soup.find_all(name, attrs, limit=limit) on
+    a full parse at a fraction of the time and memory.
+    """
+    attrs = attrs or {}
+    strain_attrs = dict(attrs)
+    if isinstance(attrs.get('class'), str):
+        strain_attrs['class'] = _has_class(attrs['class'])
+
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=SoupStrainer(name, strain_attrs))
+    return soup.find_all(name, attrs, limit=limit)
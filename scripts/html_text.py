@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Fast HTML to text for job descriptions
+One pass over the markup with the standard library tokenizer, giving the
+same text as the BeautifulSoup tree walk clean_html_content used to do,
+and stopping early once a length limit is reached
+"""
+
+import re
+from html.parser import HTMLParser
+
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution
+
+# BeautifulSoup's own tables, so tags are treated exactly as in its html.parser tree
+_VOID_TAGS = HTMLTreeBuilder.empty_element_tags
+_STRING_CONTAINERS = frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)  # script, style, template, rt, rp
+_PRESERVE_WHITESPACE = HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS
+_ENTITIES = EntitySubstitution.HTML_ENTITY_TO_CHARACTER
+_ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+_HEADINGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+_BEFORE = {'li': '• ', **{h: '\n' for h in _HEADINGS}}
+_AFTER = {'p': '\n', 'li': '\n', **{h: '\n' for h in _HEADINGS}}
+
+_BLANK_LINES = re.compile(r'\n\s*\n')
+_SPACE_RUNS = re.compile(r'[ \t]+')
+
+
+def normalize_whitespace(text):
+    """Blank-line runs to one empty line, space / tab runs to one space, trimmed"""
+    return _SPACE_RUNS.sub(' ', _BLANK_LINES.sub('\n\n', text)).strip()
+
+
+class TextExtractor(HTMLParser):
+    """HTMLParser that writes the readable text of a fragment to self.pieces.
+
+    Mirrors BeautifulSoup's html.parser tree builder event for event (open
+    tag stack, whitespace-only strings, entity and charref decoding,
+    script / style / template text left out), and adds the markers the old
+    tree walk inserted: '\\n' for <br>, after </p>, around headings, and
+    '• ' ... '\\n' around list items. Nothing is built but the text.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.pieces = []
+        self._data = []
+        self._stack = []
+        self._open = {}
+        self._containers = []
+        self._preserve = []
+        self._closed_void = []
+        # Everything inside a still-open <br> was dropped with it by replace_with('\n')
+        self._br_depth = 0
+
+    def text(self):
+        """Finish parsing and return the raw (not yet normalized) text"""
+        self.close()
+        self._flush()
+        while self._stack:
+            self._pop()
+        return ''.join(self.pieces)
+
+    def settled_text(self, limit):
+        """Normalized text so far if it already runs past limit characters, else None.
+
+        Whitespace normalization only rewrites whitespace runs, and text is
+        only ever appended, so everything up to the last non-blank character
+        seen is final; the trailing run may still grow and is left out.
+        """
+        raw = ''.join(self.pieces)
+        if len(raw) <= limit:
+            return None  # Normalizing never makes text longer
+        text = normalize_whitespace(raw.rstrip())
+        return text if len(text) > limit else None
+
+    def _emit(self, piece):
+        if not self._br_depth:
+            self.pieces.append(piece)
+
+    def _flush(self, keep=None):
+        # BeautifulSoup's endData: a string node ends at every tag, comment or declaration
+        if not self._data:
+            return
+        data = ''.join(self._data)
+        self._data = []
+        if keep is None:
+            keep = not self._containers
+        if not keep:
+            return
+        if not self._preserve and not data.strip(_ASCII_SPACES):
+            data = '\n' if '\n' in data else ' '
+        self._emit(data)
+
+    def _push(self, tag):
+        depth = len(self._stack)
+        self._stack.append(tag)
+        self._open[tag] = self._open.get(tag, 0) + 1
+        if tag in _PRESERVE_WHITESPACE:
+            self._preserve.append(depth)
+        if tag in _STRING_CONTAINERS:
+            self._containers.append(depth)
+
+        if tag == 'br':
+            self._emit('\n')
+            self._br_depth += 1
+        elif tag in _BEFORE:
+            self._emit(_BEFORE[tag])
+
+    def _pop(self):
+        tag = self._stack.pop()
+        depth = len(self._stack)
+        self._open[tag] -= 1
+        if self._preserve and self._preserve[-1] == depth:
+            self._preserve.pop()
+        if self._containers and self._containers[-1] == depth:
+            self._containers.pop()
+
+        if tag == 'br':
+            self._br_depth -= 1
+        elif tag in _AFTER:
+            self._emit(_AFTER[tag])
+        return tag
+
+    def _end(self, tag):
+        self._flush()
+        if not self._open.get(tag):
+            return
+        while self._pop() != tag:
+            pass
+
+    def handle_starttag(self, tag, attrs, handle_empty_element=True):
+        self._flush()
+        self._push(tag)
+        if tag in _VOID_TAGS and handle_empty_element:
+            self._end(tag)
+            self._closed_void.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, handle_empty_element=False)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # '<br></br>': the end tag belongs to a void element that was already closed
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+        else:
+            self._end(tag)
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_charref(self, name):
+        if name.startswith('x'):
+            code = int(name.lstrip('x'), 16)
+        elif name.startswith('X'):
+            code = int(name.lstrip('X'), 16)
+        else:
+            code = int(name)
+
+        data = None
+        if code < 256:
+            try:
+                data = bytearray([code]).decode('windows-1252')
+            except UnicodeDecodeError:
+                pass
+        if not data:
+            try:
+                data = chr(code)
+            except (ValueError, OverflowError):
+                pass
+        self._data.append(data or '\N{REPLACEMENT CHARACTER}')
+
+    def handle_entityref(self, name):
+        character = _ENTITIES.get(name)
+        self._data.append(character if character is not None else f"&{name}")
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, data):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.upper().startswith('CDATA['):
+            self._data.append(data[len('CDATA['):])
+            self._flush(keep=True)
+
+
+def _truncate(text, limit):
+    if limit is not None and len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+
+def html_to_text(text, limit=None, chunk_size=1024):
+    """Readable text of an HTML fragment, whitespace normalized.
+
+    With a limit, text longer than limit characters comes back cut to
+    limit + "...", and the markup is fed to the parser chunk_size
+    characters at a time so parsing stops as soon as the first limit
+    characters of the result are settled. The result is the same as
+    cleaning everything and truncating afterwards.
+    """
+    if '<' not in text and '&' not in text:
+        # No markup and no entities: nothing to parse
+        return _truncate(normalize_whitespace(text), limit)
+
+    extractor = TextExtractor()
+    if limit is None:
+        extractor.feed(text)
+        return normalize_whitespace(extractor.text())
+
+    for start in range(0, len(text), chunk_size):
+        extractor.feed(text[start:start + chunk_size])
+        settled = extractor.settled_text(limit)
+        if settled is not None:
+            return settled[:limit] + "..."
+    return _truncate(normalize_whitespace(extractor.text()), limit)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - On-disk HTTP cache for conditional GETs
+Remembers ETag / Last-Modified per URL so feeds and APIs that have not
+changed since the last daily run answer 304 instead of a full download
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'http')
+
+# Source whose fetches are running (the engine sets it per source task); staged responses are filed under it
+current_source = contextvars.ContextVar('current_source', default=None)
+
+
+class ConditionalCache:
+    """URL-keyed store of validators and bodies, evicted by age and total size.
+
+    Each URL is kept as two files named after its SHA-256: <key>.json with
+    the validators and timestamps, and <key>.body with the raw body.
+    store() only stages a 200 response: commit() writes the staged ones
+    once what was parsed from them is saved, and discard() drops those of
+    a source that failed, so a 304 never hides postings that were lost.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=50 * 1024 * 1024, max_age_days=14):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 24 * 3600
+        self.not_modified = Counter()
+        self.pending = {}
+        self.failed = set()
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        """Cache configured from SCRAPER_HTTP_CACHE_*; None when the directory is set to ''"""
+        directory = os.getenv('SCRAPER_HTTP_CACHE_DIR', DEFAULT_CACHE_DIR)
+        if not directory:
+            return None
+
+        return cls(
+            directory,
+            max_bytes=int(float(os.getenv('SCRAPER_HTTP_CACHE_MAX_MB', '50')) * 1024 * 1024),
+            max_age_days=float(os.getenv('SCRAPER_HTTP_CACHE_MAX_AGE_DAYS', '14'))
+        )
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, url):
+        """Cached metadata for url, or None if missing or too old"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get('checked_at', 0) > self.max_age or not os.path.exists(body_path):
+            return None
+        return meta
+
+    @staticmethod
+    def validators(meta):
+        """Conditional request headers for a cached entry"""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load_body(self, url):
+        with open(self._paths(url)[1], 'rb') as f:
+            return f.read()
+
+    def store(self, url, headers, content):
+        """Stage a 200 response for commit(); only worth it when the server sent validators"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        now = time.time()
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': now,
+            'checked_at': now,
+            'size': len(content)
+        }
+        source_name = current_source.get()
+        if source_name not in self.failed:
+            self.pending[url] = (source_name, meta, content)
+
+    def discard(self, source_name):
+        """Forget the responses a failed source staged (or still stages), so the next run downloads them again"""
+        self.failed.add(source_name)
+        self.pending = {url: entry for url, entry in self.pending.items() if entry[0] != source_name}
+
+    def commit(self):
+        """Write every staged response; returns how many"""
+        pending, self.pending = self.pending, {}
+        for url, (_, meta, content) in pending.items():
+            meta_path, body_path = self._paths(url)
+            self._write(body_path, content)
+            self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        return len(pending)
+
+    def mark_not_modified(self, url, meta):
+        """Record a 304: the entry is fresh again as of now"""
+        self.not_modified[url] += 1
+        meta['checked_at'] = time.time()
+        self._write(self._paths(url)[0], json.dumps(meta).encode('utf-8'))
+
+    def _write(self, path, data):
+        # Write-then-rename so an interrupted run never leaves half a file
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def prune(self):
+        """Drop entries past max age, then the least recently checked until under max_bytes"""
+        entries = []
+        now = time.time()
+        removed = 0
+
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[:-len('.json')] + '.body'
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                meta = {}
+
+            if now - meta.get('checked_at', 0) > self.max_age or not os.path.exists(body_path):
+                removed += self._remove(meta_path, body_path)
+            else:
+                entries.append((meta['checked_at'], meta.get('size', 0), meta_path, body_path))
+
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, meta_path, body_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            removed += self._remove(meta_path, body_path)
+            total -= size
+
+        return removed
+
+    @staticmethod
+    def _remove(*paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return 1
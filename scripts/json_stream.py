@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Incremental JSON array parsing
+Lets API sources take the first N postings of a large JSON array
+without downloading or parsing the rest of it
+"""
+
+import codecs
+import json
+
+_WHITESPACE = ' \t\n\r'
+
+
+class JsonArrayStream:
+    """Push parser for a top-level JSON array.
+
+    feed() raw bytes as they arrive and get back the items completed so far:
+
+        stream = JsonArrayStream()
+        for chunk in chunks:
+            for item in stream.feed(chunk):
+                ...
+        stream.close()  # raises ValueError if the array was cut short
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._started = False
+        self.done = False
+        self.bytes_read = 0
+
+    def feed(self, chunk):
+        """Add bytes, return the list of items completed by them"""
+        self.bytes_read += len(chunk)
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self):
+        """Flush at end of stream; returns any last items"""
+        self._buffer += self._utf8.decode(b'', final=True)
+        items = self._drain(final=True)
+        if not self.done:
+            raise ValueError("JSON array ended before its closing ']'")
+        return items
+
+    def _skip(self, characters):
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in characters:
+            pos += 1
+        self._pos = pos
+
+    def _drain(self, final):
+        items = []
+
+        if not self._started:
+            self._skip(_WHITESPACE)
+            if self._pos >= len(self._buffer):
+                return items
+            if self._buffer[self._pos] != '[':
+                raise ValueError("expected a JSON array")
+            self._pos += 1
+            self._started = True
+
+        while not self.done:
+            self._skip(_WHITESPACE + ',')
+            if self._pos >= len(self._buffer):
+                break
+            if self._buffer[self._pos] == ']':
+                self.done = True
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # Item not complete yet
+
+            # Only trust an item once the ',' or ']' after it has arrived;
+            # until then a number like "-1500." may still be growing
+            follow = end
+            while follow < len(self._buffer) and self._buffer[follow] in _WHITESPACE:
+                follow += 1
+            if follow == len(self._buffer) or self._buffer[follow] not in ',]':
+                if final:
+                    raise ValueError(f"unexpected data after array item at offset {end}")
+                break
+
+            items.append(item)
+            self._pos = end
+
+        # Drop what has been consumed so the buffer only holds the current item
+        if self._pos > 65536 or self._pos == len(self._buffer):
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+
+        return items
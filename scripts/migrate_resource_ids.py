@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - One-time migration to content-hash resource IDs
+Moves every scraped resource saved under a random ID to the ID
+save_to_firebase now derives from its source, URL, title and type,
+merges resources that map to the same ID, and points users' saved,
+viewed and applied resources at the new IDs. Resources added through
+the app (no scraper marker, or no real URL) are left alone
+
+Usage: python scripts/migrate_resource_ids.py [--apply]
+"""
+
+import argparse
+import sys
+
+from auto_scraper import FreezyAutomationEngine
+from firestore_batch import MAX_BATCH_SIZE
+from resource_record import resource_id
+
+
+def is_scraped(data):
+    """Whether save_to_firebase wrote a stored resource (current or old flat layout) with a real source URL"""
+    metadata, admin = data.get('metadata', {}), data.get('admin', {})
+    created_by = str(admin.get('created_by') or data.get('created_by') or '')
+    if admin.get('approved_by') != 'auto_scraper' and not created_by.startswith('auto_scraper'):
+        return False
+    url = str(metadata.get('source_url') or data.get('source_url') or '').strip()
+    return url not in ('', '#')
+
+
+def stored_resource_id(data):
+    """resource_id() of a stored resource, in the current layout or the old flat one"""
+    metadata, admin = data.get('metadata', {}), data.get('admin', {})
+    source = admin.get('scraped_from') or data.get('scraped_from') or 'automated'
+    url = metadata.get('source_url') or data.get('source_url') or ''
+    title = metadata.get('title') or data.get('title')
+    resource_type = metadata.get('type') or data.get('type')
+    content = data.get('content', {})
+    company = content.get('company') or data.get('company') or ''
+    location = content.get('location') or data.get('location') or ''
+    return resource_id(source, url, title, resource_type, company, location)
+
+
+def created_at(data):
+    created = data.get('metadata', {}).get('created_at') or data.get('created_at')
+    return created.timestamp() if hasattr(created, 'timestamp') else float('inf')
+
+
+class OperationBatch:
+    """Firestore writes committed MAX_BATCH_SIZE at a time"""
+
+    def __init__(self, db):
+        self.db = db
+        self.batch = db.batch()
+        self.size = 0
+        self.commits = 0
+
+    def add(self, operation, *args):
+        if self.size >= MAX_BATCH_SIZE:
+            self.commit()
+        getattr(self.batch, operation)(*args)
+        self.size += 1
+
+    def commit(self):
+        if self.size:
+            self.batch.commit()
+            self.commits += 1
+            self.batch, self.size = self.db.batch(), 0
+
+
+def plan_resources(db):
+    """{old id: new id} for every scraped resource not yet under its content-hash ID, the documents
+    to keep, and how many resources were left alone as not scraped"""
+    groups, skipped = {}, 0
+    for doc in db.collection('resources').stream():
+        data = doc.to_dict()
+        if not is_scraped(data):
+            skipped += 1
+            continue
+        groups.setdefault(stored_resource_id(data), []).append(doc)
+
+    moves, keep = {}, {}
+    for target, docs in groups.items():
+        # The document already at the target wins, otherwise the one created first
+        docs.sort(key=lambda doc: (doc.id != target, created_at(doc.to_dict())))
+        keep[target] = docs[0]
+        for doc in docs:
+            if doc.id != target:
+                moves[doc.id] = target
+    return moves, keep, skipped
+
+
+def create_targets(db, keep):
+    """Copy each kept resource to its content-hash ID (set(), so a rerun after a crash is harmless)"""
+    writes = OperationBatch(db)
+    for target, doc in keep.items():
+        if doc.id != target:
+            writes.add('set', db.collection('resources').document(target), doc.to_dict())
+    writes.commit()
+    return writes.commits
+
+
+def delete_moved(db, moves):
+    writes = OperationBatch(db)
+    for old_id in moves:
+        writes.add('delete', db.collection('resources').document(old_id))
+    writes.commit()
+    return writes.commits
+
+
+def remap_ids(ids, moves):
+    """Saved/viewed resource lists: IDs (or {'id': ...} entries) renamed, merged resources listed once"""
+    remapped, seen = [], set()
+    for entry in ids:
+        if isinstance(entry, dict):
+            new_id = moves.get(entry.get('id'), entry.get('id'))
+            entry = {**entry, 'id': new_id}
+        else:
+            entry = new_id = moves.get(entry, entry)
+        if new_id not in seen:
+            seen.add(new_id)
+            remapped.append(entry)
+    return remapped
+
+
+def remap_users(db, moves, apply):
+    """Rewrite references to moved resources in every user; returns the users changed"""
+    writes = OperationBatch(db)
+    changed = 0
+    for user in db.collection('users').stream():
+        activity = user.to_dict().get('activity') or {}
+        updates = {}
+        for field in ('saved_resources', 'viewed_resources'):
+            entries = activity.get(field) or []
+            remapped = remap_ids(entries, moves)
+            if remapped != entries:
+                updates[f'activity.{field}'] = remapped
+        history = activity.get('application_history') or []
+        if any(entry.get('resource_id') in moves for entry in history if isinstance(entry, dict)):
+            updates['activity.application_history'] = [
+                {**entry, 'resource_id': moves.get(entry.get('resource_id'), entry.get('resource_id'))}
+                if isinstance(entry, dict) else entry for entry in history]
+
+        sub_writes = []
+        for saved in user.reference.collection('saved_resources').stream():
+            if saved.id in moves:
+                data = saved.to_dict()
+                if 'resource_id' in data:
+                    data['resource_id'] = moves[saved.id]
+                sub_writes.append(('set', user.reference.collection('saved_resources').document(moves[saved.id]), data))
+                sub_writes.append(('delete', saved.reference))
+        for application in user.reference.collection('applications').stream():
+            resource = application.to_dict().get('resource_id')
+            if resource in moves:
+                sub_writes.append(('update', application.reference, {'resource_id': moves[resource]}))
+
+        if updates or sub_writes:
+            changed += 1
+            if apply:
+                if updates:
+                    writes.add('update', user.reference, updates)
+                for operation, *args in sub_writes:
+                    writes.add(operation, *args)
+    writes.commit()
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--apply', action='store_true', help='write the changes (default: only report them)')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"🔑 RESOURCE ID MIGRATION ({'applying' if args.apply else 'dry run'})")
+    print("=" * 60)
+
+    db = FreezyAutomationEngine().db
+    moves, keep, skipped = plan_resources(db)
+    merged = len(moves) - sum(1 for target, doc in keep.items() if doc.id != target)
+    print(f"📦 {len(keep)} scraped resources, {len(moves)} to move to content-hash IDs "
+          f"({merged} of them duplicates merged into another)")
+    print(f"⏭️  {skipped} resources not written by the scraper (or without a source URL) left as they are")
+
+    if not moves:
+        print("✅ Every resource already has its content-hash ID")
+        return
+
+    if args.apply:
+        # New documents, then references, then old documents: a run stopped part way never
+        # leaves a user pointing at a missing resource, and rerunning finishes the job
+        commits = create_targets(db, keep)
+        users = remap_users(db, moves, apply=True)
+        commits += delete_moved(db, moves)
+        print(f"👥 Updated {users} users' saved, viewed and applied resources")
+        print(f"✅ Moved {len(moves)} resources in {commits} commits")
+    else:
+        users = remap_users(db, moves, apply=False)
+        print(f"👥 {users} users reference a resource that would move")
+        print("ℹ️  Dry run, nothing written; rerun with --apply")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n⏹️ Migration stopped")
+        sys.exit(1)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Near-duplicate detection across sources
+Fingerprints each resource's title, company and description with
+MinHash, finds likely matches with locality-sensitive hashing instead
+of comparing every pair, and keeps one resource per cluster
+"""
+
+import operator
+import os
+import re
+from collections import Counter, defaultdict
+from itertools import count
+
+from resource_record import ResourceRecord
+
+_WORD = re.compile(r'\w+')
+# Work-mode and urgency words boards add to a title; a copy's title is the same without them
+_TITLE_NOISE = re.compile(r'\b(?:remote|hybrid|on[\s_-]?site|wfh|work from home|full[\s_-]?time|part[\s_-]?time'
+                          r'|urgent(?:ly)?|hiring|immediate(?:ly)?)\b')
+
+
+class NearDuplicates:
+    """MinHash signatures with `bins` slots, banded for LSH.
+
+    The signature is a one-permutation MinHash: every word 3-shingle is
+    hashed once and kept if it is the smallest in its bin, and empty
+    bins borrow from the next filled one. Words are numbered per call
+    of clusters_of(), so the hashes do not depend on PYTHONHASHSEED.
+    Resources of the same type and title_key() whose signatures agree
+    on a whole band are candidates, so different roles that share a
+    company's boilerplate description are never compared. A candidate
+    pair is a match when at least `threshold` of the slots agree (the
+    estimated Jaccard similarity). The bands and rows per band are
+    picked so the LSH cut-off sits well under the threshold: a few more
+    candidates to compare, few matches missed.
+    """
+
+    def __init__(self, threshold=0.7, bins=128):
+        # bins must be a power of two: a hash's low bits pick its bin
+        self.threshold = threshold
+        self.bins = bins
+        self.mask = bins - 1
+        # Most rows per band whose LSH cut-off (1/bands)^(1/rows) stays below 85% of the threshold
+        self.rows = max((rows for rows in range(1, bins + 1)
+                         if bins % rows == 0 and (rows / bins) ** (1 / rows) <= threshold * 0.85), default=1)
+        self.bands = bins // self.rows
+        self.compared = 0
+        self.dropped = 0
+        self.clusters = 0
+        # (kept, dropped copy) pairs of this run, for record_copies()
+        self.copies = []
+
+    @classmethod
+    def from_env(cls):
+        """Stage with SCRAPER_NEAR_DUP_THRESHOLD similarity; None when that is 0"""
+        threshold = float(os.getenv('SCRAPER_NEAR_DUP_THRESHOLD', '0.7'))
+        return cls(threshold) if threshold > 0 else None
+
+    def signature(self, resource, vocabulary):
+        """MinHash signature of a resource's title, company and description (a tuple of bins values)"""
+        text = ' '.join(str(resource.get(name) or '') for name in ('title', 'company', 'description'))
+        words = list(map(vocabulary.__getitem__, _WORD.findall(text.casefold())))
+        shingles = zip(words, words[1:], words[2:]) if len(words) >= 3 else zip(words)
+
+        # Largest hash first, so each bin ends up with its smallest
+        hashes = sorted(map(hash, shingles), reverse=True)
+        smallest = dict(zip(map(self.mask.__and__, hashes), hashes))
+        slots = list(map(smallest.get, range(self.bins)))
+
+        # Densify: an empty bin takes the next filled bin's value, offset by the distance
+        if smallest and len(smallest) < self.bins:
+            bins = self.bins
+            following = next(index for index, value in enumerate(slots) if value is not None) + bins
+            for index in range(bins - 1, -1, -1):
+                if slots[index] is None:
+                    slots[index] = slots[following % bins] + following - index
+                else:
+                    following = index
+        return tuple(slots)
+
+    def similarity(self, first, second):
+        return sum(map(operator.eq, first, second)) / self.bins
+
+    @staticmethod
+    def title_key(resource):
+        """A title's words without case, punctuation or work-mode words ("Remote", "Full-time")"""
+        return tuple(_WORD.findall(_TITLE_NOISE.sub(' ', str(resource.get('title') or '').casefold())))
+
+    def similar(self, first, second, signatures):
+        self.compared += 1
+        return self.similarity(signatures[first], signatures[second]) >= self.threshold
+
+    def clusters_of(self, resources):
+        """Lists of indexes of resources that are near-duplicates of each other (clusters of one left out)"""
+        vocabulary = defaultdict(count().__next__)
+        signatures = [self.signature(resource, vocabulary) for resource in resources]
+        parent = list(range(len(resources)))
+
+        def find(index):
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        buckets, rejected = defaultdict(list), set()
+        for index, (resource, signature) in enumerate(zip(resources, signatures)):
+            if signature[0] is None:
+                continue  # No words to compare
+            kind = (resource.get('type'), self.title_key(resource))
+            for band, values in enumerate(zip(*[iter(signature)] * self.rows)):
+                buckets[kind, band, values].append(index)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            # Each member joins the first cluster in the bucket it matches
+            roots = []
+            for index in members:
+                root = find(index)
+                if root in roots:
+                    continue
+                for other in roots:
+                    # A pair that shares several bands is only compared once
+                    pair = (min(index, other), max(index, other))
+                    if pair in rejected:
+                        continue
+                    if self.similar(index, other, signatures):
+                        parent[root] = find(other)
+                        break
+                    rejected.add(pair)
+                else:
+                    roots.append(root)
+
+        clusters = {}
+        for index in range(len(resources)):
+            clusters.setdefault(find(index), []).append(index)
+        return [members for members in clusters.values() if len(members) > 1]
+
+    @staticmethod
+    def quality(resource, url_counts):
+        """Which copy to keep: a posting's own URL (not a board URL every posting shares), then the fullest"""
+        url = resource.get('source_url')
+        return (bool(url) and url_counts[url] == 1, len(resource.get('description') or ''),
+                bool(resource.get('company')), bool(resource.get('location')))
+
+    def dedupe(self, resources):
+        """resources with only the best copy of each cluster of near-duplicates, in their original order"""
+        clusters = self.clusters_of(resources)
+        url_counts = Counter(resource.get('source_url') for resource in resources)
+        drop = set()
+        for members in clusters:
+            # max() keeps the first of equally good copies
+            best = max(members, key=lambda index: self.quality(resources[index], url_counts))
+            drop.update(index for index in members if index != best)
+            self.copies.extend((resources[best], resources[index]) for index in members if index != best)
+
+        self.clusters += len(clusters)
+        self.dropped += len(drop)
+        return [resource for index, resource in enumerate(resources) if index not in drop]
+
+    def record_copies(self, seen_filter=None, seen_store=None):
+        """Mark the dropped copies of stored resources as seen, so a later run does not save a copy on its own.
+
+        A kept resource counts as stored once its ID is in the seen filter
+        or its (title, type) in the seen-items store, as save_to_firebase()
+        leaves them. Returns the number of copies recorded.
+        """
+        recorded = 0
+        for kept, copy in self.copies:
+            kept, copy = (item if isinstance(item, ResourceRecord) else ResourceRecord.from_dict(item)
+                          for item in (kept, copy))
+            if not ((seen_filter is not None and kept.document_id() in seen_filter) or
+                    (seen_store is not None and (kept.title, kept.type) in seen_store)):
+                continue
+            if seen_filter is not None:
+                seen_filter.add(copy.document_id())
+            if seen_store is not None:
+                seen_store.add((copy.title, copy.type))
+            recorded += 1
+        self.copies = []
+        return recorded
+
+    def report(self):
+        return (f"dropped {self.dropped} copies of {self.clusters} postings listed more than once "
+                f"({self.compared} candidate pairs compared)")
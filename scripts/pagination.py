@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Pagination for registry sources
+Page URLs, posting dates, and the per-source watermark (newest posting
+seen) that lets the next run stop paging once it reaches old postings
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_WATERMARK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'source_watermarks.json')
+
+
+class Pagination:
+    """A source's 'pages' settings from sources.py.
+
+    Pages are numbered start, start + step, ... in the query parameter
+    param (Indeed counts results: start=0, step=10); 'api' sources put
+    {page} in their request templates instead. At most max_pages pages
+    are read, concurrency at a time, and at most max_items jobs are kept.
+    With cursor (the path of the next page's cursor in a JSON response)
+    each page is requested with the cursor of the one before, so pages
+    are read one at a time.
+    """
+
+    def __init__(self, param='page', start=1, step=1, max_pages=5, concurrency=3, max_items=None, cursor=None):
+        self.param = param
+        self.start = start
+        self.step = step
+        self.max_pages = max_pages
+        self.concurrency = 1 if cursor else max(1, concurrency)
+        self.max_items = max_items
+        self.cursor = cursor
+
+    @classmethod
+    def from_spec(cls, spec):
+        """Pagination for a source spec, None when it has no 'pages'; SCRAPER_MAX_PAGES caps every source"""
+        if 'pages' not in spec:
+            return None
+
+        pagination = cls(**spec['pages'])
+        cap = os.getenv('SCRAPER_MAX_PAGES')
+        if cap:
+            pagination.max_pages = min(pagination.max_pages, max(1, int(cap)))
+        return pagination
+
+    def page_number(self, index):
+        """Number of the index-th page (0-based) as the source counts them"""
+        return self.start + index * self.step
+
+    def page_url(self, url, index):
+        """URL of the index-th page (0-based), with the page parameter set or replaced"""
+        scheme, netloc, path, query, fragment = urlsplit(url)
+        params = [(key, value) for key, value in parse_qsl(query, keep_blank_values=True) if key != self.param]
+        params.append((self.param, str(self.page_number(index))))
+        return urlunsplit((scheme, netloc, path, urlencode(params), fragment))
+
+
+def parse_posted(value):
+    """Posting date as an aware UTC datetime, from epoch seconds, ISO 8601 or RFC 822; None if unknown"""
+    if value is None or value == '':
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            posted = datetime.fromtimestamp(value, timezone.utc)
+        elif isinstance(value, datetime):
+            posted = value
+        elif value[:4].isdigit():
+            posted = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        else:
+            posted = parsedate_to_datetime(value)
+    except (TypeError, ValueError, OverflowError, IndexError):
+        return None
+
+    if posted.tzinfo is None:
+        posted = posted.replace(tzinfo=timezone.utc)
+    return posted.astimezone(timezone.utc)
+
+
+class SourceWatermarks:
+    """Newest posting date seen per source, persisted as JSON between runs.
+
+    since(name) is the previous run's value for the whole of this run;
+    advance() only takes effect in the file written by save().
+    """
+
+    def __init__(self, path=DEFAULT_WATERMARK_FILE):
+        self.path = path
+        self.sources = {}
+        self.pending = {}
+        self.load()
+
+    @classmethod
+    def from_env(cls):
+        """Watermarks from SCRAPER_WATERMARK_FILE; None when it is set to ''"""
+        path = os.getenv('SCRAPER_WATERMARK_FILE', DEFAULT_WATERMARK_FILE)
+        return cls(path) if path else None
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.sources = json.load(f)
+        except (OSError, ValueError):
+            self.sources = {}
+
+    def save(self):
+        if not self.pending:
+            return
+        self.sources.update({name: posted.isoformat() for name, posted in self.pending.items()})
+        self.pending = {}
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.sources, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def since(self, source_name):
+        """Newest posting date of the source's last run, or None"""
+        return parse_posted(self.sources.get(source_name))
+
+    def advance(self, source_name, posted):
+        """Remember a posting date seen this run if it is the newest so far"""
+        if posted is None:
+            return
+        newest = self.pending.get(source_name) or self.since(source_name)
+        if newest is None or posted > newest:
+            self.pending[source_name] = posted
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Per-host rate limiting for the scrapers
+Token bucket per host, limits from the environment, and robots.txt
+Crawl-delay / Request-rate for HTML job boards
+"""
+
+import asyncio
+import os
+import time
+import urllib.parse
+import urllib.robotparser
+
+
+def host_of(url):
+    """Lower-cased host[:port] of url"""
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+def parse_host_limits(spec):
+    """Parse 'host=rate[:burst],...' (e.g. 'www.rozee.pk=0.5,remoteok.io=2:4')"""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        host, _, value = item.partition('=')
+        rate, _, burst = value.partition(':')
+        limits[host.strip().lower()] = (float(rate), float(burst) if burst else 1.0)
+    return limits
+
+
+class TokenBucket:
+    """rate tokens per second, holding at most burst tokens (rate 0 = unlimited)"""
+
+    def __init__(self, rate, burst=1.0):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def reserve(self):
+        """Take a token and return how long to wait before using it.
+
+        Tokens may go negative, so callers queue up in arrival order without
+        re-checking the bucket.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Per-host token buckets that every fetch goes through.
+
+    Hosts fetched with robots=True are checked against robots.txt once per
+    run; a Crawl-delay or Request-rate there tightens that host's bucket.
+    """
+
+    def __init__(self, rate=1.0, burst=2.0, host_limits=None, user_agent='*'):
+        self.rate = rate
+        self.burst = burst
+        self.host_limits = host_limits or {}
+        self.user_agent = user_agent
+        self.crawl_delays = {}
+        self._buckets = {}
+        self._robots = {}
+
+    @classmethod
+    def from_env(cls, user_agent='*'):
+        """Limits from SCRAPER_RATE, SCRAPER_BURST and SCRAPER_HOST_LIMITS"""
+        return cls(
+            rate=float(os.getenv('SCRAPER_RATE', '1.0')),
+            burst=float(os.getenv('SCRAPER_BURST', '2')),
+            host_limits=parse_host_limits(os.getenv('SCRAPER_HOST_LIMITS', '')),
+            user_agent=user_agent
+        )
+
+    def bucket(self, host):
+        if host not in self._buckets:
+            rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+            self._buckets[host] = TokenBucket(rate, burst)
+        return self._buckets[host]
+
+    async def acquire(self, url, robots_fetch=None):
+        """Wait for a request slot on url's host.
+
+        robots_fetch(robots_url) -> response is used the first time a host
+        is seen with robots checking enabled.
+        """
+        host = host_of(url)
+        if robots_fetch is not None:
+            await self._check_robots(url, host, robots_fetch)
+
+        delay = self.bucket(host).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _check_robots(self, url, host, robots_fetch):
+        task = self._robots.get(host)
+        if task is None:
+            task = asyncio.ensure_future(self._load_robots(url, host, robots_fetch))
+            self._robots[host] = task
+        await asyncio.shield(task)
+
+    async def _load_robots(self, url, host, robots_fetch):
+        parts = urllib.parse.urlsplit(url)
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        try:
+            response = await robots_fetch(robots_url)
+        except Exception:
+            return
+        if response.status_code != 200:
+            return
+
+        parser = urllib.robotparser.RobotFileParser(robots_url)
+        parser.parse(response.text.splitlines())
+        parser.modified()  # crawl_delay() ignores parsers that were never "read"
+
+        interval = 0.0
+        crawl_delay = parser.crawl_delay(self.user_agent)
+        if crawl_delay:
+            interval = float(crawl_delay)
+        request_rate = parser.request_rate(self.user_agent)
+        if request_rate and request_rate.requests:
+            interval = max(interval, request_rate.seconds / request_rate.requests)
+        if interval <= 0:
+            return
+
+        # Never go faster than the configured limit, and no bursts past the delay;
+        # the robots.txt request itself counts as the previous hit
+        bucket = self.bucket(host)
+        bucket.rate = 1.0 / interval if bucket.rate <= 0 else min(bucket.rate, 1.0 / interval)
+        bucket.burst = 1.0
+        bucket.tokens = min(bucket.tokens, 0.0)
+        self.crawl_delays[host] = interval
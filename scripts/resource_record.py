@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Compact record for scraped resources
+One slotted object per resource from extraction to save_to_firebase,
+sharing the run's timestamp, and serialized straight to the Firestore
+document shape under an ID derived from its content
+"""
+
+import hashlib
+
+# Fields of a job resource, in the order the scrapers have always listed them
+JOB_FIELDS = (
+    'title', 'type', 'description', 'location', 'company', 'source_url', 'requirements', 'benefits',
+    'status', 'created_at', 'updated_at', 'created_by', 'duration', 'scraped_from', 'location_type',
+)
+
+# Other fields the Firestore document has room for (courses and tools set category)
+EXTRA_FIELDS = ('category', 'tags', 'salary_range', 'application_deadline', 'contact_info')
+
+_FIELD_NAMES = frozenset(JOB_FIELDS + EXTRA_FIELDS)
+
+PRIORITY_SCORES = {'enterprise': 100, 'pro': 80}
+
+
+def _normalize(text):
+    return ' '.join(str(text or '').split()).casefold()
+
+
+def resource_id(source, url, title, resource_type, company, location):
+    """Firestore document ID of a resource: a hash of its normalized source, URL, title, type, company and location.
+
+    Case, runs of whitespace and a trailing slash on the URL do not
+    change the ID, so the same posting scraped again maps to the same document.
+    The type keeps a course and a job that one source lists under the same
+    URL and title apart, and company and location do the same for postings
+    of a source that only gives its board URL.
+    """
+    key = '\0'.join((_normalize(source), _normalize(url).rstrip('/'), _normalize(title), _normalize(resource_type),
+                      _normalize(company), _normalize(location)))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+
+class ResourceRecord:
+    """A scraped resource with __slots__ instead of a 16-key dict.
+
+    Unset fields are None. Read access works as on the dicts the pipeline
+    used before (record['title'], record.get('company', ''), 'title' in
+    record, items()), listing only the fields that are set.
+    """
+
+    __slots__ = JOB_FIELDS + EXTRA_FIELDS
+
+    def __init__(self, title=None, type=None, description=None, location=None, company=None, source_url=None,
+                 requirements=None, benefits=None, status=None, created_at=None, updated_at=None, created_by=None,
+                 duration=None, scraped_from=None, location_type=None, category=None, tags=None,
+                 salary_range=None, application_deadline=None, contact_info=None):
+        self.title = title
+        self.type = type
+        self.description = description
+        self.location = location
+        self.company = company
+        self.source_url = source_url
+        self.requirements = requirements
+        self.benefits = benefits
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.created_by = created_by
+        self.duration = duration
+        self.scraped_from = scraped_from
+        self.location_type = location_type
+        self.category = category
+        self.tags = tags
+        self.salary_range = salary_range
+        self.application_deadline = application_deadline
+        self.contact_info = contact_info
+
+    @classmethod
+    def from_dict(cls, resource):
+        """Record for a resource dict (courses, tools); keys that are not fields are dropped"""
+        return cls(**{key: value for key, value in resource.items() if key in _FIELD_NAMES})
+
+    def get(self, name, default=None):
+        value = getattr(self, name) if name in _FIELD_NAMES else None
+        return default if value is None else value
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def keys(self):
+        return [name for name in self.__slots__ if getattr(self, name) is not None]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self):
+        return [(name, value) for name in self.__slots__ if (value := getattr(self, name)) is not None]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"ResourceRecord({self.to_dict()!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, ResourceRecord):
+            return NotImplemented
+        return self.items() == other.items()
+
+    __hash__ = None
+
+    def document_id(self):
+        """resource_id() of this record, from the same values to_document() stores"""
+        return resource_id(self.get('scraped_from', 'automated'), self.get('source_url', ''), self.title, self.type,
+                           self.get('company', ''), self.get('location', ''))
+
+    def to_document(self, access_level, now):
+        """The Firestore 'resources' document, with now as this save's timestamp"""
+        get = self.get
+        return {
+            'metadata': {
+                'title': self.title,
+                'description': self.description,
+                'type': self.type,
+                'category': get('category', 'General'),
+                'tags': get('tags', []),
+                'source_url': get('source_url', ''),
+                'created_at': get('created_at', now),
+                'updated_at': now
+            },
+            'content': {
+                'company': get('company', ''),
+                'location': get('location', ''),
+                'duration': get('duration', ''),
+                'requirements': get('requirements', ''),
+                'benefits': get('benefits', ''),
+                'salary_range': get('salary_range', ''),
+                'application_deadline': get('application_deadline', ''),
+                'contact_info': get('contact_info', {})
+            },
+            'visibility': {
+                'status': 'active',
+                'access_level': access_level,
+                'is_featured': access_level == 'enterprise',  # Enterprise resources are featured
+                'priority_score': PRIORITY_SCORES.get(access_level, 60)
+            },
+            # Also add flat status for backward compatibility
+            'status': 'active',
+            'analytics': {
+                'view_count': 0,
+                'save_count': 0,
+                'application_count': 0,
+                'last_updated': now
+            },
+            'admin': {
+                'created_by': get('created_by', 'auto_scraper'),
+                'approved_by': 'auto_scraper',
+                'approval_date': now,
+                'scraped_from': get('scraped_from', 'automated'),
+                'location_type': get('location_type', 'General')
+            }
+        }
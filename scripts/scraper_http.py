@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Shared HTTP layer for the scrapers
+One pooled aiohttp session per run: keep-alive connections per host,
+default headers, timeouts and transparent gzip/brotli decoding
+"""
+
+import asyncio
+import json
+import os
+from collections import Counter
+
+import aiohttp
+
+from feed_reader import FeedStream
+from json_stream import JsonArrayStream
+from rate_limiter import RateLimiter
+
+try:
+    import brotli  # noqa: F401  (lets aiohttp decode 'br' bodies)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Identifies the bot to APIs and feeds
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; FreezyPlatform/1.0; +https://freezyplatform.com)',
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+# HTML job boards only serve their listings to regular browsers
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+class FetchedResponse:
+    """Fully read HTTP response with the parts of the requests API the scrapers use.
+
+    The same instance may be handed to several sources (see ResponseStore),
+    so the parsed body is cached and must be treated as read-only.
+    """
+
+    def __init__(self, url, status_code, headers, content, not_modified=False, items=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        # True for a 304 on a conditional GET; content is then the cached body
+        self.not_modified = not_modified
+        # Parsed items of a streamed read (get_json_items / get_feed_items)
+        self.items = items
+        # Body bytes actually read off the wire (less than the body for streamed reads)
+        self.bytes_read = len(content)
+        self._json = items
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        if self._json is None:
+            self._json = json.loads(self.content)
+        return self._json
+
+
+class ResponseStore:
+    """Per-run single-flight store for GET responses, keyed by URL.
+
+    The first request for a URL starts the fetch; concurrent and later
+    requests for it await that same fetch and get the same response object.
+    A fetch limited to the first N items of a JSON array can serve any
+    request for N items or fewer; a full fetch serves everything.
+    Failed fetches are forgotten so a later request can retry.
+    """
+
+    def __init__(self):
+        self._fetches = {}
+        self.hits = Counter()
+
+    async def get(self, url, fetch, items=None):
+        """Return the response for url, calling fetch() only if no usable fetch exists"""
+        entry = self._fetches.get(url)
+        if entry and (entry[0] is None or (items is not None and entry[0] >= items)):
+            task = entry[1]
+            self.hits[url] += 1
+        else:
+            task = asyncio.ensure_future(fetch())
+            entry = (items, task)
+            task.add_done_callback(lambda done: self._forget_failure(url, entry))
+            self._fetches[url] = entry
+
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _forget_failure(self, url, entry):
+        task = entry[1]
+        if task.cancelled() or task.exception() is not None:
+            if self._fetches.get(url) is entry:
+                del self._fetches[url]
+
+
+class HttpClient:
+    """Engine-owned HTTP session shared by every source in a run.
+
+    Must be opened inside the event loop that uses it:
+
+        async with HttpClient(limiter) as http:
+            response = await http.get(url)
+
+    With a ConditionalCache, get(url, conditional=True) revalidates against
+    the last run's ETag / Last-Modified instead of downloading again.
+    """
+
+    def __init__(self, limiter=None, timeout=None, connect_timeout=None,
+                 pool_size=None, pool_per_host=None, keepalive=None, cache=None):
+        self.limiter = limiter or RateLimiter(rate=0)
+        self.cache = cache
+        self.timeout = timeout or float(os.getenv('SCRAPER_TIMEOUT', '15'))
+        self.connect_timeout = connect_timeout or float(os.getenv('SCRAPER_CONNECT_TIMEOUT', '5'))
+        # 0 means unlimited for both pool sizes
+        self.pool_size = pool_size if pool_size is not None else int(os.getenv('SCRAPER_POOL_SIZE', '100'))
+        self.pool_per_host = pool_per_host if pool_per_host is not None else int(os.getenv('SCRAPER_POOL_PER_HOST', '8'))
+        self.keepalive = keepalive or float(os.getenv('SCRAPER_KEEPALIVE', '30'))
+        self.responses = ResponseStore()
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_per_host,
+            keepalive_timeout=self.keepalive,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=self._timeout(self.timeout),
+            auto_decompress=True
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.session = None
+        if self.cache:
+            self.cache.prune()
+
+    def _timeout(self, timeout):
+        """Per-request total timeout, falling back to the session default"""
+        return aiohttp.ClientTimeout(total=timeout or self.timeout, sock_connect=self.connect_timeout)
+
+    async def get(self, url, headers=None, timeout=None, conditional=False, robots=False):
+        """GET url, shared with every other GET of the same URL in this run.
+
+        robots=True (HTML sites) also honours the host's robots.txt Crawl-delay.
+        """
+        return await self.responses.get(url, lambda: self.fetch(url, headers, timeout, conditional, robots))
+
+    async def fetch(self, url, headers=None, timeout=None, conditional=False, robots=False):
+        """GET url behind the per-host rate limiter and read the whole body"""
+        cached = self.cache.lookup(url) if conditional and self.cache else None
+        if cached:
+            headers = {**(headers or {}), **self.cache.validators(cached)}
+
+        await self.limiter.acquire(url, robots_fetch=self.get if robots else None)
+        async with self.session.get(url, headers=headers, timeout=self._timeout(timeout)) as response:
+            if response.status == 304 and cached:
+                self.cache.mark_not_modified(url, cached)
+                return FetchedResponse(url, 304, response.headers, self.cache.load_body(url), not_modified=True)
+
+            content = await response.read()
+            if response.status == 200 and conditional and self.cache:
+                self.cache.store(url, response.headers, content)
+            return FetchedResponse(str(response.url), response.status, response.headers, content)
+
+    async def get_json_items(self, url, limit, headers=None, timeout=None, conditional=False):
+        """GET a JSON array but only read it up to its first `limit` items.
+
+        The body is parsed as it streams in and the connection is dropped as
+        soon as enough items have arrived. The response's json() (and
+        .items) is that list of items.
+        """
+        return await self.responses.get(
+            url, lambda: self.fetch_items(url, limit, JsonArrayStream(), headers, timeout, conditional), items=limit
+        )
+
+    async def get_feed_items(self, url, limit, headers=None, timeout=None, conditional=False):
+        """GET an RSS / Atom feed but only read it up to its first `limit` items.
+
+        The response's .items holds the items as dicts (see feed_reader.item_fields).
+        """
+        return await self.responses.get(
+            url, lambda: self.fetch_items(url, limit, FeedStream(), headers, timeout, conditional), items=limit
+        )
+
+    async def fetch_items(self, url, limit, stream, headers=None, timeout=None, conditional=False):
+        """Streaming counterpart of fetch(): push the body through stream until limit items"""
+        cached = self.cache.lookup(url) if conditional and self.cache else None
+        if cached:
+            headers = {**(headers or {}), **self.cache.validators(cached)}
+
+        await self.limiter.acquire(url)
+        async with self.session.get(url, headers=headers, timeout=self._timeout(timeout)) as response:
+            if response.status == 304 and cached:
+                self.cache.mark_not_modified(url, cached)
+                return FetchedResponse(url, 304, response.headers, b'', not_modified=True, items=[])
+            if response.status != 200:
+                return FetchedResponse(str(response.url), response.status, response.headers, await response.read())
+
+            items = []
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                items.extend(stream.feed(chunk))
+                if len(items) >= limit or stream.done:
+                    break
+            else:
+                items.extend(stream.close())
+            del items[limit:]
+
+        if conditional and self.cache:
+            # Only the validators matter here: a 304 next run means "skip"
+            self.cache.store(url, response.headers, json.dumps(items).encode('utf-8'))
+        fetched = FetchedResponse(str(response.url), 200, response.headers, b'', items=items)
+        fetched.bytes_read = stream.bytes_read
+        return fetched
+
+    async def post_query(self, url, json, headers=None, timeout=None):
+        """POST a search query to a JSON API behind the per-host rate limiter and read the whole body"""
+        await self.limiter.acquire(url)
+        return await self.post(url, json=json, headers=headers, timeout=timeout)
+
+    async def post(self, url, json=None, headers=None, timeout=None):
+        """POST a JSON payload (webhooks); not rate limited"""
+        async with self.session.post(url, json=json, headers=headers, timeout=self._timeout(timeout)) as response:
+            content = await response.read()
+            return FetchedResponse(str(response.url), response.status, response.headers, content)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Bloom filter of resources already stored
+Holds the content-hash document ID of every resource saved so far in a
+few bytes each, so extraction can drop a posting that is already in
+Firestore before its description is cleaned
+"""
+
+import hashlib
+import math
+import os
+import struct
+from collections import Counter
+
+DEFAULT_FILTER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'seen_resources.bloom')
+
+# File header: magic, capacity, false-positive rate, keys added
+_HEADER = struct.Struct('<4sQdQ')
+_MAGIC = b'FZB1'
+_MASK64 = (1 << 64) - 1
+
+
+class SeenFilter:
+    """Bloom filter sized for `capacity` keys at `fp_rate` false positives.
+
+    `key in filter` is never False for a key that was add()ed, and True
+    for a key that was not with probability fp_rate (while no more than
+    capacity keys are in). Extraction treats True as "already stored",
+    so fp_rate is the share of new postings it would skip. Each key is
+    hashed once (blake2b, 128 bits) and the k bit positions come from
+    the two halves (double hashing). A filter loaded from a file that
+    holds more keys than capacity, or was sized differently, starts
+    over empty.
+    """
+
+    def __init__(self, capacity=1_000_000, fp_rate=0.0001, path=None):
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.path = path
+        self.bits = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+        self.changed = False
+        # Postings extraction dropped because their ID was in the filter, per source name
+        self.skipped = Counter()
+
+    @classmethod
+    def from_env(cls):
+        """Filter at SCRAPER_SEEN_FILTER, sized by SCRAPER_SEEN_FILTER_*; None when the file is set to ''"""
+        path = os.getenv('SCRAPER_SEEN_FILTER', DEFAULT_FILTER_FILE)
+        if not path:
+            return None
+
+        return cls.load(
+            path,
+            capacity=int(os.getenv('SCRAPER_SEEN_FILTER_CAPACITY', '1000000')),
+            fp_rate=float(os.getenv('SCRAPER_SEEN_FILTER_FP_RATE', '0.0001'))
+        )
+
+    @classmethod
+    def load(cls, path, capacity=1_000_000, fp_rate=0.0001):
+        seen = cls(capacity, fp_rate, path)
+        try:
+            with open(path, 'rb') as f:
+                magic, file_capacity, file_fp_rate, count = _HEADER.unpack(f.read(_HEADER.size))
+                array = f.read()
+        except (OSError, struct.error):
+            return seen
+
+        if (magic, file_capacity, file_fp_rate) == (_MAGIC, capacity, fp_rate) and \
+                len(array) == len(seen.array) and count <= capacity:
+            seen.array = bytearray(array)
+            seen.count = count
+        return seen
+
+    def save(self):
+        if not self.changed or not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.capacity, self.fp_rate, self.count))
+            f.write(self.array)
+        os.replace(tmp_path, self.path)
+        self.changed = False
+
+    def _positions(self, key):
+        value = int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest(), 'little')
+        first, step, bits = value & _MASK64, (value >> 64) | 1, self.bits
+        return [(first + i * step) % bits for i in range(self.hashes)]
+
+    def __contains__(self, key):
+        array = self.array
+        for position in self._positions(key):
+            if not array[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        array, new = self.array, False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not array[position >> 3] & mask:
+                array[position >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+            self.changed = True
+
+    def expected_fp_rate(self):
+        """False-positive rate at the current number of keys"""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def report(self):
+        """One line: keys, size, current false-positive rate and postings skipped"""
+        return (f"{self.count:,} resources in {len(self.array) / 1024:,.0f} KB, "
+                f"~{self.expected_fp_rate():.4%} false positives, {sum(self.skipped.values())} postings skipped before extraction")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Local seen-items store for duplicate checks
+A SQLite file of the (title, type) signatures saved in the last 7 days,
+carried between daily runs with the rest of scripts/.cache, so a save
+checks duplicates without reading Firestore at all
+
+Usage: python scripts/seen_store.py   (rebuild the store from Firestore)
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'seen_items.sqlite3')
+
+# Documents per page of the reconcile scan
+SCAN_PAGE_SIZE = 1000
+
+
+class SeenStore:
+    """Signatures of resources created in the last window_days, with their creation time.
+
+    Used like a DedupIndex: `signature in store` and add(signature).
+    open() rebuilds it from Firestore with reconcile() when it is missing
+    or was last reconciled more than window_days ago (resources created
+    by anything but this scraper only show up through reconcile());
+    otherwise a save costs no Firestore reads. save() commits this run's
+    signatures and drops the expired ones.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, window_days=7):
+        self.db_path = db_path
+        self.window = window_days * 24 * 3600
+        self._db = None
+        self._pending = {}
+        # Firestore document reads and queries spent by reconcile() in this process
+        self.reads = 0
+        self.queries = 0
+
+    @classmethod
+    def from_env(cls):
+        """Store at SCRAPER_SEEN_STORE; None when it is set to '' (duplicate checks query Firestore)"""
+        path = os.getenv('SCRAPER_SEEN_STORE', DEFAULT_DB_PATH)
+        if not path:
+            return None
+
+        return cls(path, window_days=float(os.getenv('SCRAPER_SEEN_STORE_DAYS', '7')))
+
+    @staticmethod
+    def key(signature):
+        title, type_ = signature
+        return hashlib.sha256(f"{title}\0{type_}".encode('utf-8')).digest()
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(self.db_path)
+            self._db.execute("CREATE TABLE IF NOT EXISTS seen (key BLOB PRIMARY KEY, created_at REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS seen_created_at ON seen (created_at)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value REAL NOT NULL)")
+        return self._db
+
+    @property
+    def reconciled_at(self):
+        """When reconcile() last rebuilt the store (epoch seconds), or None"""
+        row = self._connect().execute("SELECT value FROM meta WHERE name = 'reconciled_at'").fetchone()
+        return row[0] if row else None
+
+    def open(self, firestore_db, now):
+        """The store, ready for this save's checks; reconciled first if it is cold"""
+        reconciled_at = self.reconciled_at
+        if reconciled_at is None or now.timestamp() - reconciled_at > self.window:
+            self.reconcile(firestore_db, now)
+        return self
+
+    def reconcile(self, firestore_db, now, collection='resources', page_size=SCAN_PAGE_SIZE):
+        """Replace the store's contents with the resources Firestore has from the last window, paging by created_at"""
+        query = firestore_db.collection(collection).where(
+            'metadata.created_at', '>', now - timedelta(seconds=self.window)
+        ).order_by('metadata.created_at').select(['metadata.title', 'metadata.type', 'metadata.created_at'])
+
+        rows, last = {}, None
+        while True:
+            page = query.start_after(last) if last is not None else query
+            docs = list(page.limit(page_size).stream())
+            self.queries += 1
+            self.reads += max(1, len(docs))
+            for doc in docs:
+                metadata = doc.to_dict().get('metadata', {})
+                created = metadata.get('created_at')
+                created = created.timestamp() if hasattr(created, 'timestamp') else now.timestamp()
+                key = self.key((metadata.get('title'), metadata.get('type')))
+                rows[key] = max(created, rows.get(key, created))
+            if len(docs) < page_size:
+                break
+            last = docs[-1]
+
+        db = self._connect()
+        with db:
+            db.execute("DELETE FROM seen")
+            db.executemany("INSERT INTO seen (key, created_at) VALUES (?, ?)", rows.items())
+            db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('reconciled_at', ?)", (now.timestamp(),))
+        return len(rows)
+
+    def __contains__(self, signature):
+        key = self.key(signature)
+        if key in self._pending:
+            return True
+        row = self._connect().execute(
+            "SELECT 1 FROM seen WHERE key = ? AND created_at > ?", (key, time.time() - self.window)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self):
+        count = self._connect().execute(
+            "SELECT COUNT(*) FROM seen WHERE created_at > ?", (time.time() - self.window,)
+        ).fetchone()[0]
+        return count + len(self._pending)
+
+    def add(self, signature, created_at=None):
+        self._pending[self.key(signature)] = (created_at or datetime.now()).timestamp()
+
+    def discard(self, signature):
+        """Forget a signature added in this run whose resource was not written after all"""
+        self._pending.pop(self.key(signature), None)
+
+    def save(self):
+        """Write this run's signatures and drop the ones older than the window"""
+        db = self._connect()
+        with db:
+            db.executemany("INSERT OR REPLACE INTO seen (key, created_at) VALUES (?, ?)", self._pending.items())
+            db.execute("DELETE FROM seen WHERE created_at <= ?", (time.time() - self.window,))
+        self._pending = {}
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def report(self):
+        """Firestore reads this process spent on duplicate checks"""
+        if not self.queries:
+            return "0 Firestore reads (local seen-items store)"
+        queries = f"{self.queries} {'query' if self.queries == 1 else 'queries'}"
+        return f"{self.reads} Firestore reads in {queries} (rebuilt the local seen-items store)"
+
+
+def main():
+    from auto_scraper import FreezyAutomationEngine
+
+    store = SeenStore.from_env()
+    if store is None:
+        print("ℹ️  SCRAPER_SEEN_STORE is empty, there is no seen-items store to rebuild")
+        return
+
+    print("🔄 Rebuilding the seen-items store from Firestore...")
+    count = store.reconcile(FreezyAutomationEngine().db, datetime.now())
+    store.close()
+    print(f"✅ {count} recent resources in {store.db_path} ({store.report()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Freezy Platform - Job source registry
+Every job source as data: where to fetch it, how to find postings in the
+response and how to map them onto a resource. extraction.py runs them.
+
+Formats:
+  html    cards (tag, attrs) on the page at url; fields use 'select'
+  json    array at url, optionally sliced by window; fields use 'path'
+  rss     RSS / Atom feed at url; fields use 'path' on the item dicts
+  api     JSON API request (see below); fields use 'path'
+  static  inline sample items; fields use 'path'
+
+Besides 'fields', a source may set timeout, headers (HTML boards default
+to browser headers and honour robots.txt), limit (cards / feed items) and
+window (start, stop) into the JSON array.
+
+html and json sources can be paginated with 'pages' (see
+pagination.Pagination: param, start, step, max_pages, concurrency,
+max_items, cursor), and 'posted' is a field giving each posting's date
+so paging stops where the last run left off. Only give 'posted' to
+sources whose requests ask for newest-first order: paging stops at the
+first posting older than the last run.
+
+api sources (api_request.ApiRequest) describe a request: url, params,
+headers and body (JSON, with method 'POST') are templates over {page},
+{cursor}, {page_size} and the environment variables named in auth
+(required; the source is skipped without them) and auth_optional.
+page_size is the largest page the API serves, and a shorter page is the
+last one. results is the path to the postings in the response.
+
+Field names are ResourceRecord fields (resource_record.py). A field is
+either a literal value or a dict:
+  path      dotted key path into the item ('a.b.0.c')
+  select    [(tag or None, attrs), ...] alternatives, first match wins
+  attr      take this attribute of the selected element instead of its text
+  default   value when the path / selector finds nothing
+  required  skip the item when nothing is found
+  join      join a list value with this separator
+  before    text before the first occurrence of this separator (else default)
+  after     text after the first occurrence of this separator (else unchanged)
+  base      resolve the value as a URL relative to this one
+  clean     run the value through clean_html_content
+  template  str.format() over the other fields and this field's 'values'
+            (default when one of the 'values' finds nothing)
+"""
+
+# RemoteOK serves one large JSON array (a metadata row, then postings). The
+# RemoteOK sources each take a window of it, so a single streamed read of
+# the first REMOTEOK_ITEMS entries serves all of them.
+REMOTEOK_API_URL = "https://remoteok.io/api"
+REMOTEOK_ITEMS = 21
+
+SAMPLE_FIELDS = {
+    'title': {'path': 'title'},
+    'description': {'path': 'description', 'clean': True},
+    'location': {'path': 'location'},
+    'company': {'path': 'company'},
+}
+
+
+PAKISTAN_SOURCES = [
+    {
+        'name': 'Rozee.pk',
+        'format': 'html',
+        'url': 'https://www.rozee.pk/jobs',
+        'timeout': 10,
+        # Adjust selectors based on actual site structure
+        'cards': ('div', {'class': 'job-listing'}),
+        'limit': 10,
+        'fields': {
+            'title': {'select': [('h3', {}), ('a', {'class': 'job-title'})], 'required': True},
+            'description': "Job opportunity in Pakistan. Apply now for this position.",
+            'location': {'select': [(None, {'class': 'location'}), ('span', {'class': 'job-location'})], 'default': 'Pakistan'},
+            'company': {'select': [(None, {'class': 'company-name'}), ('span', {'class': 'company'})], 'default': 'Company in Pakistan'},
+            # Each posting's own page, so postings that share a title stay apart
+            'source_url': {'select': [('a', {'class': 'job-title'}), ('a', {'href': True})], 'attr': 'href',
+                           'base': 'https://www.rozee.pk/jobs', 'default': 'https://www.rozee.pk/jobs'},
+            'requirements': 'Experience required, Good communication skills, Relevant education',
+            'benefits': 'Competitive salary, Health insurance, Career growth opportunities',
+            'created_by': 'auto_scraper_rozee',
+            'scraped_from': 'rozee.pk',
+            'location_type': 'Pakistan',
+        },
+    },
+    {
+        'name': 'BrightSpyre',
+        'format': 'static',
+        'items': [
+            {'title': 'Senior Software Engineer', 'company': 'Pakistani Tech Company', 'location': 'Karachi, Pakistan',
+             'description': 'Senior software engineering role in growing Pakistani tech company'},
+            {'title': 'Product Manager', 'company': 'Fintech Startup', 'location': 'Lahore, Pakistan',
+             'description': 'Product management role in Pakistani fintech sector'},
+        ],
+        'fields': {
+            **SAMPLE_FIELDS,
+            'source_url': 'https://brightspyre.com',
+            'requirements': 'Local experience preferred, English proficiency',
+            'benefits': 'Competitive salary in PKR, Local team, Career growth',
+            'created_by': 'auto_scraper_brightspyre',
+            'scraped_from': 'brightspyre.com',
+            'location_type': 'Onsite',
+        },
+    },
+    {
+        'name': 'Jobs.pk',
+        'format': 'static',
+        'items': [
+            {'title': 'Digital Marketing Specialist', 'company': 'Marketing Agency', 'location': 'Islamabad, Pakistan',
+             'description': 'Digital marketing role with local and international clients'},
+            {'title': 'Business Development Manager', 'company': 'Trading Company', 'location': 'Faisalabad, Pakistan',
+             'description': 'Business development in Pakistani market'},
+        ],
+        'fields': {
+            **SAMPLE_FIELDS,
+            'source_url': 'https://jobs.pk',
+            'requirements': 'Pakistani market knowledge, Local language skills',
+            'benefits': 'Local employment, Market-rate salary, Team environment',
+            'created_by': 'auto_scraper_jobs_pk',
+            'scraped_from': 'jobs.pk',
+            'location_type': 'Onsite',
+        },
+    },
+    {
+        'name': 'Indeed Pakistan',
+        'format': 'static',
+        'items': [
+            {'title': 'Customer Service Representative', 'company': 'Call Center', 'location': 'Karachi, Pakistan',
+             'description': 'Customer service role with international clients'},
+            {'title': 'Graphic Designer', 'company': 'Design Studio', 'location': 'Lahore, Pakistan',
+             'description': 'Creative design role for local and international projects'},
+        ],
+        'fields': {
+            **SAMPLE_FIELDS,
+            'source_url': 'https://pk.indeed.com',
+            'requirements': 'Relevant experience, Communication skills',
+            'benefits': 'Stable employment, Professional development, Local team',
+            'created_by': 'auto_scraper_indeed_pk',
+            'scraped_from': 'pk.indeed.com',
+            'location_type': 'Onsite',
+        },
+    },
+    {
+        'name': 'Careerjet Pakistan',
+        'format': 'static',
+        'items': [
+            {'title': 'Sales Executive', 'company': 'FMCG Company', 'location': 'Multiple Cities, Pakistan',
+             'description': 'Sales role across Pakistani markets'},
+            {'title': 'HR Manager', 'company': 'Manufacturing Company', 'location': 'Sialkot, Pakistan',
+             'description': 'Human resources management in manufacturing sector'},
+        ],
+        'fields': {
+            **SAMPLE_FIELDS,
+            'source_url': 'https://www.careerjet.com.pk',
+            'requirements': 'Local market knowledge, Professional experience',
+            'benefits': 'Career advancement, Local employment, Competitive package',
+            'created_by': 'auto_scraper_careerjet_pk',
+            'scraped_from': 'careerjet.com.pk',
+            'location_type': 'Onsite',
+        },
+    },
+    {
+        'name': 'Jooble Pakistan',
+        'format': 'static',
+        'items': [
+            {'title': 'Accountant', 'company': 'Accounting Firm', 'location': 'Rawalpindi, Pakistan',
+             'description': 'Accounting role with local and international clients'},
+            {'title': 'Teacher', 'company': 'Educational Institute', 'location': 'Multan, Pakistan',
+             'description': 'Teaching position in growing educational sector'},
+        ],
+        'fields': {
+            **SAMPLE_FIELDS,
+            'source_url': 'https://pk.jooble.org',
+            'requirements': 'Professional qualifications, Local experience',
+            'benefits': 'Stable career, Professional growth, Local community',
+            'created_by': 'auto_scraper_jooble_pk',
+            'scraped_from': 'pk.jooble.org',
+            'location_type': 'Onsite',
+        },
+    },
+    {
+        'name': 'RemoteOK Pakistan Filter',
+        'format': 'json',
+        'url': REMOTEOK_API_URL,
+        'read_items': REMOTEOK_ITEMS,
+        'timeout': 10,
+        'window': (1, 11),  # Skip first item (metadata), get 10 jobs
+        'fields': {
+            'title': {'path': 'position', 'default': 'Remote Job', 'required': True},
+            'description': {'path': 'description', 'default': 'Remote job opportunity - work from Pakistan', 'clean': True},
+            'location': 'Remote (Pakistan Friendly)',
+            'company': {'path': 'company', 'default': 'Remote Company'},
+            'source_url': {'path': 'url', 'default': 'https://remoteok.io'},
+            'requirements': {'path': 'tags', 'default': ['Remote work', 'English'], 'join': ', '},
+            'benefits': 'Remote work, Flexible hours, Global team, USD salary',
+            'created_by': 'auto_scraper_remoteok',
+            'scraped_from': 'remoteok.io',
+            'location_type': 'Pakistan',
+        },
+    },
+]
+
+
+WORLDWIDE_SOURCES = [
+    {
+        'name': 'RemoteOK API',
+        'format': 'json',
+        'url': REMOTEOK_API_URL,
+        'read_items': REMOTEOK_ITEMS,
+        'headers': {'Accept': 'application/json'},
+        'timeout': 15,
+        'window': (1, 16),  # Skip metadata, get 15 jobs
+        'fields': {
+            'title': {'path': 'position', 'default': 'Remote Position', 'required': True},
+            'description': {'path': 'description', 'default': 'Remote job opportunity', 'clean': True},
+            'location': 'Remote/Worldwide',
+            'company': {'path': 'company', 'default': 'Remote Company'},
+            'source_url': {'path': 'url', 'default': 'https://remoteok.io'},
+            'requirements': {'path': 'tags', 'default': ['Remote work'], 'join': ', '},
+            'benefits': 'Remote work, Flexible hours, Global team',
+            'created_by': 'auto_scraper_remoteok_api',
+            'scraped_from': 'remoteok.io',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'We Work Remotely RSS',
+        'format': 'rss',
+        'url': 'https://weworkremotely.com/remote-jobs.rss',
+        'timeout': 15,
+        'limit': 10,
+        'fields': {
+            # Titles are usually "Company: Job Title"
+            'title': {'path': 'title', 'default': 'Remote Job', 'after': ':'},
+            'description': {'path': 'description', 'default': 'Remote opportunity', 'clean': True},
+            'location': 'Remote/Worldwide',
+            'company': {'path': 'title', 'default': 'Remote Company', 'before': ':'},
+            'source_url': {'path': 'link', 'default': 'https://weworkremotely.com'},
+            'requirements': 'Remote work experience, Strong communication',
+            'benefits': 'Remote work, Flexible schedule, Global team',
+            'created_by': 'auto_scraper_weworkremotely',
+            'scraped_from': 'weworkremotely.com',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'Adzuna API',
+        'format': 'api',
+        # The page number is part of the path; results_per_page tops out at 50
+        'url': 'https://api.adzuna.com/v1/api/jobs/gb/search/{page}',
+        'auth': ('ADZUNA_APP_ID', 'ADZUNA_API_KEY'),
+        'params': {'app_id': '{ADZUNA_APP_ID}', 'app_key': '{ADZUNA_API_KEY}', 'what': 'remote',
+                   'results_per_page': '{page_size}', 'sort_by': 'date'},
+        'page_size': 50,
+        'results': 'results',
+        'pages': {'max_pages': 2, 'concurrency': 2},
+        'posted': {'path': 'created'},
+        'fields': {
+            'title': {'path': 'title', 'clean': True, 'required': True},
+            'description': {'path': 'description', 'clean': True, 'default': 'Remote job opportunity'},
+            'location': {'path': 'location.display_name', 'default': 'Remote/UK'},
+            'company': {'path': 'company.display_name', 'default': 'Company'},
+            'source_url': {'path': 'redirect_url', 'default': 'https://www.adzuna.com'},
+            'requirements': 'Relevant experience, Remote work capability',
+            'benefits': 'Competitive salary, Remote work, Professional development',
+            'created_by': 'auto_scraper_adzuna',
+            'scraped_from': 'adzuna.com',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'Careerjet API',
+        'format': 'api',
+        'url': 'http://public.api.careerjet.net/search',
+        'auth': ('CAREERJET_AFFILIATE_ID',),
+        'params': {'affid': '{CAREERJET_AFFILIATE_ID}', 'keywords': 'remote', 'locale_code': 'en_GB', 'sort': 'date',
+                   'pagesize': '{page_size}', 'page': '{page}',
+                   'user_ip': '127.0.0.1', 'user_agent': 'Mozilla/5.0 (compatible; FreezyPlatform/1.0)'},
+        'page_size': 99,
+        'results': 'jobs',
+        'pages': {'max_pages': 1},
+        'posted': {'path': 'date'},
+        'fields': {
+            'title': {'path': 'title', 'required': True},
+            'description': {'path': 'description', 'clean': True, 'default': 'Remote job opportunity'},
+            'location': {'path': 'locations', 'default': 'Remote/Worldwide'},
+            'company': {'path': 'company', 'default': 'Company'},
+            'source_url': {'path': 'url', 'default': 'https://www.careerjet.com'},
+            'requirements': 'Professional experience, English proficiency',
+            'benefits': 'Remote work, International team, Growth opportunities',
+            'created_by': 'auto_scraper_careerjet',
+            'scraped_from': 'careerjet.com',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'USAJOBS API',
+        'format': 'api',
+        'url': 'https://data.usajobs.gov/api/search',
+        # USAJOBS wants the key and the registered e-mail address as headers
+        'auth': ('USAJOBS_API_KEY', 'USAJOBS_EMAIL'),
+        'headers': {'Authorization-Key': '{USAJOBS_API_KEY}', 'User-Agent': '{USAJOBS_EMAIL}'},
+        'params': {'RemoteIndicator': 'True', 'SortField': 'opendate', 'SortDirection': 'Desc',
+                   'ResultsPerPage': '{page_size}', 'Page': '{page}'},
+        'page_size': 500,
+        'results': 'SearchResult.SearchResultItems',
+        'pages': {'max_pages': 1, 'max_items': 100},
+        'posted': {'path': 'MatchedObjectDescriptor.PublicationStartDate'},
+        'fields': {
+            'title': {'path': 'MatchedObjectDescriptor.PositionTitle', 'required': True},
+            'description': {'path': 'MatchedObjectDescriptor.UserArea.Details.JobSummary', 'clean': True,
+                            'default': 'Federal position with remote work options'},
+            'location': {'path': 'MatchedObjectDescriptor.PositionLocationDisplay', 'default': 'Remote/USA'},
+            'company': {'path': 'MatchedObjectDescriptor.OrganizationName', 'default': 'US Government'},
+            'source_url': {'path': 'MatchedObjectDescriptor.PositionURI', 'default': 'https://www.usajobs.gov'},
+            'requirements': 'US citizenship, Security clearance eligible',
+            'benefits': 'Federal benefits, Job security, Remote work options',
+            'created_by': 'auto_scraper_usajobs',
+            'scraped_from': 'usajobs.gov',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'Jooble API',
+        'format': 'api',
+        # Jooble takes the key in the path and the search as a POSTed JSON body
+        'url': 'https://jooble.org/api/{JOOBLE_API_KEY}',
+        'method': 'POST',
+        'auth': ('JOOBLE_API_KEY',),
+        'body': {'keywords': 'remote', 'location': '', 'page': '{page}', 'ResultOnPage': '{page_size}'},
+        'page_size': 100,
+        'results': 'jobs',
+        'pages': {'max_pages': 1},
+        'fields': {
+            'title': {'path': 'title', 'clean': True, 'required': True},
+            'description': {'path': 'snippet', 'clean': True, 'default': 'Remote job opportunity'},
+            'location': {'path': 'location', 'default': 'Remote/Global'},
+            'company': {'path': 'company', 'default': 'Company'},
+            'source_url': {'path': 'link', 'default': 'https://jooble.org'},
+            'requirements': 'Portfolio required, Remote work experience',
+            'benefits': 'Flexible hours, International projects, Competitive pay',
+            'created_by': 'auto_scraper_jooble',
+            'scraped_from': 'jooble.org',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'ZipRecruiter API',
+        'format': 'api',
+        'url': 'https://api.ziprecruiter.com/jobs/v1',
+        'auth': ('ZIPRECRUITER_API_KEY',),
+        'params': {'api_key': '{ZIPRECRUITER_API_KEY}', 'search': 'remote', 'days_ago': '1',
+                   'jobs_per_page': '{page_size}', 'page': '{page}'},
+        'page_size': 500,
+        'results': 'jobs',
+        'pages': {'max_pages': 1, 'max_items': 100},
+        'fields': {
+            'title': {'path': 'name', 'required': True},
+            'description': {'path': 'snippet', 'clean': True, 'default': 'Remote job opportunity'},
+            'location': {'path': 'location', 'default': 'Remote/USA'},
+            'company': {'path': 'hiring_company.name', 'default': 'Company'},
+            'source_url': {'path': 'url', 'default': 'https://www.ziprecruiter.com'},
+            'requirements': 'Relevant experience, Strong communication skills',
+            'benefits': 'Competitive salary, Equity options, Remote work',
+            'created_by': 'auto_scraper_ziprecruiter',
+            'scraped_from': 'ziprecruiter.com',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'The Muse API',
+        'format': 'api',
+        # Works without a key (at a lower rate limit); pages are 0-based and fixed at 20 jobs
+        'url': 'https://www.themuse.com/api/public/jobs',
+        'auth_optional': ('THEMUSE_API_KEY',),
+        'params': {'api_key': '{THEMUSE_API_KEY}', 'location': 'Flexible / Remote', 'page': '{page}'},
+        'page_size': 20,
+        'results': 'results',
+        'pages': {'start': 0, 'max_pages': 3, 'concurrency': 3},
+        'fields': {
+            'title': {'path': 'name', 'required': True},
+            'description': {'path': 'contents', 'clean': True, 'default': 'Remote job opportunity'},
+            'location': {'path': 'locations.0.name', 'default': 'Remote/Global'},
+            'company': {'path': 'company.name', 'default': 'Company'},
+            'source_url': {'path': 'refs.landing_page', 'default': 'https://www.themuse.com'},
+            'requirements': 'Strategic thinking, Leadership experience',
+            'benefits': 'Great company culture, Professional development, Remote flexibility',
+            'created_by': 'auto_scraper_themuse',
+            'scraped_from': 'themuse.com',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'Indeed Scraping',
+        'format': 'html',
+        'url': 'https://www.indeed.com/jobs?q=remote&l=&remotejob=032b3046-06a3-4876-8dfd-474eb5e7ed11',
+        'timeout': 15,
+        # Indeed's structure may change
+        'cards': ('div', {'data-jk': True}),
+        # Indeed counts results, not pages: start=0, 10, 20, ...
+        'pages': {'param': 'start', 'start': 0, 'step': 10, 'max_pages': 5, 'concurrency': 2, 'max_items': 40},
+        'fields': {
+            'title': {'select': [('h2', {'class': 'jobTitle'}), ('a', {'data-jk': True})], 'default': 'Remote Position'},
+            'description': {'template': 'Remote job opportunity at {company}. Apply through Indeed for full details.'},
+            'location': {'select': [('div', {'data-testid': 'job-location'}), ('div', {'class': 'companyLocation'})], 'default': 'Remote'},
+            'company': {'select': [('span', {'class': 'companyName'}), ('a', {'data-testid': 'company-name'})], 'default': 'Company'},
+            # The posting's job key (data-jk) names its page
+            'source_url': {
+                'template': 'https://www.indeed.com/viewjob?jk={jk}',
+                'values': {'jk': {'select': [('a', {'data-jk': True})], 'attr': 'data-jk'}},
+                'default': 'https://www.indeed.com',
+            },
+            'requirements': 'Check Indeed listing for specific requirements',
+            'benefits': 'Remote work, Competitive salary, Benefits package',
+            'created_by': 'auto_scraper_indeed',
+            'scraped_from': 'indeed.com',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'LinkedIn Scraping',
+        # LinkedIn has strong anti-scraping measures; sample postings for now
+        'format': 'static',
+        'items': [
+            {'title': 'Remote Senior Developer', 'company': 'LinkedIn Company', 'location': 'Remote/Global',
+             'description': 'Senior development role with remote flexibility'},
+            {'title': 'Remote Product Designer', 'company': 'Design Studio', 'location': 'Remote/USA',
+             'description': 'Product design role for innovative products'},
+        ],
+        'fields': {
+            **SAMPLE_FIELDS,
+            'source_url': 'https://www.linkedin.com/jobs',
+            'requirements': 'Professional network, LinkedIn profile required',
+            'benefits': 'Professional networking, Career growth, Remote work',
+            'created_by': 'auto_scraper_linkedin',
+            'scraped_from': 'linkedin.com',
+            'location_type': 'Remote',
+        },
+    },
+    {
+        'name': 'Glassdoor Scraping',
+        'format': 'static',
+        'items': [
+            {'title': 'Remote Software Architect', 'company': 'Tech Corporation', 'location': 'Remote/USA',
+             'description': 'Software architecture role with excellent company culture', 'salary': '$120k - $150k'},
+            {'title': 'Remote DevOps Engineer', 'company': 'Cloud Company', 'location': 'Remote/Europe',
+             'description': 'DevOps engineering with modern cloud technologies', 'salary': '€80k - €100k'},
+        ],
+        'fields': {
+            **SAMPLE_FIELDS,
+            'source_url': 'https://www.glassdoor.com',
+            'requirements': 'Check Glassdoor for company reviews and requirements',
+            'benefits': {
+                'template': 'Salary: {salary}, Company reviews available, Remote work',
+                'values': {'salary': {'path': 'salary', 'default': 'Competitive'}},
+            },
+            'created_by': 'auto_scraper_glassdoor',
+            'scraped_from': 'glassdoor.com',
+            'location_type': 'Remote',
+        },
+    },
+]
@@ -7,7 +7,9 @@ Run this locally to test before deploying to GitHub Actions
 import sys
 import os
 import json
+import asyncio
 from datetime import datetime
+from types import SimpleNamespace
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -168,6 +170,139 @@ def test_notifications():
         print(f"❌ Notification test failed: {e}")
         return False
 
+class FakePages:
+    """Offline stand-in for the scraper's HTTP client: one JSON list per page URL"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def get(self, url, **kwargs):
+        page = int(url.rsplit('page=', 1)[1])
+        return SimpleNamespace(status_code=200, not_modified=False, url=url,
+                               json=lambda: self.pages.get(page, []))
+
+
+def test_seen_filter_paged_source():
+    """Test that a paginated source drops postings already in the seen filter (offline)"""
+    print("\n🌸 Testing seen filter on a paginated source...")
+
+    from extraction import CompiledSource, StoredJobs
+    from seen_filter import SeenFilter
+
+    spec = {
+        'name': 'Test Board', 'format': 'json', 'url': 'https://jobs.example/api',
+        'page_size': 2, 'pages': {'max_pages': 3, 'concurrency': 1},
+        'fields': {
+            'title': {'path': 'title', 'required': True},
+            'source_url': {'path': 'url'}, 'scraped_from': 'jobs.example',
+        },
+    }
+    pages = {page: [{'title': f'Engineer {page}.{index}', 'url': f'https://jobs.example/{page}/{index}'}
+                    for index in range(2)] for page in (1, 2, 3)}
+    source = CompiledSource(spec, lambda value: value)
+    http = FakePages(pages)
+
+    jobs = asyncio.run(source.scrape(http))
+    assert len(jobs) == 6, f"expected 6 jobs without the filter, got {len(jobs)}"
+
+    seen = SeenFilter(capacity=1000)
+    for job in jobs:
+        seen.add(job.document_id())
+    jobs = asyncio.run(source.scrape(http, seen=seen))
+    assert not jobs, f"stored postings came back: {[job.title for job in jobs]}"
+    # Marked as stored, so the circuit breaker does not count it as a source gone quiet
+    assert isinstance(jobs, StoredJobs), type(jobs).__name__
+    assert seen.skipped[source.name] == 2, f"read past the first page: {seen.skipped[source.name]} skipped"
+
+    print("✅ Stored postings skipped; paging stopped after the first page")
+    return True
+
+def test_near_duplicates_distinct_roles():
+    """Test that roles sharing a company's boilerplate are kept while copies of one posting are dropped (offline)"""
+    print("\n🧬 Testing near-duplicate detection...")
+
+    from near_duplicates import NearDuplicates
+    from resource_record import ResourceRecord
+
+    boilerplate = ("Acme builds payment infrastructure for merchants in forty countries. Our engineering "
+                   "team works remotely across time zones, ships small changes every day and owns services "
+                   "end to end. We offer a learning budget, flexible hours and health cover for your family.")
+    resources = [
+        ResourceRecord(title='Senior Backend Engineer', type='job', company='Acme', description=boilerplate,
+                       source_url='https://acme.example/jobs/1', scraped_from='acme.example'),
+        ResourceRecord(title='Senior Frontend Engineer', type='job', company='Acme', description=boilerplate,
+                       source_url='https://acme.example/jobs/2', scraped_from='acme.example'),
+        ResourceRecord(title='Senior Backend Engineer (Remote)', type='job', company='Acme Inc',
+                       description=boilerplate.upper() + ' Apply now.', source_url='https://board.example',
+                       scraped_from='board.example'),
+    ]
+
+    kept = NearDuplicates().dedupe(resources)
+    titles = [resource.title for resource in kept]
+    assert len(kept) == 2 and 'Senior Frontend Engineer' in titles, titles
+
+    print("✅ Distinct roles kept; the other board's copy dropped")
+    return True
+
+def test_near_duplicates_two_runs():
+    """Test that the copy near-duplicate detection dropped is not saved by the next run (offline)"""
+    print("\n🧬 Testing near-duplicate copies across two runs...")
+
+    import tempfile
+    from extraction import CompiledSource
+    from near_duplicates import NearDuplicates
+    from seen_filter import SeenFilter
+    from seen_store import SeenStore
+
+    description = ("Acme builds payment infrastructure for merchants in forty countries. Our engineering "
+                   "team works remotely across time zones, ships small changes every day and owns services "
+                   "end to end. We offer a learning budget, flexible hours and health cover for your family.")
+    postings = {
+        'acme.example': {'title': 'Senior Backend Engineer', 'company': 'Acme', 'description': description,
+                         'url': 'https://acme.example/jobs/1'},
+        'board.example': {'title': 'Senior Backend Engineer (Remote)', 'company': 'Acme',
+                          'description': description, 'url': 'https://board.example/jobs'},
+    }
+    sources = [
+        (CompiledSource({
+            'name': site, 'format': 'json', 'url': f'https://{site}/api',
+            'page_size': 10, 'pages': {'max_pages': 1, 'concurrency': 1},
+            'fields': {
+                'title': {'path': 'title', 'required': True}, 'company': {'path': 'company'},
+                'description': {'path': 'description'}, 'source_url': {'path': 'url'}, 'scraped_from': site,
+            },
+        }, lambda value: value), FakePages({1: [posting]}))
+        for site, posting in postings.items()
+    ]
+
+    with tempfile.TemporaryDirectory() as cache:
+        seen = SeenFilter(capacity=1000)
+        store = SeenStore(os.path.join(cache, 'seen_items.sqlite3'))
+
+        # Run 1: one copy is kept and stored the way save_to_firebase() leaves it
+        near_duplicates = NearDuplicates()
+        jobs = [job for source, http in sources for job in asyncio.run(source.scrape(http, seen=seen))]
+        kept = near_duplicates.dedupe(jobs)
+        assert len(kept) == 1, [job.title for job in kept]
+        for job in kept:
+            seen.add(job.document_id())
+            store.add((job.title, job.type))
+        store.save()
+        recorded = near_duplicates.record_copies(seen, store)
+        store.save()
+        assert recorded == 1, f"recorded {recorded} copies"
+
+        # Run 2: neither copy comes back, not even the one dropped in run 1
+        jobs = [job for source, http in sources for job in asyncio.run(source.scrape(http, seen=seen))]
+        assert not jobs, f"saved again: {[job.title for job in jobs]}"
+        store.close()
+        store = SeenStore(os.path.join(cache, 'seen_items.sqlite3'))
+        assert all((posting['title'], 'job') in store for posting in postings.values())
+        store.close()
+
+    print("✅ The dropped copy is recorded as seen; the next run skips it")
+    return True
+
 def run_full_test():
     """Run complete test suite"""
     print("=" * 60)
@@ -179,7 +314,10 @@ def run_full_test():
         ("Scraping Functions", test_scraping_functions),
         ("Data Structure", test_data_structure),
         ("Firebase Save (Dry Run)", lambda: test_firebase_save(dry_run=True)),
-        ("Notifications", test_notifications)
+        ("Notifications", test_notifications),
+        ("Seen Filter (Paged Source)", test_seen_filter_paged_source),
+        ("Near-Duplicates (Distinct Roles)", test_near_duplicates_distinct_roles),
+        ("Near-Duplicates (Two Runs)", test_near_duplicates_two_runs)
     ]
     
     passed = 0